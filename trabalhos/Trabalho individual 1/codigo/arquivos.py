@@ -0,0 +1,174 @@
+"""
+arquivos.py
+---------------------------------
+Entrada/saída para números grandes demais para input()/print():
+
+- lerOperando: lê um número decimal de um arquivo via mmap, convertendo os
+  dígitos direto para limbs em blocos, sem montar uma string Python com o
+  número inteiro.
+- escreverLimbs: escreve o produto em blocos de limbs formatados, sem montar
+  a string decimal completa.
+- multiplicarArquivos: junta os dois acima (modo arquivo).
+- multiplicarLote: lê um arquivo com um par "A B" por linha e multiplica os
+  pares num pool de processos; os resultados saem na ordem de entrada, com no
+  máximo uma janela de pares em memória ao mesmo tempo.
+- validarLote: confere o formato do arquivo de lote inteiro antes de
+  multiplicar (e antes de o arquivo de saída ser aberto e truncado).
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from limbs import DIGITOS_LIMB, TIPO, normalizar
+
+# Limbs convertidos/escritos por bloco (~590 KB de dígitos)
+LIMBS_POR_BLOCO = 1 << 16
+
+ESPACOS = b" \t\r\n"
+
+
+def _limbsDeBytes(dados, inicio, fim):
+    # Converte dados[inicio:fim] (só dígitos ASCII) em limbs, do fim para o início
+    limbs = array(TIPO)
+    passo = DIGITOS_LIMB * LIMBS_POR_BLOCO
+    direita = fim
+    while direita > inicio:
+        esquerda = max(inicio, direita - passo)
+        bloco = dados[esquerda:direita]
+        if not bloco.isdigit():
+            raise ValueError("O arquivo deve conter apenas um número inteiro decimal")
+        # Completa o bloco mais alto com zeros à esquerda até múltiplo de 9
+        bloco = bloco.zfill(-(-len(bloco) // DIGITOS_LIMB) * DIGITOS_LIMB)
+        limbs.extend(map(int, [bloco[i - DIGITOS_LIMB:i] for i in range(len(bloco), 0, -DIGITOS_LIMB)]))
+        direita = esquerda
+    return normalizar(limbs)
+
+
+def lerOperando(caminho):
+    # Retorna (negativo, limbs) do número guardado em "caminho"
+    with open(caminho, "rb") as f:
+        try:
+            dados = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Arquivo vazio: {caminho}") from None
+
+    with dados:
+        inicio, fim = 0, len(dados)
+        while inicio < fim and dados[inicio] in ESPACOS:
+            inicio += 1
+        while fim > inicio and dados[fim - 1] in ESPACOS:
+            fim -= 1
+
+        negativo = False
+        if inicio < fim and dados[inicio] in b"+-":
+            negativo = dados[inicio] == ord("-")
+            inicio += 1
+        if inicio == fim:
+            raise ValueError(f"Arquivo sem número: {caminho}")
+
+        return negativo, _limbsDeBytes(dados, inicio, fim)
+
+
+def escreverLimbs(limbs, saida, negativo=False):
+    # Escreve os limbs como decimal em "saida" (arquivo texto), bloco a bloco
+    n = len(limbs)
+    while n > 1 and limbs[n - 1] == 0:
+        n -= 1
+
+    topo = str(limbs[n - 1]) if n else "0"
+    if negativo and topo != "0":
+        topo = "-" + topo
+    saida.write(topo)
+
+    fim = n - 1
+    while fim > 0:
+        inicio = max(0, fim - LIMBS_POR_BLOCO)
+        saida.write("".join(["%09d" % limbs[i] for i in range(fim - 1, inicio - 1, -1)]))
+        fim = inicio
+    saida.write("\n")
+
+
+def multiplicarArquivos(caminhoA, caminhoB, saida=sys.stdout, algoritmo="auto", algoritmos=None, **opcoes):
+    # "algoritmos" permite passar a tabela de main.py já carregada (ex.: instrumentada)
+    if algoritmos is None:
+        from main import ALGORITMOS as algoritmos
+
+    negA, a = lerOperando(caminhoA)
+    negB, b = lerOperando(caminhoB)
+    produto = algoritmos[algoritmo](a, b, **opcoes)
+    escreverLimbs(produto, saida, negA != negB)
+
+
+def _separarPar(linha):
+    # "A B" -> ["A", "B"], conferindo a quantidade de valores e os dígitos
+    partes = linha.split()
+    if len(partes) != 2:
+        raise ValueError(f"Esperado 'A B' e veio {len(partes)} valor(es)")
+    for parte in partes:
+        if not parte.lstrip("+-").isdigit():
+            raise ValueError(f"Valor não é um inteiro decimal: {parte[:20]!r}")
+    return partes
+
+
+def _multiplicarLinha(linha, algoritmo):
+    # Executa no processo trabalhador
+    from main import multiplicar
+
+    A, B = _separarPar(linha)
+    return multiplicar(A, B, algoritmo)
+
+
+def _pares(entrada):
+    # Gera (número da linha, linha) ignorando linhas vazias e comentários
+    for numero, linha in enumerate(entrada, start=1):
+        linha = linha.strip()
+        if linha and not linha.startswith("#"):
+            yield numero, linha
+
+
+def validarLote(entrada):
+    # Percorre o arquivo de lote só conferindo o formato; devolve quantos pares há
+    total = 0
+    for numero, linha in _pares(entrada):
+        try:
+            _separarPar(linha)
+        except ValueError as e:
+            raise ValueError(f"Linha {numero}: {e}") from None
+        total += 1
+    return total
+
+
+def multiplicarLote(entrada, saida=sys.stdout, trabalhadores=None, janela=None, algoritmo="auto"):
+    # "entrada" é um arquivo texto aberto (um par por linha); devolve quantos pares foram processados.
+    # "algoritmo" é o do nível mais alto de cada produto (ver main.ALGORITMOS)
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    janela = janela or 4 * trabalhadores
+
+    with ProcessPoolExecutor(max_workers=trabalhadores) as pool:
+        pendentes = deque()
+        total = 0
+
+        def escreverProximo():
+            numero, futuro = pendentes.popleft()
+            try:
+                saida.write(futuro.result() + "\n")
+            except ValueError as e:
+                # Não espera o resto da janela: cancela o que ainda não começou
+                for _, f in pendentes:
+                    f.cancel()
+                raise ValueError(f"Linha {numero}: {e}") from None
+
+        for numero, linha in _pares(entrada):
+            pendentes.append((numero, pool.submit(_multiplicarLinha, linha, algoritmo)))
+            if len(pendentes) >= janela:
+                escreverProximo()
+            total += 1
+
+        while pendentes:
+            escreverProximo()
+
+    return total
@@ -0,0 +1,159 @@
+"""
+autotune.py
+---------------------------------
+Mede, na máquina atual, a partir de que tamanho cada nível do motor passa a
+ganhar do nível de baixo e grava os limiares num perfil JSON, carregado por
+motor.py na importação (ver motor.carregarPerfil).
+
+Cruzamentos medidos (tamanho em limbs de 9 dígitos):
+- nativo x Karatsuba   -> LIMIAR_KARATSUBA
+- motor x NTT          -> LIMIAR_NTT (só com NumPy)
+- Karatsuba x Toom-3   -> LIMIAR_TOOM3
+- Toom-3 x Toom-4      -> LIMIAR_TOOM4
+
+Uso:
+  python autotune.py
+  python autotune.py --saida /tmp/perfil.json --repeticoes 5
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timezone
+
+import motor
+from limbs import BASE, TIPO, multiplicarBase
+from motor import INFINITO, limiaresTemporarios
+from ntt import NTT_DISPONIVEL, multiplicarNTT
+
+
+def _operando(n, rng):
+    return array(TIPO, [rng.randrange(BASE) for _ in range(n)])
+
+
+def _tempo(f, a, b, repeticoes):
+    # Melhor de "repeticoes" execuções (o mínimo é o menos sensível a ruído)
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        f(a, b)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _tamanhos(menor, maior, fator=1.25):
+    n = menor
+    while n <= maior:
+        yield n
+        n = max(n + 1, int(n * fator))
+
+
+def cruzamento(baixo, alto, menor, maior, repeticoes, rng, log=None):
+    # Menor tamanho a partir do qual "alto" vence "baixo" em duas medições
+    # seguidas; se nunca vencer no intervalo, devolve INFINITO
+    candidato = None
+    for n in _tamanhos(menor, maior):
+        a, b = _operando(n, rng), _operando(n, rng)
+        tb, ta = _tempo(baixo, a, b, repeticoes), _tempo(alto, a, b, repeticoes)
+        if log:
+            log(f"  {n:>7} limbs: {tb * 1e3:9.3f} ms x {ta * 1e3:9.3f} ms")
+        if ta < tb:
+            if candidato is not None:
+                return candidato
+            candidato = n
+        else:
+            candidato = None
+    return candidato if candidato is not None else INFINITO
+
+
+def autotune(repeticoes=3, semente=0, log=print):
+    rng = random.Random(semente)
+    limiares = {}
+
+    # 1) nativo x Karatsuba: os filhos do Karatsuba vão para o caso base
+    log("Nativo x Karatsuba")
+    def karatsubaUmNivel(a, b):
+        with limiaresTemporarios(LIMIAR_KARATSUBA=len(a) // 2 + 4):
+            return motor.karatsuba(a, b)
+    with limiaresTemporarios(LIMIAR_NTT=INFINITO, LIMIAR_TOOM3=INFINITO, LIMIAR_TOOM4=INFINITO):
+        limiares["LIMIAR_KARATSUBA"] = cruzamento(
+            multiplicarBase, karatsubaUmNivel, 16, 4096, repeticoes, rng, log)
+    if limiares["LIMIAR_KARATSUBA"] == INFINITO:
+        limiares["LIMIAR_KARATSUBA"] = 4096
+
+    with limiaresTemporarios(LIMIAR_KARATSUBA=limiares["LIMIAR_KARATSUBA"]):
+        # 2) motor (sem NTT) x NTT
+        teto = 1 << 15
+        if NTT_DISPONIVEL:
+            log("Motor x NTT")
+            def motorSemNTT(a, b):
+                with limiaresTemporarios(LIMIAR_NTT=INFINITO):
+                    return motor.multiplicarLimbs(a, b)
+            limiares["LIMIAR_NTT"] = cruzamento(
+                motorSemNTT, multiplicarNTT, limiares["LIMIAR_KARATSUBA"], teto, repeticoes, rng, log)
+            # Os níveis Toom só valem até a NTT ganhar; basta medir até ela
+            teto = min(teto, limiares["LIMIAR_NTT"])
+
+        with limiaresTemporarios(LIMIAR_NTT=INFINITO):
+            # 3) Karatsuba x Toom-3 (filhos sem Toom)
+            log("Karatsuba x Toom-3")
+            with limiaresTemporarios(LIMIAR_TOOM3=INFINITO, LIMIAR_TOOM4=INFINITO):
+                limiares["LIMIAR_TOOM3"] = cruzamento(
+                    motor.karatsuba, motor.toom3, 2 * limiares["LIMIAR_KARATSUBA"], teto, repeticoes, rng, log)
+
+            # 4) Toom-3 x Toom-4 (filhos sem Toom-4)
+            if limiares["LIMIAR_TOOM3"] < INFINITO:
+                log("Toom-3 x Toom-4")
+                with limiaresTemporarios(LIMIAR_TOOM3=limiares["LIMIAR_TOOM3"], LIMIAR_TOOM4=INFINITO):
+                    limiares["LIMIAR_TOOM4"] = cruzamento(
+                        motor.toom3, motor.toom4, limiares["LIMIAR_TOOM3"], teto, repeticoes, rng, log)
+            else:
+                limiares["LIMIAR_TOOM4"] = INFINITO
+
+        if NTT_DISPONIVEL:
+            # Mesma regra dos padrões: a NTT é testada antes dos Toom, que só
+            # valem para produtos que não cabem nela. Um Toom que não ganhou
+            # antes da NTT fica com LIMIAR_NTT (e não INFINITO) para esses casos
+            for nome in ("LIMIAR_TOOM3", "LIMIAR_TOOM4"):
+                limiares[nome] = min(limiares[nome], limiares["LIMIAR_NTT"])
+
+    return limiares
+
+
+def salvarPerfil(limiares, caminho):
+    perfil = {
+        "limiares": limiares,
+        "maquina": platform.node(),
+        "processador": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "numpy": NTT_DISPONIVEL,
+        "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(perfil, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Autotune dos limiares do motor de multiplicação")
+    p.add_argument("--saida", "-o", default=motor.CAMINHO_PERFIL, help="arquivo do perfil (JSON)")
+    p.add_argument("--repeticoes", "-r", type=int, default=3, help="execuções por medição (usa a melhor)")
+    p.add_argument("--seed", type=int, default=0, help="seed dos operandos aleatórios")
+    args = p.parse_args()
+
+    limiares = autotune(args.repeticoes, args.seed)
+    salvarPerfil(limiares, args.saida)
+
+    print("\nLimiares escolhidos:")
+    for nome, valor in limiares.items():
+        print(f"  {nome} = {'nunca' if valor == INFINITO else valor}")
+    print(f"Perfil salvo em: {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+benchmark.py
+---------------------------------
+Benchmark reprodutível da multiplicação, no lugar da medição única com
+time.time() de main.py.
+
+Para cada algoritmo e cada tamanho de uma varredura geométrica de dígitos:
+- gera operandos aleatórios com seed fixa;
+- faz execuções de aquecimento (descartadas);
+- coleta N amostras com time.perf_counter_ns;
+- reporta mediana e percentis (p10, p90, p99).
+
+Depois ajusta, por mínimos quadrados em escala log-log, o expoente de
+crescimento de cada algoritmo (tempo ~ dígitos^k: ~2 no quadrático, ~1.58 no
+Karatsuba, ~1 na NTT), grava tudo em JSON e, se receber um baseline (JSON de
+uma execução anterior), aponta regressões acima da tolerância.
+
+Uso:
+  python benchmark.py
+  python benchmark.py --min 1000 --max 1000000 --fator 4 --amostras 7 --saida atual.json
+  python benchmark.py --baseline base.json --tolerancia 0.15
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timezone
+
+import motor
+from limbs import BASE, DIGITOS_LIMB, TIPO, normalizar, paraInteiro
+from motor import INFINITO, limiaresTemporarios
+from ntt import NTT_DISPONIVEL, multiplicarNTT
+
+
+def _karatsubaPuro(a, b):
+    # Karatsuba em todos os níveis (sem Toom/NTT), até o caso base nativo
+    with limiaresTemporarios(LIMIAR_TOOM3=INFINITO, LIMIAR_TOOM4=INFINITO, LIMIAR_NTT=INFINITO):
+        return motor.multiplicarLimbs(a, b)
+
+
+def _toom3(a, b):
+    with limiaresTemporarios(LIMIAR_TOOM4=INFINITO, LIMIAR_NTT=INFINITO):
+        return motor.toom3(a, b)
+
+
+def _toom4(a, b):
+    with limiaresTemporarios(LIMIAR_NTT=INFINITO):
+        return motor.toom4(a, b)
+
+
+# nome -> (função, usa int nativo?). As funções de limbs recebem arrays; a
+# nativa recebe int do Python já convertido (a conversão não entra no tempo).
+ALGORITMOS = {
+    "nativo": (lambda x, y: x * y, True),
+    "karatsuba": (_karatsubaPuro, False),
+    "toom3": (_toom3, False),
+    "toom4": (_toom4, False),
+    "auto": (motor.multiplicarLimbs, False),
+}
+if NTT_DISPONIVEL:
+    ALGORITMOS["ntt"] = (multiplicarNTT, False)
+
+
+def percentil(ordenadas, p):
+    # Percentil com interpolação linear (ordenadas já em ordem crescente)
+    if len(ordenadas) == 1:
+        return float(ordenadas[0])
+    pos = (len(ordenadas) - 1) * p / 100
+    i = int(pos)
+    if i + 1 >= len(ordenadas):
+        return float(ordenadas[-1])
+    return ordenadas[i] + (ordenadas[i + 1] - ordenadas[i]) * (pos - i)
+
+
+def tamanhosGeometricos(menor, maior, fator):
+    tamanhos = []
+    d = menor
+    while d <= maior:
+        tamanhos.append(int(d))
+        d *= fator
+    return tamanhos
+
+
+def operandos(digitos, semente):
+    # Operando aleatório com exatamente "digitos" dígitos (em limbs)
+    rng = random.Random(f"{semente}:{digitos}")
+    n, resto = divmod(digitos, DIGITOS_LIMB)
+    limbs = array(TIPO, [rng.randrange(BASE) for _ in range(n)])
+    if resto:
+        limbs.append(rng.randrange(10 ** (resto - 1), 10 ** resto))
+    else:
+        limbs[-1] = rng.randrange(BASE // 10, BASE)
+    return normalizar(limbs)
+
+
+def medir(funcao, x, y, amostras, aquecimento):
+    for _ in range(aquecimento):
+        funcao(x, y)
+    tempos = []
+    for _ in range(amostras):
+        inicio = time.perf_counter_ns()
+        funcao(x, y)
+        tempos.append(time.perf_counter_ns() - inicio)
+    tempos.sort()
+    return {
+        "amostras_ns": tempos,
+        "mediana_ns": percentil(tempos, 50),
+        "p10_ns": percentil(tempos, 10),
+        "p90_ns": percentil(tempos, 90),
+        "p99_ns": percentil(tempos, 99),
+    }
+
+
+def expoenteCrescimento(pontos):
+    # Inclinação da reta log(tempo) = k * log(dígitos) + c (mínimos quadrados)
+    if len(pontos) < 2:
+        return None
+    xs = [math.log(d) for d, _ in pontos]
+    ys = [math.log(t) for _, t in pontos]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def executar(algoritmos, tamanhos, amostras, aquecimento, semente, log=print):
+    resultados = []
+    for digitos in tamanhos:
+        a = operandos(digitos, semente)
+        b = operandos(digitos, semente + 1)
+        inteiros = None
+        for nome in algoritmos:
+            funcao, nativo = ALGORITMOS[nome]
+            if nativo:
+                if inteiros is None:
+                    inteiros = (paraInteiro(a), paraInteiro(b))
+                x, y = inteiros
+            else:
+                x, y = a, b
+            medida = medir(funcao, x, y, amostras, aquecimento)
+            medida.update({"algoritmo": nome, "digitos": digitos})
+            resultados.append(medida)
+            log(f"{nome:>10} {digitos:>10} dígitos  mediana {medida['mediana_ns'] / 1e6:11.3f} ms"
+                f"  p10 {medida['p10_ns'] / 1e6:11.3f}  p90 {medida['p90_ns'] / 1e6:11.3f}")
+
+    expoentes = {}
+    for nome in algoritmos:
+        pontos = [(r["digitos"], r["mediana_ns"]) for r in resultados if r["algoritmo"] == nome]
+        expoentes[nome] = expoenteCrescimento(pontos)
+    return resultados, expoentes
+
+
+def compararBaseline(resultados, baseline, tolerancia):
+    # Lista (algoritmo, dígitos, razão) das medianas acima de baseline * (1 + tolerância)
+    anteriores = {(r["algoritmo"], r["digitos"]): r["mediana_ns"] for r in baseline["resultados"]}
+    regressoes = []
+    for r in resultados:
+        anterior = anteriores.get((r["algoritmo"], r["digitos"]))
+        if anterior:
+            razao = r["mediana_ns"] / anterior
+            if razao > 1 + tolerancia:
+                regressoes.append((r["algoritmo"], r["digitos"], razao))
+    return regressoes
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark da multiplicação de inteiros grandes")
+    p.add_argument("--algoritmos", "-a", nargs="+", choices=sorted(ALGORITMOS),
+                   default=[n for n in ALGORITMOS if n not in ("toom3", "toom4")],
+                   help="algoritmos medidos")
+    p.add_argument("--min", type=int, default=1000, help="menor número de dígitos")
+    p.add_argument("--max", type=int, default=256000, help="maior número de dígitos")
+    p.add_argument("--fator", type=float, default=2.0, help="razão da varredura geométrica")
+    p.add_argument("--amostras", "-n", type=int, default=5, help="amostras por medição")
+    p.add_argument("--aquecimento", type=int, default=1, help="execuções descartadas antes das amostras")
+    p.add_argument("--seed", type=int, default=0, help="seed dos operandos")
+    p.add_argument("--saida", "-o", default="benchmark.json", help="arquivo JSON com os resultados")
+    p.add_argument("--baseline", "-b", help="JSON de uma execução anterior para comparar")
+    p.add_argument("--tolerancia", type=float, default=0.10, help="piora relativa aceita antes de acusar regressão")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.fator <= 1 or args.min <= 0 or args.amostras <= 0:
+        print("--min e --amostras devem ser positivos e --fator maior que 1")
+        return 1
+
+    tamanhos = tamanhosGeometricos(args.min, args.max, args.fator)
+    resultados, expoentes = executar(args.algoritmos, tamanhos, args.amostras, args.aquecimento, args.seed)
+
+    print("\nExpoente de crescimento ajustado (tempo ~ dígitos^k):")
+    for nome, k in expoentes.items():
+        print(f"  {nome:>10}: {'-' if k is None else f'{k:.3f}'}")
+
+    relatorio = {
+        "ambiente": {
+            "maquina": platform.node(),
+            "python": platform.python_version(),
+            "numpy": NTT_DISPONIVEL,
+            "limiares": {nome: getattr(motor, nome) for nome in motor.LIMIARES},
+            "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "config": {k: v for k, v in vars(args).items() if k not in ("saida", "baseline")},
+        "resultados": resultados,
+        "expoentes": expoentes,
+    }
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, indent=2)
+        f.write("\n")
+    print(f"Resultados salvos em: {args.saida}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressoes = compararBaseline(resultados, baseline, args.tolerancia)
+        if regressoes:
+            print(f"\nREGRESSÕES (acima de {args.tolerancia:.0%} do baseline):")
+            for nome, digitos, razao in regressoes:
+                print(f"  {nome:>10} {digitos:>10} dígitos: {razao:.2f}x")
+            return 2
+        print("\nSem regressões em relação ao baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+conversao.py
+---------------------------------
+Conversão decimal <-> int do Python sem o limite de dígitos do CPython
+(sys.get_int_max_str_digits(), 4300 por padrão no 3.11+) e sem o custo
+quadrático de int(str) / str(int).
+
+- inteiroDeString(s): string -> limbs (fatiamento linear) -> int, juntando os
+  blocos por divisão e conquista (alto * BASE^m + baixo) com potências de
+  BASE guardadas em cache (limbs.paraInteiro).
+- stringDeInteiro(v): int -> limbs -> string. O int é partido pelos bits
+  (v = alto * 2^k + baixo, só deslocamentos), cada metade é convertida
+  recursivamente e as duas são juntas com o motor: alto * 2^k em limbs sai de
+  motor.multiplicarLimbs, e as potências 2^k (k potência de 2) são obtidas
+  elevando ao quadrado a anterior com motor.quadradoLimbs. O custo fica em
+  O(M(n) log n) em vez de O(n^2).
+
+Abaixo de BITS_CONVERSAO_MOTOR bits a conversão usa limbs.deInteiro, que
+já é rápida nesse tamanho.
+"""
+
+from functools import lru_cache
+
+from limbs import deInteiro, paraInteiro, paraLimbs, paraString, somarEm
+from motor import multiplicarLimbs, quadradoLimbs
+
+# Acima desse tamanho (em bits) int -> limbs passa a usar o motor
+BITS_CONVERSAO_MOTOR = 1 << 17
+
+
+@lru_cache(maxsize=32)
+def _potenciaDois(t):
+    # 2^(2^t) em limbs; cada uma é o quadrado da anterior
+    if (1 << t) <= BITS_CONVERSAO_MOTOR:
+        return deInteiro(1 << (1 << t))
+    return quadradoLimbs(_potenciaDois(t - 1))
+
+
+def limbsDeInteiro(v):
+    # Inverso de limbs.paraInteiro para inteiros não negativos de qualquer tamanho
+    if v < 0:
+        raise ValueError("Limbs representam apenas inteiros não negativos")
+    bits = v.bit_length()
+    if bits <= BITS_CONVERSAO_MOTOR:
+        return deInteiro(v)
+
+    # k = 2^t é a maior potência de 2 menor que "bits": alto e baixo têm no máximo k bits
+    t = (bits - 1).bit_length() - 1
+    k = 1 << t
+    alto, baixo = v >> k, v & ((1 << k) - 1)
+
+    resultado = multiplicarLimbs(limbsDeInteiro(alto), _potenciaDois(t))
+    somarEm(resultado, limbsDeInteiro(baixo))
+    return resultado
+
+
+def inteiroDeString(s):
+    # Como int(s) para decimais com sinal opcional, sem limite de dígitos
+    s = s.strip()
+    negativo = s.startswith("-")
+    if s[:1] in ("+", "-"):
+        s = s[1:]
+    v = paraInteiro(paraLimbs(s))
+    return -v if negativo else v
+
+
+def stringDeInteiro(v):
+    # Como str(v), sem limite de dígitos
+    if v < 0:
+        return "-" + paraString(limbsDeInteiro(-v))
+    return paraString(limbsDeInteiro(v))
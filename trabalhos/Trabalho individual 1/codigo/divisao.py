@@ -0,0 +1,294 @@
+"""
+divisao.py
+---------------------------------
+Divisão e redução modular subquadráticas sobre o motor de limbs.
+
+- reciproco(b): mu = floor(BASE^(2n) / b) por iteração de Newton, dobrando a
+  precisão a cada nível; cada nível custa algumas multiplicações do motor,
+  então o total fica num fator constante de M(n) (custo de uma multiplicação).
+- Barrett: com mu pronto, x mod b (para x < BASE^(2n)) sai com duas
+  multiplicações e no máximo duas subtrações de correção.
+- dividirLimbs(a, b): quociente e resto para a de qualquer tamanho, reduzindo
+  a em blocos de n limbs do mais alto para o mais baixo.
+- Modulo: guarda o módulo e o seu recíproco para modmul/modpow; contextos
+  recentes ficam num cache, então chamadas repetidas com o mesmo módulo não
+  recalculam o recíproco.
+
+Divisores pequenos (menos de LIMIAR_NEWTON limbs) usam a divisão nativa do
+Python em blocos, que nesse tamanho é mais rápida.
+"""
+
+import random
+from array import array
+from collections import OrderedDict
+
+from conversao import inteiroDeString, stringDeInteiro
+from limbs import (
+    BASE,
+    TIPO,
+    comparar,
+    deInteiro,
+    ehZero,
+    normalizar,
+    paraInteiro,
+    paraLimbs,
+    paraString,
+    somar,
+    somarEm,
+    subtrair,
+    subtrairEm,
+    zeros,
+)
+from motor import multiplicarLimbs, quadradoLimbs
+from potencia import potenciaJanela
+
+# Abaixo desse tamanho do divisor (em limbs) a divisão nativa do Python ganha
+LIMIAR_NEWTON = 64
+
+# Quantos contextos modulares (módulo + recíproco) ficam guardados
+MAX_CONTEXTOS = 32
+
+
+def _potenciaBase(k):
+    # BASE^k em limbs
+    p = zeros(k)
+    p.append(1)
+    return p
+
+
+def _deslocarDireita(a, k):
+    # floor(a / BASE^k)
+    if k >= len(a):
+        return deInteiro(0)
+    return normalizar(a[k:])
+
+
+def _um():
+    return array(TIPO, [1])
+
+
+def reciproco(b):
+    # mu = floor(BASE^(2n) / b) para b com n limbs (limb do topo não nulo)
+    b = normalizar(array(TIPO, b))
+    n = len(b)
+    # (o mínimo de 8 limbs garante que a metade com guarda, h, seja menor que n)
+    if n <= max(LIMIAR_NEWTON, 8):
+        return deInteiro(BASE ** (2 * n) // paraInteiro(b))
+
+    # Recíproco dos h limbs mais altos (com 2 limbs de guarda) e escala para n
+    h = (n + 1) // 2 + 2
+    mu = reciproco(b[n - h:])
+    x = zeros(n - h)
+    x.extend(mu)
+    x = normalizar(x)
+
+    # Um passo de Newton: x <- x + x * (BASE^(2n) - b * x) / BASE^(2n)
+    alvo = _potenciaBase(2 * n)
+    bx = multiplicarLimbs(b, x)
+    if comparar(bx, alvo) <= 0:
+        erro = subtrair(alvo, bx)
+        x = somar(x, _deslocarDireita(multiplicarLimbs(x, erro), 2 * n))
+    else:
+        erro = subtrair(bx, alvo)
+        delta = somar(_deslocarDireita(multiplicarLimbs(x, erro), 2 * n), _um())
+        x = subtrair(x, delta) if comparar(x, delta) > 0 else deInteiro(0)
+    x = normalizar(x)
+
+    # Correção final: o erro depois do passo é de poucas unidades
+    bx = multiplicarLimbs(b, x)
+    while comparar(bx, alvo) > 0:
+        subtrairEm(x, _um())
+        subtrairEm(bx, b)
+    resto = subtrair(alvo, bx)
+    while comparar(resto, b) >= 0:
+        somarEm(x, _um())
+        subtrairEm(resto, b)
+    return normalizar(x)
+
+
+def _barrett(x, b, mu, n):
+    # (floor(x / b), x mod b) para 0 <= x < BASE^(2n)
+    q = _deslocarDireita(multiplicarLimbs(_deslocarDireita(x, n - 1), mu), n + 1)
+    r = subtrair(x, multiplicarLimbs(q, b))
+    while comparar(r, b) >= 0:
+        subtrairEm(r, b)
+        somarEm(q, _um())
+    # r = 0 pode sobrar com vários limbs zero: normaliza para os testes de zero
+    return normalizar(q), normalizar(r)
+
+
+def _dividirNativo(a, b):
+    # Divisor pequeno: divmod do Python em blocos de limbs, do topo para a base
+    d = paraInteiro(b)
+    bloco = max(len(b), 256)
+    q = zeros(len(a) + 1)
+    r = 0
+    topo = len(a)
+    while topo > 0:
+        base = max(0, topo - bloco)
+        atual = r * BASE ** (topo - base) + paraInteiro(a[base:topo])
+        qb, r = divmod(atual, d)
+        qlimbs = deInteiro(qb)
+        q[base:base + len(qlimbs)] = qlimbs
+        topo = base
+    return normalizar(q), deInteiro(r)
+
+
+def dividirLimbs(a, b, mu=None):
+    # (quociente, resto) de a por b; mu = reciproco(b) pode ser reaproveitado
+    b = normalizar(array(TIPO, b))
+    if len(b) == 1 and b[0] == 0:
+        raise ZeroDivisionError("Divisão por zero")
+    if comparar(a, b) < 0:
+        return deInteiro(0), normalizar(array(TIPO, a))
+
+    n = len(b)
+    if n < LIMIAR_NEWTON:
+        return _dividirNativo(a, b)
+    if mu is None:
+        mu = reciproco(b)
+
+    # Blocos de n limbs do topo para a base: r * BASE^n + bloco < b * BASE^n
+    q = zeros(len(a) + 1)
+    r = deInteiro(0)
+    topo = len(a)
+    while topo > 0:
+        base = max(0, topo - n)
+        atual = a[base:topo]
+        atual.extend(r)
+        qb, r = _barrett(normalizar(atual), b, mu, n)
+        q[base:base + len(qb)] = qb
+        topo = base
+    return normalizar(q), r
+
+
+class Modulo:
+    """
+    Contexto de aritmética modular: guarda m e mu = floor(BASE^(2n) / m) para
+    reduzir produtos com Barrett sem refazer o recíproco a cada chamada.
+    """
+
+    def __init__(self, m):
+        self.m = normalizar(array(TIPO, m))
+        if len(self.m) == 1 and self.m[0] == 0:
+            raise ZeroDivisionError("Módulo zero")
+        self.n = len(self.m)
+        self.mu = reciproco(self.m) if self.n >= LIMIAR_NEWTON else None
+
+    def reduzir(self, x):
+        # x mod m para x de qualquer tamanho
+        if comparar(x, self.m) < 0:
+            return x
+        if self.mu is not None and len(x) <= 2 * self.n:
+            return _barrett(x, self.m, self.mu, self.n)[1]
+        return dividirLimbs(x, self.m, self.mu)[1]
+
+    def mul(self, a, b):
+        return self.reduzir(multiplicarLimbs(a, b))
+
+    def quadrado(self, a):
+        return self.reduzir(quadradoLimbs(a))
+
+    def pow(self, a, e):
+        if e < 0:
+            raise ValueError("O expoente deve ser não negativo")
+        a = self.reduzir(a)
+        resultado = potenciaJanela(a, e, quadrado=self.quadrado, multiplicar=self.mul)
+        return self.reduzir(resultado)
+
+
+_contextos = OrderedDict()
+
+
+def contextoModular(m):
+    # Contexto (com recíproco) do módulo m, reaproveitado entre chamadas
+    chave = normalizar(array(TIPO, m)).tobytes()
+    ctx = _contextos.get(chave)
+    if ctx is None:
+        ctx = Modulo(m)
+        _contextos[chave] = ctx
+        if len(_contextos) > MAX_CONTEXTOS:
+            _contextos.popitem(last=False)
+    else:
+        _contextos.move_to_end(chave)
+    return ctx
+
+
+def _separarSinal(A):
+    A = A.strip()
+    return A.startswith("-"), paraLimbs(A.lstrip("+-"))
+
+
+def divmodStrings(A, B):
+    # Como divmod() do Python: quociente arredondado para baixo e resto com o sinal de B
+    negA, a = _separarSinal(A)
+    negB, b = _separarSinal(B)
+    q, r = dividirLimbs(a, b)
+
+    if negA != negB and not ehZero(r):
+        somarEm(q, _um())
+        r = subtrair(b, r)
+    q, r = paraString(q), paraString(r)
+    if negA != negB and q != "0":
+        q = "-" + q
+    if negB and r != "0":
+        r = "-" + r
+    return q, r
+
+
+def quociente(A, B):
+    return divmodStrings(A, B)[0]
+
+
+def resto(A, B):
+    return divmodStrings(A, B)[1]
+
+
+def _residuo(A, ctx):
+    # A mod m (A pode ser negativo)
+    negativo, a = _separarSinal(A)
+    r = ctx.reduzir(a)
+    if negativo and not ehZero(r):
+        r = subtrair(ctx.m, r)
+    return r
+
+
+def modmul(A, B, M):
+    # (A * B) mod M, com M > 0
+    ctx = contextoModular(paraLimbs(M))
+    return paraString(ctx.mul(_residuo(A, ctx), _residuo(B, ctx)))
+
+
+def modpow(A, E, M):
+    # A^E mod M, com E inteiro (ou string decimal) não negativo e M > 0
+    ctx = contextoModular(paraLimbs(M))
+    if isinstance(E, str):
+        E = inteiroDeString(E)
+    return paraString(ctx.pow(_residuo(A, ctx), E))
+
+
+def verificarDivisao(casos=40, maxLimbs=400, semente=None):
+    # Compara divmodStrings e modmul com divmod/% do Python, incluindo divisões
+    # exatas com sinais trocados e divisores acima de LIMIAR_NEWTON (Barrett)
+    rng = random.Random(semente)
+    for caso in range(casos):
+        nb = rng.randint(LIMIAR_NEWTON, maxLimbs) if caso % 2 else rng.randint(1, LIMIAR_NEWTON)
+        b = rng.randrange(BASE ** (nb - 1), BASE ** nb)
+        a = rng.randrange(BASE ** rng.randint(1, 2 * maxLimbs))
+        if caso % 3 == 0:
+            a = b * rng.randrange(1, BASE ** rng.randint(1, maxLimbs))  # divisão exata
+        a, b = a * rng.choice((1, -1)), b * rng.choice((1, -1))
+        if divmodStrings(stringDeInteiro(a), stringDeInteiro(b)) != tuple(map(stringDeInteiro, divmod(a, b))):
+            raise AssertionError(f"divmodStrings divergiu de divmod no caso {caso} ({nb} limbs no divisor)")
+        if modmul(stringDeInteiro(a), "1", stringDeInteiro(abs(b))) != stringDeInteiro(a % abs(b)):
+            raise AssertionError(f"modmul divergiu de % no caso {caso} ({nb} limbs no módulo)")
+
+    # Casos de borda: x = 999...9 com divisor 10^k + 1 (resto zero pelo Barrett)
+    for A, B in (("9" * 2000, "-1" + "0" * 999 + "1"), ("-" + "9" * 2000, "1" + "0" * 999 + "1")):
+        if divmodStrings(A, B) != tuple(map(stringDeInteiro, divmod(inteiroDeString(A), inteiroDeString(B)))):
+            raise AssertionError(f"divmodStrings divergiu de divmod em {A[:10]}... / {B[:10]}...")
+    return casos
+
+
+if __name__ == "__main__":
+    print(f"Divisão conferida contra divmod em {verificarDivisao()} casos aleatórios")
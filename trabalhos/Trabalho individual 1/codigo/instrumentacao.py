@@ -0,0 +1,234 @@
+"""
+instrumentacao.py
+---------------------------------
+Medição em tempo de execução do que os comentários "# +1" de main.py só
+anotam: onde, em cada nível da recursão, uma multiplicação grande gasta o
+seu tempo.
+
+Com instrumentar() ativo, as funções do motor (motor.py) são trocadas por
+versões que registram, por profundidade da recursão:
+- chamadas (entradas em multiplicarLimbs/quadradoLimbs) e o algoritmo escolhido;
+- casos base (multiplicação/quadrado nativos);
+- dígitos processados em somas e subtrações;
+- bytes dos arrays alocados (zeros, somas, combinações do Toom, produtos);
+- tempo próprio (sem contar os filhos) em nanossegundos.
+
+Fora do bloco "with" o motor fica com as funções originais, então a
+instrumentação não custa nada quando desligada. Ela só enxerga o processo
+atual: no modo paralelo, o que roda nos processos trabalhadores não aparece.
+
+O resultado pode ser salvo em JSON ou no formato de pilhas "dobradas"
+(uma linha "f1;f2;f3 valor" por pilha), aceito por flamegraph.pl, speedscope
+e inferno.
+
+Uso:
+  with instrumentar() as perfil:
+      motor.multiplicarLimbs(a, b)
+  perfil.salvarJson("perfil.json")
+  perfil.salvarPilhas("perfil.pilhas")
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+import motor
+from limbs import DIGITOS_LIMB
+
+# Funções do motor medidas como nós da árvore de recursão (entram nas pilhas)
+NOS = (
+    "multiplicarLimbs",
+    "quadradoLimbs",
+    "karatsuba",
+    "karatsubaQuadrado",
+    "toom3",
+    "toom4",
+    "desbalanceado",
+    "multiplicarNTT",
+    "multiplicarBase",
+    "quadradoBase",
+)
+
+# Cada entrada nestas abre um novo nível da recursão
+ENTRADAS = ("multiplicarLimbs", "quadradoLimbs")
+CASOS_BASE = ("multiplicarBase", "quadradoBase")
+
+# Funções auxiliares só contadas (sem tempo próprio nem pilha)
+SOMAS = ("somar", "somarEm", "subtrairEm", "combinar")
+ALOCACOES = ("zeros", "somar", "combinar", "dividirExato", "multiplicarBase", "quadradoBase", "multiplicarNTT")
+
+_ativo = False
+
+
+def _novoNivel():
+    return {
+        "chamadas": 0,
+        "casosBase": 0,
+        "digitosSomaSubtracao": 0,
+        "bytesAlocados": 0,
+        "tempoNs": 0,
+        "algoritmos": {},
+    }
+
+
+def _bytes(resultado):
+    # Arrays de limbs; combinar devolve (sinal, array)
+    if isinstance(resultado, tuple):
+        resultado = resultado[1]
+    return resultado.itemsize * len(resultado)
+
+
+def _digitos(nome, args):
+    if nome == "somarEm" or nome == "subtrairEm":
+        return len(args[1]) * DIGITOS_LIMB
+    if nome == "somar":
+        return max(len(args[0]), len(args[1])) * DIGITOS_LIMB
+    # combinar(coeficientes, vetores): uma soma/subtração por vetor
+    return sum(len(v) for v in args[1]) * DIGITOS_LIMB
+
+
+class Perfil:
+    """
+    Contadores por profundidade e tempos por pilha de chamadas de uma
+    execução instrumentada.
+    """
+
+    def __init__(self):
+        self.niveis = {}
+        self.pilhas = {}
+        self.totalNs = 0
+        self._profundidade = -1
+        self._pilha = []
+        self._filhosNs = []
+
+    def _nivel(self):
+        d = max(self._profundidade, 0)
+        nivel = self.niveis.get(d)
+        if nivel is None:
+            nivel = self.niveis[d] = _novoNivel()
+        return nivel
+
+    def _no(self, nome, funcao):
+        entrada = nome in ENTRADAS
+        casoBase = nome in CASOS_BASE
+        aloca = nome in ALOCACOES
+
+        @wraps(funcao)
+        def instrumentada(*args):
+            # Um algoritmo chamado direto (ex.: main.ALGORITMOS["toom3"]) é a
+            # raiz: abre o nível 0 como faria multiplicarLimbs, e os filhos
+            # dele ficam no nível 1
+            abre = entrada or self._profundidade < 0
+            if abre:
+                self._profundidade += 1
+            nivel = self._nivel()
+            if abre:
+                nivel["chamadas"] += 1
+            if not entrada:
+                nivel["algoritmos"][nome] = nivel["algoritmos"].get(nome, 0) + 1
+                if casoBase:
+                    nivel["casosBase"] += 1
+
+            self._pilha.append(nome)
+            self._filhosNs.append(0)
+            inicio = time.perf_counter_ns()
+            try:
+                resultado = funcao(*args)
+            finally:
+                total = time.perf_counter_ns() - inicio
+                proprio = total - self._filhosNs.pop()
+                chave = ";".join(self._pilha)
+                self.pilhas[chave] = self.pilhas.get(chave, 0) + proprio
+                self._pilha.pop()
+                nivel["tempoNs"] += proprio
+                if self._filhosNs:
+                    self._filhosNs[-1] += total
+                else:
+                    self.totalNs += total
+                if abre:
+                    self._profundidade -= 1
+
+            if aloca:
+                nivel["bytesAlocados"] += _bytes(resultado)
+            return resultado
+
+        return instrumentada
+
+    def _auxiliar(self, nome, funcao):
+        soma = nome in SOMAS
+        aloca = nome in ALOCACOES
+
+        @wraps(funcao)
+        def instrumentada(*args):
+            resultado = funcao(*args)
+            nivel = self._nivel()
+            if soma:
+                nivel["digitosSomaSubtracao"] += _digitos(nome, args)
+            if aloca:
+                nivel["bytesAlocados"] += _bytes(resultado)
+            return resultado
+
+        return instrumentada
+
+    def paraDicionario(self):
+        return {
+            "totalNs": self.totalNs,
+            "niveis": [dict(profundidade=d, **self.niveis[d]) for d in sorted(self.niveis)],
+            "pilhas": dict(sorted(self.pilhas.items(), key=lambda item: -item[1])),
+        }
+
+    def salvarJson(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.paraDicionario(), f, indent=2)
+            f.write("\n")
+
+    def salvarPilhas(self, caminho):
+        # Formato "dobrado" do flamegraph: pilha separada por ";" e tempo próprio em ns
+        with open(caminho, "w", encoding="utf-8") as f:
+            for pilha, ns in sorted(self.pilhas.items()):
+                if ns > 0:
+                    f.write(f"{pilha} {ns}\n")
+
+    def resumo(self):
+        linhas = [f"{'nível':>5} {'chamadas':>9} {'base':>8} {'dígitos +/-':>14} {'MB alocados':>12} {'tempo (ms)':>11}"]
+        for d in sorted(self.niveis):
+            n = self.niveis[d]
+            linhas.append(f"{d:>5} {n['chamadas']:>9} {n['casosBase']:>8} {n['digitosSomaSubtracao']:>14}"
+                          f" {n['bytesAlocados'] / 2 ** 20:>12.2f} {n['tempoNs'] / 1e6:>11.3f}")
+        linhas.append(f"Tempo total: {self.totalNs / 1e6:.3f} ms")
+        return "\n".join(linhas)
+
+
+@contextmanager
+def instrumentar(*tabelas):
+    # Troca as funções do motor pelas instrumentadas só dentro do bloco "with".
+    # "tabelas" são dicionários extras (ex.: main.ALGORITMOS) que guardam
+    # referências diretas às funções originais e também devem ser trocados
+    global _ativo
+    if _ativo:
+        raise RuntimeError("A instrumentação já está ativa")
+
+    perfil = Perfil()
+    originais = {nome: getattr(motor, nome) for nome in NOS + SOMAS + ("zeros", "dividirExato")}
+    trocas = {}
+    for nome, funcao in originais.items():
+        trocas[nome] = perfil._no(nome, funcao) if nome in NOS else perfil._auxiliar(nome, funcao)
+    porFuncao = {id(originais[nome]): trocas[nome] for nome in NOS}
+
+    antigasTabelas = [dict(tabela) for tabela in tabelas]
+    _ativo = True
+    try:
+        for nome, funcao in trocas.items():
+            setattr(motor, nome, funcao)
+        for tabela in tabelas:
+            for chave, funcao in tabela.items():
+                if id(funcao) in porFuncao:
+                    tabela[chave] = porFuncao[id(funcao)]
+        yield perfil
+    finally:
+        for nome, funcao in originais.items():
+            setattr(motor, nome, funcao)
+        for tabela, antiga in zip(tabelas, antigasTabelas):
+            tabela.update(antiga)
+        _ativo = False
@@ -0,0 +1,332 @@
+"""
+limbs.py
+---------------------------------
+Representação compacta de inteiros grandes para o motor de multiplicação.
+
+Cada número é guardado como um array('q') de "limbs" na base 10^9, do limb
+menos significativo para o mais significativo (little-endian). Assim a
+conversão de/para string decimal é só fatiar a string de 9 em 9 dígitos, e
+somas/subtrações são feitas no próprio array (in-place), sem concatenar
+strings a cada dígito.
+
+Exemplo: "12345678901234567890" -> array('q', [234567890, 345678901, 12])
+
+Se o NumPy estiver instalado, somas e subtrações longas são feitas por uma
+view NumPy sobre o próprio array (sem cópia); sem ele, tudo roda em Python puro.
+"""
+
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+DIGITOS_LIMB = 9
+BASE = 10 ** DIGITOS_LIMB
+TIPO = "q"
+
+# A partir de quantos limbs vale a pena somar/subtrair via NumPy
+LIMIAR_NUMPY = 32
+
+# Quantas rodadas vetorizadas de "vai um" antes de cair no laço sequencial
+RODADAS_VAI_UM = 8
+
+# Inteiros até esse tamanho (em bits) são convertidos via str() nativo
+BITS_CONVERSAO_DIRETA = 12000
+
+
+def zeros(n):
+    # Array com n limbs zerados (alocação única, sem lista intermediária)
+    return array(TIPO, bytes(8 * n))
+
+
+def paraLimbs(s):
+    # Converte string decimal (sem sinal) em limbs
+    s = s.strip()
+    if not s.isdigit():
+        raise ValueError(f"Número inválido: {s[:20]!r}")
+
+    # Completa com zeros à esquerda até múltiplo de 9 e fatia do fim para o início
+    s = s.zfill(-(-len(s) // DIGITOS_LIMB) * DIGITOS_LIMB)
+    limbs = array(TIPO, map(int, [s[i - DIGITOS_LIMB:i] for i in range(len(s), 0, -DIGITOS_LIMB)]))
+    return normalizar(limbs)
+
+
+def paraString(a):
+    # Converte limbs em string decimal (limb mais alto sem zeros à esquerda)
+    n = len(a)
+    while n > 1 and a[n - 1] == 0:
+        n -= 1
+    if n == 0:
+        return "0"
+    partes = ["%09d" % a[i] for i in range(n - 2, -1, -1)]
+    return str(a[n - 1]) + "".join(partes)
+
+
+def normalizar(a):
+    # Remove limbs zero do topo, mantendo pelo menos um limb
+    while len(a) > 1 and a[-1] == 0:
+        a.pop()
+    if not a:
+        a.append(0)
+    return a
+
+
+def ehZero(a):
+    return all(x == 0 for x in a)
+
+
+def comparar(a, b):
+    # Retorna -1, 0 ou 1 (ignora zeros no topo)
+    na, nb = len(a), len(b)
+    while na > 0 and a[na - 1] == 0:
+        na -= 1
+    while nb > 0 and b[nb - 1] == 0:
+        nb -= 1
+    if na != nb:
+        return -1 if na < nb else 1
+    for i in range(na - 1, -1, -1):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+def _garantirEspaco(dest, tamanho):
+    # Garante len(dest) >= tamanho e um limb livre no topo para o "vai um" final
+    falta = tamanho - len(dest)
+    if falta > 0:
+        dest.extend(zeros(falta))
+    if dest[-1] != 0:
+        dest.append(0)
+
+
+def _propagarNumpy(dest, inicio, sinal):
+    # Resolve "vai um" (sinal=1) ou empréstimo (sinal=-1) com uma view NumPy.
+    # Cadeias longas (ex.: ...999999999) caem no laço sequencial depois de
+    # algumas rodadas.
+    seg = np.frombuffer(dest, dtype=np.int64)[inicio:]
+    for _ in range(RODADAS_VAI_UM):
+        fora = seg >= BASE if sinal > 0 else seg < 0
+        if not fora.any():
+            return
+        if fora[-1]:
+            raise ValueError("Subtração resultaria em número negativo")
+        seg[fora] -= sinal * BASE
+        seg[1:] += sinal * fora[:-1]
+    del seg, fora
+    _propagarSequencial(dest, inicio)
+
+
+def _propagarSequencial(dest, inicio):
+    # Normaliza limbs em [-1, BASE] a partir de "inicio" até o topo
+    for i in range(inicio, len(dest) - 1):
+        x = dest[i]
+        if x >= BASE:
+            dest[i] = x - BASE
+            dest[i + 1] += 1
+        elif x < 0:
+            dest[i] = x + BASE
+            dest[i + 1] -= 1
+    if dest[-1] < 0:
+        raise ValueError("Subtração resultaria em número negativo")
+
+
+def somarEm(dest, src, deslocamento=0):
+    # dest += src * BASE^deslocamento (in-place; dest cresce se preciso)
+    n = len(src)
+    while n > 0 and src[n - 1] == 0:
+        n -= 1
+    if n == 0:
+        return dest
+
+    _garantirEspaco(dest, deslocamento + n + 1)
+
+    if np is not None and n >= LIMIAR_NUMPY:
+        v = np.frombuffer(dest, dtype=np.int64)
+        v[deslocamento:deslocamento + n] += np.frombuffer(src, dtype=np.int64, count=n)
+        del v
+        _propagarNumpy(dest, deslocamento, 1)
+        return dest
+
+    # Soma dígito por dígito (limb por limb) da direita para a esquerda
+    vai_um = 0
+    i = deslocamento
+    for j in range(n):
+        soma = dest[i] + src[j] + vai_um
+        if soma >= BASE:
+            dest[i] = soma - BASE
+            vai_um = 1
+        else:
+            dest[i] = soma
+            vai_um = 0
+        i += 1
+
+    # Propaga o "vai um" restante
+    while vai_um:
+        soma = dest[i] + 1
+        if soma == BASE:
+            dest[i] = 0
+        else:
+            dest[i] = soma
+            vai_um = 0
+        i += 1
+
+    return dest
+
+
+def subtrairEm(dest, src, deslocamento=0):
+    # dest -= src * BASE^deslocamento (in-place; exige dest >= src * BASE^deslocamento)
+    n = len(src)
+    while n > 0 and src[n - 1] == 0:
+        n -= 1
+    if n == 0:
+        return dest
+    if deslocamento + n > len(dest):
+        raise ValueError("Subtração resultaria em número negativo")
+
+    if np is not None and n >= LIMIAR_NUMPY:
+        v = np.frombuffer(dest, dtype=np.int64)
+        v[deslocamento:deslocamento + n] -= np.frombuffer(src, dtype=np.int64, count=n)
+        del v
+        _propagarNumpy(dest, deslocamento, -1)
+        return dest
+
+    emprestimo = 0
+    i = deslocamento
+    for j in range(n):
+        sub = dest[i] - src[j] - emprestimo
+        if sub < 0:
+            dest[i] = sub + BASE
+            emprestimo = 1
+        else:
+            dest[i] = sub
+            emprestimo = 0
+        i += 1
+
+    # Propaga o empréstimo restante
+    while emprestimo:
+        if i == len(dest):
+            raise ValueError("Subtração resultaria em número negativo")
+        sub = dest[i] - 1
+        if sub < 0:
+            dest[i] = BASE - 1
+        else:
+            dest[i] = sub
+            emprestimo = 0
+        i += 1
+
+    return dest
+
+
+def somar(a, b):
+    # Soma fora do lugar: copia o maior e soma o menor nele
+    if len(a) < len(b):
+        a, b = b, a
+    return somarEm(array(TIPO, a), b)
+
+
+def subtrair(a, b):
+    # Diferença fora do lugar (exige a >= b)
+    return normalizar(subtrairEm(array(TIPO, a), b))
+
+
+@lru_cache(maxsize=64)
+def _potenciaBase(m):
+    # BASE^m como int; m é sempre potência de 2, então são poucas entradas
+    return BASE ** m
+
+
+def paraInteiro(a):
+    # Converte limbs em int do Python (divisão e conquista nos blocos grandes,
+    # cortando na maior potência de 2 menor que n para reaproveitar BASE^m)
+    n = len(a)
+    if n <= 64:
+        v = 0
+        for i in range(n - 1, -1, -1):
+            v = v * BASE + a[i]
+        return v
+    m = 1 << ((n - 1).bit_length() - 1)
+    return paraInteiro(a[m:]) * _potenciaBase(m) + paraInteiro(a[:m])
+
+
+def deInteiro(v):
+    # Inverso de paraInteiro para inteiros não negativos
+    if v < 0:
+        raise ValueError("Limbs representam apenas inteiros não negativos")
+    if v.bit_length() <= BITS_CONVERSAO_DIRETA:
+        return paraLimbs(str(v))
+    m = (v.bit_length() // 30) // 2
+    alto, baixo = divmod(v, BASE ** m)
+    limbs = deInteiro(baixo)
+    limbs.extend(zeros(m - len(limbs)))
+    limbs.extend(deInteiro(alto))
+    return normalizar(limbs)
+
+
+def multiplicarBase(a, b):
+    # Caso base: multiplicação nativa do Python sobre blocos pequenos
+    return deInteiro(paraInteiro(a) * paraInteiro(b))
+
+
+def quadradoBase(a):
+    # Caso base do quadrado: converte o operando uma vez só
+    v = paraInteiro(a)
+    return deInteiro(v * v)
+
+
+def _normalizarLista(acc):
+    # Resolve os "vai um" (positivos ou negativos) de uma lista de limbs com
+    # sinal; retorna o que sobrou acima do último limb
+    vai = 0
+    for i in range(len(acc)):
+        vai, acc[i] = divmod(acc[i] + vai, BASE)
+    return vai
+
+
+def combinar(coeficientes, vetores):
+    # Combinação linear sum(c * v) com coeficientes inteiros pequenos.
+    # Retorna (sinal, |resultado|) com o módulo já normalizado em limbs.
+    tamanho = max(len(v) for v in vetores) + 2
+
+    if np is not None and tamanho >= LIMIAR_NUMPY:
+        acc = np.zeros(tamanho, dtype=np.int64)
+        for c, v in zip(coeficientes, vetores):
+            if c and len(v):
+                acc[:len(v)] += c * np.frombuffer(v, dtype=np.int64)
+        for _ in range(RODADAS_VAI_UM):
+            vai = acc[:-1] // BASE
+            if not vai.any():
+                break
+            acc[:-1] -= vai * BASE
+            acc[1:] += vai
+        acc = acc.tolist()
+    else:
+        acc = [0] * tamanho
+        for c, v in zip(coeficientes, vetores):
+            if c:
+                for i, x in enumerate(v):
+                    acc[i] += c * x
+
+    sinal = 1
+    vai = _normalizarLista(acc)
+    if vai < 0:
+        # Resultado negativo: normaliza o oposto para obter o módulo
+        sinal = -1
+        acc = [-x for x in acc]
+        acc.append(-vai)
+        _normalizarLista(acc)
+
+    return sinal, normalizar(array(TIPO, acc))
+
+
+def dividirExato(a, d):
+    # a //= d in-place, para d inteiro pequeno que divide a exatamente
+    resto = 0
+    for i in range(len(a) - 1, -1, -1):
+        atual = resto * BASE + a[i]
+        a[i], resto = divmod(atual, d)
+    if resto:
+        raise ValueError(f"Divisão por {d} não é exata")
+    return normalizar(a)
@@ -1,6 +1,25 @@
+import argparse
+import contextlib
 import re
+import sys
 import time
 
+from conversao import inteiroDeString, stringDeInteiro
+from limbs import paraLimbs, paraString
+from motor import karatsuba, multiplicarLimbs, toom3, toom4
+from ntt import multiplicarNTT, verificarNTT
+from paralelo import multiplicarParalelo
+
+# Algoritmo usado no nível mais alto; "auto" deixa o motor escolher por tamanho
+ALGORITMOS = {
+    "auto": multiplicarLimbs,
+    "karatsuba": karatsuba,
+    "toom3": toom3,
+    "toom4": toom4,
+    "ntt": multiplicarNTT,
+    "paralelo": multiplicarParalelo,
+}
+
 def encontrarSoma(str1, str2):
     # Garante que str1 seja o menor número
     if len(str1) > len(str2):
@@ -56,7 +75,7 @@ def removerZerosAEsquerda(s):
     return s
 
 
-def multiplicar(A, B): # +1
+def multiplicarStrings(A, B): # +1
     # Caso base: se os números forem pequenos, multiplica diretamente
     if len(A) < 10 or len(B) < 10: # +1
         return str(int(A) * int(B)) # +1
@@ -73,36 +92,125 @@ def multiplicar(A, B): # +1
     Bl, Br = B[:n2], B[n2:] # +1
 
     # Karatsuba: calcula os 3 produtos parciais recursivamente
-    p = multiplicar(Al, Bl) # +1
-    q = multiplicar(Ar, Br) # +1
-    r = multiplicar(encontrarSoma(Al, Ar), encontrarSoma(Bl, Br)) # +1
+    p = multiplicarStrings(Al, Bl) # +1
+    q = multiplicarStrings(Ar, Br) # +1
+    r = multiplicarStrings(encontrarSoma(Al, Ar), encontrarSoma(Bl, Br)) # +1
     r = encontrarDiferenca(r, encontrarSoma(p, q)) # +1
 
     # Combina os resultados (p * 10^2m + r * 10^m + q)
     return removerZerosAEsquerda(encontrarSoma(encontrarSoma(p + '0' * (2 * n2), r + '0' * n2), q)) # +1
 
 
+def multiplicar(A, B, algoritmo="auto", **opcoes):
+    # Mesma API de strings, mas o trabalho é feito pelo motor de limbs (motor.py)
+    A, B = A.strip(), B.strip()
+    negativo = A.startswith("-") != B.startswith("-")
+    A, B = A.lstrip("+-"), B.lstrip("+-")
+
+    resultado = paraString(ALGORITMOS[algoritmo](paraLimbs(A), paraLimbs(B), **opcoes))
+
+    if negativo and resultado != "0":
+        resultado = "-" + resultado
+    return resultado
+
+
+def salvarPerfil(perfil, prefixo):
+    perfil.salvarJson(prefixo + ".json")
+    perfil.salvarPilhas(prefixo + ".pilhas")
+    print(f"\n{perfil.resumo()}", file=sys.stderr)
+    print(f"Perfil salvo em: {prefixo}.json e {prefixo}.pilhas", file=sys.stderr)
+
+
 if __name__ == "__main__": # +1
+    parser = argparse.ArgumentParser(description="Multiplicação de inteiros grandes (Karatsuba, Toom, NTT)")
+    parser.add_argument("--algoritmo", "-a", choices=sorted(ALGORITMOS), default="auto",
+                        help="algoritmo do nível mais alto (os níveis abaixo são escolhidos pelo motor)")
+    parser.add_argument("--verificar", action="store_true", help="confere a NTT contra o Karatsuba e sai")
+    parser.add_argument("--trabalhadores", "-t", type=int, default=None,
+                        help="processos do modo paralelo (padrão: número de CPUs)")
+    parser.add_argument("--profundidade", "-p", type=int, default=None,
+                        help="níveis do Karatsuba distribuídos no modo paralelo")
+    parser.add_argument("--arquivos", nargs=2, metavar=("A", "B"),
+                        help="lê os dois operandos de arquivos (mmap) em vez do teclado")
+    parser.add_argument("--lote", metavar="ARQUIVO",
+                        help="arquivo com um par 'A B' por linha, multiplicados em paralelo")
+    parser.add_argument("--saida", "-o", metavar="ARQUIVO", help="grava o(s) produto(s) em arquivo (padrão: stdout)")
+    parser.add_argument("--perfil", metavar="PREFIXO",
+                        help="instrumenta a multiplicação e grava PREFIXO.json e PREFIXO.pilhas (flame graph)")
+    args = parser.parse_args()
+    if args.perfil and args.lote:
+        parser.error("--perfil não se aplica ao modo lote (os produtos rodam em outros processos)")
+    if args.lote and args.algoritmo == "paralelo":
+        parser.error("--algoritmo paralelo não se aplica ao modo lote (os pares já são multiplicados em paralelo)")
+    if args.trabalhadores is not None and args.trabalhadores < 1:
+        parser.error("--trabalhadores deve ser pelo menos 1")
+    if args.profundidade is not None and args.profundidade < 0:
+        parser.error("--profundidade não pode ser negativa")
+
+    # Sem --perfil o motor roda sem instrumentação nenhuma
+    instrumentacao = contextlib.nullcontext()
+    if args.perfil:
+        from instrumentacao import instrumentar
+        instrumentacao = instrumentar(ALGORITMOS)
+
+    opcoes = {}
+    if args.algoritmo == "paralelo":
+        opcoes = {"trabalhadores": args.trabalhadores, "profundidade": args.profundidade}
+
+    if args.arquivos or args.lote:
+        from arquivos import multiplicarArquivos, multiplicarLote, validarLote
+
+        # Arquivo ausente ou conteúdo inválido vira mensagem de erro, não traceback
+        try:
+            with contextlib.ExitStack() as pilha:
+                if args.lote:
+                    # O lote é conferido antes de abrir (e truncar) o arquivo de saída
+                    entrada = pilha.enter_context(open(args.lote, encoding="ascii"))
+                    validarLote(entrada)
+                    entrada.seek(0)
+                saida = pilha.enter_context(open(args.saida, "w", encoding="ascii")) if args.saida else sys.stdout
+                if args.arquivos:
+                    with instrumentacao as perfil:
+                        multiplicarArquivos(*args.arquivos, saida=saida, algoritmo=args.algoritmo,
+                                            algoritmos=ALGORITMOS, **opcoes)
+                else:
+                    multiplicarLote(entrada, saida, trabalhadores=args.trabalhadores,
+                                    algoritmo=args.algoritmo)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        if args.perfil:
+            salvarPerfil(perfil, args.perfil)
+        raise SystemExit(0)
+
+    if args.verificar:
+        print(f"NTT conferida contra Karatsuba em {verificarNTT()} casos aleatórios")
+        raise SystemExit(0)
+
     # Leitura dos números do teclado
     A = input("Digite o primeiro número: ").strip() # +1
     B = input("Digite o segundo número: ").strip() # +1
 
     # Medir o tempo de execução
-    inicioKaratsuba = time.time() # +1
+    inicioKaratsuba = time.perf_counter() # +1
 
-    resultadoKaratsuba = multiplicar(A, B) # +1
+    with instrumentacao as perfil:
+        resultadoKaratsuba = multiplicar(A, B, args.algoritmo, **opcoes) # +1
 
-    fimKaratsuba = time.time() # +1
+    fimKaratsuba = time.perf_counter() # +1
 
     # Mostrar o resultado e o tempo
     print(f"\nResultado Karatsuba: {resultadoKaratsuba}") # +1
     print(f"Tempo de execução: {fimKaratsuba - inicioKaratsuba:.6f} segundos") # +1
+    if args.perfil:
+        salvarPerfil(perfil, args.perfil)
 
-    inicioMultiplicaçãoNormal = time.time() # +1
+    inicioMultiplicaçãoNormal = time.perf_counter() # +1
 
-    resultadoMultiplicaçãoNormal  = str(int(A) * int(B)) # +1
+    # Conversão por divisão e conquista: int()/str() nativos são quadráticos e
+    # falham acima de sys.get_int_max_str_digits() dígitos
+    resultadoMultiplicaçãoNormal  = stringDeInteiro(inteiroDeString(A) * inteiroDeString(B)) # +1
 
-    fimMultiplicaçãoNormal = time.time() # +1
+    fimMultiplicaçãoNormal = time.perf_counter() # +1
 
     # Mostrar o resultado e o tempo
     print(f"\nResultado Multiplicação Normal: {resultadoMultiplicaçãoNormal}") # +1
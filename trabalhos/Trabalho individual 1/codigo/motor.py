@@ -0,0 +1,284 @@
+"""
+motor.py
+---------------------------------
+Motor de multiplicação sobre limbs (ver limbs.py).
+
+Mesma ideia do multiplicarStrings() de main.py, mas os operandos ficam em
+arrays compactos na base 10^9 e as somas/subtrações são feitas in-place, em
+vez de criar uma string nova a cada dígito.
+
+Algoritmos disponíveis (escolhidos por multiplicarLimbs a cada nível da
+recursão, conforme o tamanho do menor operando):
+- multiplicação nativa do Python (caso base)
+- Karatsuba (3 produtos de metade do tamanho)
+- Toom-3 (5 produtos de um terço do tamanho)
+- Toom-4 (7 produtos de um quarto do tamanho)
+- NTT (ver ntt.py), nível mais alto, quando o NumPy está disponível
+
+Para quadrados há o ponto de entrada quadradoLimbs, com os mesmos níveis: o
+Karatsuba do quadrado faz 3 quadrados recursivos e uma única soma, o Toom
+avalia o operando uma vez só e a NTT faz uma única transformada direta.
+
+Operandos desbalanceados (um muito maior que o outro) são fatiados em blocos
+do tamanho do menor, em vez de completar o menor com zeros.
+
+Os limiares abaixo são valores padrão; se existir um perfil gerado por
+autotune.py (perfil.json ao lado deste arquivo, ou o caminho em
+KARATSUBA_PERFIL), os valores medidos na máquina são carregados na importação.
+"""
+
+import json
+import os
+import warnings
+from contextlib import contextmanager
+from fractions import Fraction
+from math import gcd
+
+from limbs import (
+    combinar,
+    dividirExato,
+    multiplicarBase,
+    normalizar,
+    quadradoBase,
+    somar,
+    somarEm,
+    subtrairEm,
+    zeros,
+)
+from ntt import NTT_DISPONIVEL, cabeNaNTT, multiplicarNTT
+
+# Limiares em limbs (9 dígitos cada), comparados com o tamanho do menor operando.
+# Com o NumPy, a NTT é testada antes dos níveis Toom (ver _usaNTT): os Toom
+# ficam para quando não há NumPy ou o produto não cabe na NTT
+LIMIAR_KARATSUBA = 256
+LIMIAR_TOOM3 = 3072
+LIMIAR_TOOM4 = 12288
+# Cruzamento medido motor x NTT: abaixo de ~1800 limbs a NTT perde ou empata
+# (768 limbs: ~1,3x mais lenta); a partir de 2048 limbs (~18 mil dígitos) ela
+# ganha do Karatsuba/Toom por 2x a 3x (4096 limbs: 0,029 s x 0,080 s)
+LIMIAR_NTT = 2048
+
+LIMIARES = ("LIMIAR_KARATSUBA", "LIMIAR_TOOM3", "LIMIAR_TOOM4", "LIMIAR_NTT")
+
+# Valor de limiar que desliga um nível
+INFINITO = 1 << 62
+
+CAMINHO_PERFIL = os.environ.get(
+    "KARATSUBA_PERFIL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfil.json"),
+)
+
+
+def carregarPerfil(caminho=CAMINHO_PERFIL):
+    # Aplica os limiares de um perfil salvo pelo autotune; sem arquivo, mantém os padrões
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            perfil = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Perfil de limiares ignorado ({caminho}): {e}")
+        return False
+
+    for nome in LIMIARES:
+        valor = perfil.get("limiares", {}).get(nome)
+        if isinstance(valor, int) and valor > 0:
+            globals()[nome] = valor
+    return True
+
+
+@contextmanager
+def limiaresTemporarios(**valores):
+    # Troca limiares só dentro do bloco "with" (medições, comparações de algoritmos)
+    antigos = {nome: globals()[nome] for nome in valores}
+    globals().update(valores)
+    try:
+        yield
+    finally:
+        globals().update(antigos)
+
+
+def karatsuba(a, b):
+    na, nb = len(a), len(b)
+
+    # Caso base: blocos pequenos vão direto para a multiplicação nativa
+    if na < LIMIAR_KARATSUBA or nb < LIMIAR_KARATSUBA:
+        return multiplicarBase(a, b)
+
+    m = max(na, nb) // 2
+
+    # Divide no limb m (parte baixa primeiro, pois é little-endian)
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+
+    # Karatsuba: 3 produtos parciais
+    p = multiplicarLimbs(a1, b1)
+    q = multiplicarLimbs(a0, b0)
+    r = multiplicarLimbs(somar(a0, a1), somar(b0, b1))
+    subtrairEm(r, p)
+    subtrairEm(r, q)
+
+    # Combina: p * BASE^2m + r * BASE^m + q
+    resultado = zeros(na + nb + 1)
+    somarEm(resultado, q)
+    somarEm(resultado, r, m)
+    somarEm(resultado, p, 2 * m)
+    return normalizar(resultado)
+
+
+def karatsubaQuadrado(a):
+    n = len(a)
+    if n < LIMIAR_KARATSUBA:
+        return quadradoBase(a)
+
+    m = n // 2
+    a0, a1 = a[:m], a[m:]
+
+    # a^2 = p * BASE^2m + (2 * a0 * a1) * BASE^m + q, com o termo cruzado
+    # 2 * a0 * a1 = (a0 + a1)^2 - p - q: três quadrados e uma única soma
+    p = quadradoLimbs(a1)
+    q = quadradoLimbs(a0)
+    r = quadradoLimbs(somar(a0, a1))
+    subtrairEm(r, p)
+    subtrairEm(r, q)
+
+    resultado = zeros(2 * n + 1)
+    somarEm(resultado, q)
+    somarEm(resultado, r, m)
+    somarEm(resultado, p, 2 * m)
+    return normalizar(resultado)
+
+
+def _inverter(matriz):
+    # Gauss-Jordan com frações (só roda na importação, matrizes 5x5 e 7x7)
+    n = len(matriz)
+    aum = [linha[:] + [Fraction(int(i == j)) for j in range(n)] for i, linha in enumerate(matriz)]
+    for col in range(n):
+        piv = next(i for i in range(col, n) if aum[i][col] != 0)
+        aum[col], aum[piv] = aum[piv], aum[col]
+        fator = aum[col][col]
+        aum[col] = [x / fator for x in aum[col]]
+        for i in range(n):
+            if i != col and aum[i][col] != 0:
+                f = aum[i][col]
+                aum[i] = [x - f * y for x, y in zip(aum[i], aum[col])]
+    return [linha[n:] for linha in aum]
+
+
+def _planoToom(pontos):
+    # Para k partes e 2k-1 pontos homogêneos (p, q), monta:
+    # - avaliação: coeficientes de cada parte em A(p, q)
+    # - interpolação: (numeradores, denominador) de cada coeficiente do produto
+    k = (len(pontos) + 1) // 2
+    grau = 2 * k - 2
+
+    avaliacao = [[p ** i * q ** (k - 1 - i) for i in range(k)] for p, q in pontos]
+    vandermonde = [[Fraction(p ** i * q ** (grau - i)) for i in range(grau + 1)] for p, q in pontos]
+
+    interpolacao = []
+    for linha in _inverter(vandermonde):
+        d = 1
+        for x in linha:
+            d = d * x.denominator // gcd(d, x.denominator)  # mmc (math.lcm só existe no 3.9+)
+        interpolacao.append(([int(x * d) for x in linha], d))
+
+    return k, avaliacao, interpolacao
+
+
+# Pontos de avaliação (p, q) = p/q; (1, 0) é o ponto no infinito
+TOOM3 = _planoToom([(0, 1), (1, 1), (-1, 1), (-2, 1), (1, 0)])
+TOOM4 = _planoToom([(0, 1), (1, 1), (-1, 1), (2, 1), (-2, 1), (1, 2), (1, 0)])
+
+
+def toom(a, b, plano):
+    k, avaliacao, interpolacao = plano
+    na, nb = len(a), len(b)
+    m = -(-max(na, nb) // k)
+
+    # Divide cada operando em k partes de m limbs
+    quadrado = a is b
+    partesA = [a[i * m:(i + 1) * m] for i in range(k)]
+    partesB = partesA if quadrado else [b[i * m:(i + 1) * m] for i in range(k)]
+
+    # Avaliação nos 2k-1 pontos e produtos ponto a ponto (recursivos); no
+    # quadrado cada ponto é avaliado uma vez e o produto vira um quadrado
+    sinais, produtos = [], []
+    for linha in avaliacao:
+        sa, va = combinar(linha, partesA)
+        if quadrado:
+            sinais.append(1)
+            produtos.append(quadradoLimbs(va))
+            continue
+        sb, vb = combinar(linha, partesB)
+        sinais.append(sa * sb)
+        produtos.append(multiplicarLimbs(va, vb))
+
+    # Interpolação: cada coeficiente do produto é exato e não negativo
+    resultado = zeros(na + nb + 1)
+    for i, (numeradores, d) in enumerate(interpolacao):
+        sinal, c = combinar([n * s for n, s in zip(numeradores, sinais)], produtos)
+        if sinal < 0:
+            raise ArithmeticError("Interpolação Toom produziu coeficiente negativo")
+        somarEm(resultado, dividirExato(c, d), i * m)
+
+    return normalizar(resultado)
+
+
+def toom3(a, b):
+    return toom(a, b, TOOM3)
+
+
+def toom4(a, b):
+    return toom(a, b, TOOM4)
+
+
+def desbalanceado(a, b, bloco):
+    # a muito maior que b: fatia a em blocos e soma cada produto parcial deslocado
+    resultado = zeros(len(a) + len(b) + 1)
+    for i in range(0, len(a), bloco):
+        somarEm(resultado, multiplicarLimbs(a[i:i + bloco], b), i)
+    return normalizar(resultado)
+
+
+def _usaNTT(na, nb):
+    # A NTT assume a partir de LIMIAR_NTT, antes dos níveis Toom
+    return NTT_DISPONIVEL and nb >= LIMIAR_NTT and cabeNaNTT(na, nb)
+
+
+def multiplicarLimbs(a, b):
+    # Ponto de entrada do motor: recebe e devolve limbs e escolhe o algoritmo
+    # a cada nível pelo tamanho do menor operando
+    if len(a) < len(b):
+        a, b = b, a
+    na, nb = len(a), len(b)
+
+    bloco = max(nb, LIMIAR_KARATSUBA)
+    if na >= 2 * bloco:
+        return desbalanceado(a, b, bloco)
+
+    if nb < LIMIAR_KARATSUBA:
+        return multiplicarBase(a, b)
+    if _usaNTT(na, nb):
+        return multiplicarNTT(a, b)
+    if nb < LIMIAR_TOOM3:
+        return karatsuba(a, b)
+    if nb < LIMIAR_TOOM4:
+        return toom3(a, b)
+    return toom4(a, b)
+
+
+def quadradoLimbs(a):
+    # Ponto de entrada do quadrado: mesmos limiares de multiplicarLimbs
+    n = len(a)
+    if n < LIMIAR_KARATSUBA:
+        return quadradoBase(a)
+    if _usaNTT(n, n):
+        return multiplicarNTT(a, a)
+    if n < LIMIAR_TOOM3:
+        return karatsubaQuadrado(a)
+    if n < LIMIAR_TOOM4:
+        return toom3(a, a)
+    return toom4(a, a)
+
+
+carregarPerfil()
@@ -0,0 +1,227 @@
+"""
+ntt.py
+---------------------------------
+Multiplicação exata via transformada teórica dos números (NTT), para
+operandos com milhões de dígitos, onde mesmo o Toom-4 perde para um
+algoritmo quase linear (O(n log n)).
+
+Os limbs (base 10^9) são reagrupados em dígitos na base 10^6: 2 limbs = 10^18
+= 3 dígitos. A convolução dos dígitos é calculada módulo 3 primos "amigos de
+NTT" (p = c * 2^k + 1) e o valor exato de cada coeficiente é reconstruído
+pelo Teorema Chinês do Resto (Garner). Como cada coeficiente é menor que
+n * 10^12, bem abaixo do produto dos 3 primos (~5.9 * 10^25), o resultado é
+exato.
+
+Requer NumPy. Sem ele, NTT_DISPONIVEL é False e o motor não usa esse nível.
+
+Uso (verificação contra o Karatsuba de motor.py):
+  python ntt.py
+"""
+
+import random
+from array import array
+
+from limbs import BASE, TIPO, normalizar, paraInteiro, paraLimbs
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+NTT_DISPONIVEL = np is not None
+
+DIGITO = 10 ** 6
+
+# (primo, raiz primitiva, maior k com 2^k dividindo p - 1)
+PRIMOS = (
+    (469762049, 3, 26),
+    (167772161, 3, 25),
+    (754974721, 11, 24),
+)
+
+# Maior transformada suportada por todos os primos
+TAMANHO_MAXIMO = 1 << min(k for _, _, k in PRIMOS)
+
+
+def _paraDigitos(a):
+    # Limbs base 10^9 -> dígitos base 10^6 (int64), 2 limbs viram 3 dígitos
+    v = np.frombuffer(a, dtype=np.int64)
+    if len(v) % 2:
+        v = np.append(v, 0)
+    pares = v[0::2] + v[1::2] * BASE
+    d = np.empty((len(pares), 3), dtype=np.int64)
+    d[:, 0] = pares % DIGITO
+    d[:, 1] = (pares // DIGITO) % DIGITO
+    d[:, 2] = pares // (DIGITO * DIGITO)
+    return d.reshape(-1)
+
+
+def _deDigitos(d):
+    # Dígitos base 10^6 já normalizados -> limbs base 10^9
+    if len(d) % 3:
+        d = np.append(d, np.zeros(3 - len(d) % 3, dtype=np.int64))
+    t = d.reshape(-1, 3)
+    pares = t[:, 0] + t[:, 1] * DIGITO + t[:, 2] * (DIGITO * DIGITO)
+    limbs = np.empty((len(pares), 2), dtype=np.int64)
+    limbs[:, 0] = pares % BASE
+    limbs[:, 1] = pares // BASE
+    resultado = array(TIPO)
+    resultado.frombytes(limbs.tobytes())
+    return normalizar(resultado)
+
+
+_cacheBitReverso = {}
+_cacheRaizes = {}
+
+
+def _bitReverso(n):
+    if n not in _cacheBitReverso:
+        bits = n.bit_length() - 1
+        idx = np.arange(n, dtype=np.int64)
+        rev = np.zeros(n, dtype=np.int64)
+        for b in range(bits):
+            rev |= ((idx >> b) & 1) << (bits - 1 - b)
+        _cacheBitReverso[n] = rev
+    return _cacheBitReverso[n]
+
+
+def _raizes(n, p, g, inversa):
+    # Tabela w^0, w^1, ..., w^(n/2 - 1) para w raiz n-ésima primitiva mod p
+    chave = (n, p, inversa)
+    if chave not in _cacheRaizes:
+        w = pow(g, (p - 1) // n, p)
+        if inversa:
+            w = pow(w, p - 2, p)
+        tabela = np.ones(1, dtype=np.int64)
+        while len(tabela) < n // 2:
+            passo = pow(w, len(tabela), p)
+            tabela = np.concatenate((tabela, tabela * passo % p))
+        _cacheRaizes[chave] = tabela[:max(n // 2, 1)]
+    return _cacheRaizes[chave]
+
+
+def _ntt(a, p, g, inversa=False):
+    # NTT iterativa (Cooley-Tukey), um estágio inteiro por operação NumPy
+    n = len(a)
+    a = a[_bitReverso(n)]
+    raizes = _raizes(n, p, g, inversa)
+
+    tamanho = 2
+    while tamanho <= n:
+        metade = tamanho // 2
+        w = raizes[::n // tamanho]
+        blocos = a.reshape(-1, tamanho)
+        u = blocos[:, :metade].copy()
+        v = blocos[:, metade:] * w % p
+        blocos[:, :metade] = (u + v) % p
+        blocos[:, metade:] = (u - v) % p
+        tamanho *= 2
+
+    if inversa:
+        a = a * pow(n, p - 2, p) % p
+    return a
+
+
+def _convolucaoModular(x, y, n, p, g):
+    fx = np.zeros(n, dtype=np.int64)
+    fx[:len(x)] = x
+    fx = _ntt(fx, p, g)
+    if y is x:
+        fy = fx
+    else:
+        fy = np.zeros(n, dtype=np.int64)
+        fy[:len(y)] = y
+        fy = _ntt(fy, p, g)
+    return _ntt(fx * fy % p, p, g, inversa=True)
+
+
+def _garner(residuos):
+    # CRT (Garner) para 3 primos, direto em colunas base 10^6 para não estourar int64:
+    # x = v1 + v2 * m1 + v3 * m1 * m2
+    (p1, _, _), (p2, _, _), (p3, _, _) = PRIMOS
+    r1, r2, r3 = residuos
+
+    v1 = r1
+    v2 = (r2 - v1) % p2 * pow(p1, p2 - 2, p2) % p2
+    t = (v1 + v2 % p3 * (p1 % p3)) % p3
+    v3 = (r3 - t) % p3 * pow(p1 * p2 % p3, p3 - 2, p3) % p3
+
+    def emDigitos(c):
+        partes = []
+        while c:
+            c, d = divmod(c, DIGITO)
+            partes.append(d)
+        return partes
+
+    n = len(v1)
+    colunas = np.zeros(n + 6, dtype=np.int64)
+    for termo, constante in ((v1, 1), (v2, p1), (v3, p1 * p2)):
+        for j, d in enumerate(emDigitos(constante)):
+            if d:
+                colunas[j:j + n] += termo * d
+    return colunas
+
+
+def _propagar(colunas):
+    # "Vai um" na base 10^6: rodadas vetorizadas e, se preciso, laço sequencial
+    for _ in range(8):
+        vai = colunas // DIGITO
+        if not vai[:-1].any():
+            return colunas
+        colunas[:-1] -= vai[:-1] * DIGITO
+        colunas[1:] += vai[:-1]
+    lista = colunas.tolist()
+    vai = 0
+    for i in range(len(lista)):
+        vai, lista[i] = divmod(lista[i] + vai, DIGITO)
+    return np.array(lista, dtype=np.int64)
+
+
+def cabeNaNTT(na, nb):
+    # Produto de na x nb limbs cabe na maior transformada suportada?
+    return 3 * ((na + 1) // 2 + (nb + 1) // 2) <= TAMANHO_MAXIMO
+
+
+def multiplicarNTT(a, b):
+    if not NTT_DISPONIVEL:
+        raise RuntimeError("A multiplicação via NTT requer NumPy instalado")
+    if not cabeNaNTT(len(a), len(b)):
+        raise ValueError(f"Operandos grandes demais para a NTT (máximo {TAMANHO_MAXIMO} dígitos base 10^6)")
+
+    x = _paraDigitos(a)
+    y = x if a is b else _paraDigitos(b)
+
+    n = 1
+    while n < len(x) + len(y):
+        n *= 2
+
+    residuos = [_convolucaoModular(x, y, n, p, g)[:len(x) + len(y)] for p, g, _ in PRIMOS]
+    return _deDigitos(_propagar(_garner(residuos)))
+
+
+def verificarNTT(casos=50, maxLimbs=5000, semente=None):
+    # Compara multiplicarNTT com o Karatsuba de motor.py (e com o int nativo)
+    from motor import karatsuba
+
+    rng = random.Random(semente)
+    for caso in range(casos):
+        na, nb = rng.randint(1, maxLimbs), rng.randint(1, maxLimbs)
+        a = array(TIPO, [rng.randrange(BASE) for _ in range(na)])
+        b = array(TIPO, [rng.randrange(BASE) for _ in range(nb)])
+        if caso % 5 == 0:
+            # Limbs todos 999999999: pior caso para a propagação do "vai um"
+            a = array(TIPO, [BASE - 1] * na)
+        esperado = karatsuba(normalizar(array(TIPO, a)), normalizar(array(TIPO, b)))
+        obtido = multiplicarNTT(a, b)
+        if obtido != esperado or paraInteiro(obtido) != paraInteiro(a) * paraInteiro(b):
+            raise AssertionError(f"NTT divergiu do Karatsuba no caso {caso} ({na} x {nb} limbs)")
+
+    # Casos de borda
+    for A, B in (("0", "0"), ("1", "999999999999"), ("123456789", "987654321")):
+        if multiplicarNTT(paraLimbs(A), paraLimbs(B)) != karatsuba(paraLimbs(A), paraLimbs(B)):
+            raise AssertionError(f"NTT divergiu do Karatsuba em {A} x {B}")
+    return casos
+
+
+if __name__ == "__main__":
+    print(f"NTT conferida contra Karatsuba em {verificarNTT()} casos aleatórios")
@@ -0,0 +1,109 @@
+"""
+paralelo.py
+---------------------------------
+Karatsuba paralelo: os níveis mais altos da recursão são expandidos no
+processo principal e os 3^profundidade subprodutos independentes (p, q, r de
+cada nível) são enviados para um ProcessPoolExecutor. Cada folha roda o
+motor serial (motor.multiplicarLimbs) dentro do processo trabalhador.
+
+Os operandos viajam para os trabalhadores como bytes crus dos arrays de limbs
+(8 bytes por limb), e não como strings decimais.
+
+Subproblemas menores que LIMIAR_PARALELO limbs não valem o custo de
+serialização e são resolvidos no próprio processo. Operandos desbalanceados
+são fatiados em blocos do tamanho do menor, como em motor.desbalanceado, e
+cada bloco é expandido separadamente (dividir pela metade do maior deixaria
+metades vazias no menor).
+"""
+
+import math
+import os
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from limbs import TIPO, normalizar, somar, somarEm, subtrairEm, zeros
+from motor import multiplicarLimbs
+
+# Menor operando (em limbs) para um nível ainda ser dividido entre processos
+LIMIAR_PARALELO = 4096
+
+
+def _deBytes(dados):
+    a = array(TIPO)
+    a.frombytes(dados)
+    return a
+
+
+def _multiplicarBytes(dadosA, dadosB):
+    # Executa no processo trabalhador: bytes -> limbs -> produto -> bytes
+    return multiplicarLimbs(_deBytes(dadosA), _deBytes(dadosB)).tobytes()
+
+
+def _expandir(a, b, profundidade, pool):
+    # Desce a recursão do Karatsuba até a profundidade pedida, enviando as
+    # folhas ao pool. Devolve um Future (folha), a tupla (tamanho, blocos) de
+    # um produto desbalanceado ou a tupla (m, tamanho, p, q, r) do nó interno.
+    if len(a) < len(b):
+        a, b = b, a
+    na, nb = len(a), len(b)
+    if profundidade == 0 or nb < LIMIAR_PARALELO:
+        return pool.submit(_multiplicarBytes, a.tobytes(), b.tobytes())
+
+    if na >= 2 * nb:
+        # Mesmo fatiamento de motor.desbalanceado, com os blocos em paralelo
+        blocos = [(i, _expandir(a[i:i + nb], b, profundidade, pool)) for i in range(0, na, nb)]
+        return na + nb, blocos
+
+    m = na // 2
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+
+    p = _expandir(a1, b1, profundidade - 1, pool)
+    q = _expandir(a0, b0, profundidade - 1, pool)
+    r = _expandir(somar(a0, a1), somar(b0, b1), profundidade - 1, pool)
+    return m, na + nb, p, q, r
+
+
+def _combinar(no):
+    # Espera as folhas e refaz, de baixo para cima, a combinação do Karatsuba
+    if isinstance(no, Future):
+        return _deBytes(no.result())
+
+    if len(no) == 2:
+        tamanho, blocos = no
+        resultado = zeros(tamanho + 1)
+        for deslocamento, bloco in blocos:
+            somarEm(resultado, _combinar(bloco), deslocamento)
+        return normalizar(resultado)
+
+    m, tamanho, p, q, r = no
+    p, q, r = _combinar(p), _combinar(q), _combinar(r)
+    subtrairEm(r, p)
+    subtrairEm(r, q)
+
+    resultado = zeros(tamanho + 1)
+    somarEm(resultado, q)
+    somarEm(resultado, r, m)
+    somarEm(resultado, p, 2 * m)
+    return normalizar(resultado)
+
+
+def profundidadePadrao(trabalhadores):
+    # Menor profundidade com pelo menos um subproduto por trabalhador
+    return max(1, math.ceil(math.log(max(trabalhadores, 1), 3)))
+
+
+def multiplicarParalelo(a, b, profundidade=None, trabalhadores=None, pool=None):
+    # Karatsuba com os "profundidade" níveis mais altos distribuídos num pool
+    # de processos. Um pool já aberto pode ser reaproveitado entre chamadas.
+    if min(len(a), len(b)) < LIMIAR_PARALELO:
+        return multiplicarLimbs(a, b)
+
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    if profundidade is None:
+        profundidade = profundidadePadrao(trabalhadores)
+
+    if pool is not None:
+        return _combinar(_expandir(a, b, profundidade, pool))
+    with ProcessPoolExecutor(max_workers=trabalhadores) as pool:
+        return _combinar(_expandir(a, b, profundidade, pool))
@@ -0,0 +1,196 @@
+"""
+potencia.py
+---------------------------------
+Quadrado e exponenciação de inteiros grandes sobre o motor de limbs.
+
+- quadrado(A): usa motor.quadradoLimbs (Karatsuba/Toom/NTT do quadrado), que
+  evita o trabalho repetido de multiplicar(A, A).
+- potencia(A, e): exponenciação binária (da direita para a esquerda, só
+  quadrados e produtos) ou por janela deslizante (da esquerda para a direita,
+  com a tabela das potências ímpares A^1, A^3, ..., A^(2^w - 1)).
+- CachePotencias: cache LRU limitado em bytes com as potências intermediárias
+  de cada base (A^(2^i) e a tabela de ímpares), para chamadas repetidas com a
+  mesma base.
+"""
+
+from collections import OrderedDict
+
+from limbs import deInteiro, paraLimbs, paraString
+from motor import multiplicarLimbs, quadradoLimbs
+
+
+class CachePotencias:
+    """
+    Cache LRU de potências intermediárias, limitado pelo total de bytes dos
+    arrays guardados. Entradas maiores que o limite não são guardadas.
+    Os arrays devolvidos por obter() são os próprios guardados: trate-os como
+    somente leitura (potenciaBinaria/potenciaJanela devolvem cópias).
+    """
+
+    def __init__(self, maxBytes=256 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self._dados = OrderedDict()
+
+    def __len__(self):
+        return len(self._dados)
+
+    def obter(self, chave):
+        valor = self._dados.get(chave)
+        if valor is None:
+            self.faltas += 1
+            return None
+        self.acertos += 1
+        self._dados.move_to_end(chave)
+        return valor
+
+    def guardar(self, chave, valor):
+        tamanho = _bytes(valor)
+        if tamanho > self.maxBytes:
+            return
+        if chave in self._dados:
+            self.bytes -= _bytes(self._dados.pop(chave))
+        self._dados[chave] = valor
+        self.bytes += tamanho
+        while self.bytes > self.maxBytes:
+            _, removido = self._dados.popitem(last=False)
+            self.bytes -= _bytes(removido)
+
+    def limpar(self):
+        self._dados.clear()
+        self.bytes = 0
+
+
+def _bytes(valor):
+    # Tamanho de um array de limbs ou de uma tupla de arrays (tabela de ímpares)
+    if isinstance(valor, tuple):
+        return sum(v.itemsize * len(v) for v in valor)
+    return valor.itemsize * len(valor)
+
+
+def _proximoQuadrado(anterior, i, cache, chaveBase):
+    # A^(2^i) a partir de A^(2^(i-1)): no máximo um quadrado por bit. O cache só
+    # é consultado/abastecido aqui, nunca usado para refazer a cadeia de quadrados
+    if cache is None:
+        return quadradoLimbs(anterior)
+    chave = (chaveBase, "2^", i)
+    atual = cache.obter(chave)
+    if atual is None:
+        atual = quadradoLimbs(anterior)
+        cache.guardar(chave, atual)
+    return atual
+
+
+def potenciaBinaria(a, e, cache=None):
+    # Da direita para a esquerda: multiplica os A^(2^i) dos bits ligados de e
+    if e < 0:
+        raise ValueError("O expoente deve ser não negativo")
+    if e == 0:
+        return deInteiro(1)
+    chaveBase = a.tobytes() if cache is not None else None
+
+    resultado = None
+    quadradoAtual = a
+    for i in range(e.bit_length()):
+        if i > 0:
+            quadradoAtual = _proximoQuadrado(quadradoAtual, i, cache, chaveBase)
+        if (e >> i) & 1:
+            resultado = quadradoAtual if resultado is None else multiplicarLimbs(resultado, quadradoAtual)
+
+    # Com e potência de 2, o resultado é o próprio A ou um A^(2^i) do cache
+    return resultado[:] if resultado is quadradoAtual else resultado
+
+
+def tamanhoJanela(bits):
+    # Janela que equilibra a tabela (2^(w-1) produtos) com os produtos poupados
+    for w, limite in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 672)):
+        if bits <= limite:
+            return w
+    return 6
+
+
+def _tabelaImpares(a, w, cache, quadrado, multiplicar):
+    # (A, A^3, A^5, ..., A^(2^w - 1))
+    chave = (a.tobytes(), "impares", w) if cache is not None else None
+    if cache is not None:
+        tabela = cache.obter(chave)
+        if tabela is not None:
+            return tabela
+
+    tabela = [a]
+    if w > 1:
+        a2 = quadrado(a)
+        for _ in range((1 << (w - 1)) - 1):
+            tabela.append(multiplicar(tabela[-1], a2))
+    tabela = tuple(tabela)
+
+    if cache is not None:
+        cache.guardar(chave, tabela)
+    return tabela
+
+
+def potenciaJanela(a, e, w=None, cache=None, quadrado=quadradoLimbs, multiplicar=multiplicarLimbs):
+    # Da esquerda para a direita com janela deslizante de até w bits.
+    # quadrado/multiplicar podem ser trocados (ex.: versões modulares em divisao.py)
+    if e < 0:
+        raise ValueError("O expoente deve ser não negativo")
+    if e == 0:
+        return deInteiro(1)
+
+    w = w or tamanhoJanela(e.bit_length())
+    tabela = _tabelaImpares(a, w, cache, quadrado, multiplicar)
+
+    resultado = None
+    i = e.bit_length() - 1
+    while i >= 0:
+        if not (e >> i) & 1:
+            if resultado is not None:
+                resultado = quadrado(resultado)
+            i -= 1
+            continue
+
+        # Maior janela e[i..j] (até w bits) que termina em bit 1
+        j = max(i - w + 1, 0)
+        while not (e >> j) & 1:
+            j += 1
+        valor = (e >> j) & ((1 << (i - j + 1)) - 1)
+
+        if resultado is not None:
+            for _ in range(i - j + 1):
+                resultado = quadrado(resultado)
+            resultado = multiplicar(resultado, tabela[valor >> 1])
+        else:
+            resultado = tabela[valor >> 1]
+        i = j - 1
+
+    # Uma única janela devolve uma entrada da tabela (que pode estar no cache)
+    if any(resultado is t for t in tabela):
+        resultado = resultado[:]
+    return resultado
+
+
+METODOS = {
+    "binario": potenciaBinaria,
+    "janela": potenciaJanela,
+}
+
+
+def _separarSinal(A):
+    A = A.strip()
+    return A.startswith("-"), A.lstrip("+-")
+
+
+def quadrado(A):
+    _, A = _separarSinal(A)
+    return paraString(quadradoLimbs(paraLimbs(A)))
+
+
+def potencia(A, e, metodo="janela", cache=None):
+    # A^e com A string decimal (pode ser negativo) e e inteiro não negativo
+    negativo, A = _separarSinal(A)
+    resultado = paraString(METODOS[metodo](paraLimbs(A), e, cache=cache))
+    if negativo and e % 2 and resultado != "0":
+        resultado = "-" + resultado
+    return resultado
@@ -0,0 +1,256 @@
+"""
+benchmark.py
+
+Benchmark e verificação de complexidade dos motores do MaxMin.
+
+Para cada distribuição de entrada (ordenada, invertida, aleatória, todos
+iguais), cada tamanho de uma varredura geométrica e cada motor (recursive,
+iterative, vectorized, parallel):
+- gera a entrada com um gerador NumPy com seed fixa (random.Random sem NumPy);
+- faz execuções de aquecimento e coleta N amostras com time.perf_counter_ns;
+- mede o motor parallel sempre com o pool de processos (threshold=0 e pelo
+  menos 2 processos): sem isso, abaixo de parallel.PARALLEL_THRESHOLD ou com
+  um só processo ele cai no vetorizado serial e a coluna repetiria a do
+  motor vectorized;
+- confere min/max contra a referência e reporta mediana do tempo, vazão
+  (elementos por segundo) e comparações, junto com o mínimo teórico
+  ceil(3n/2) - 2 e a razão entre os dois.
+
+Os resultados podem ser exportados em CSV e/ou JSON para gráficos.
+
+Uso:
+  python benchmark.py
+  python benchmark.py --min 1000 --max 10000000 --factor 10 --samples 5 --csv resultados.csv
+  python benchmark.py --engines vectorized parallel --distributions random --json resultados.json
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from main import maxmin, maxmin_iterative
+from parallel import PARALLEL_THRESHOLD, maxmin_parallel
+from vectorized import CHUNK_SIZE, maxmin_vectorized
+
+DISTRIBUTIONS = ("sorted", "reversed", "random", "equal")
+
+# Colunas de cada linha de resultado (e do CSV)
+FIELDS = (
+    "engine", "distribution", "n", "workers", "median_ns", "p10_ns", "p90_ns",
+    "throughput_per_s", "comparisons", "optimal_comparisons", "comparisons_ratio",
+)
+
+# nome -> (função, precisa de lista Python?). Os motores recursivo e
+# iterativo recebem a lista já convertida (a conversão não entra no tempo)
+ENGINES: Dict[str, Tuple[Callable[..., Tuple[float, float, int]], bool]] = {
+    "recursive": (maxmin, True),
+    "iterative": (maxmin_iterative, True),
+    "vectorized": (maxmin_vectorized, False),
+    "parallel": (maxmin_parallel, False),
+}
+
+
+def generate(distribution: str, n: int, seed: int) -> Sequence[float]:
+    """Entrada de n float64 na distribuição pedida (ndarray, ou lista sem NumPy)."""
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        if distribution == "equal":
+            return np.full(n, rng.random())
+        values = rng.random(n)
+        if distribution == "sorted":
+            values.sort()
+        elif distribution == "reversed":
+            values.sort()
+            values = values[::-1].copy()
+        return values
+
+    rng = random.Random(seed)
+    if distribution == "equal":
+        return [rng.random()] * n
+    values = [rng.random() for _ in range(n)]
+    if distribution in ("sorted", "reversed"):
+        values.sort(reverse=distribution == "reversed")
+    return values
+
+
+def optimal_comparisons(n: int) -> int:
+    """Mínimo de comparações para achar min e max juntos: ceil(3n/2) - 2."""
+    return max(0, -(-3 * n // 2) - 2)
+
+
+def sweep_sizes(smallest: int, largest: int, factor: float) -> List[int]:
+    """Tamanhos smallest * factor^k (k = 0, 1, ...) até largest, sem repetições."""
+    steps = int(math.log(largest / smallest, factor) + 1e-9) + 1 if largest >= smallest else 0
+    return sorted({round(smallest * factor ** k) for k in range(steps)})
+
+
+def timing_summary(times: Sequence[int]) -> Dict[str, float]:
+    """Mediana e decis extremos (p10, p90) dos tempos em ns."""
+    if len(times) == 1:
+        deciles = [float(times[0])] * 9
+    else:
+        deciles = statistics.quantiles(times, n=10, method="inclusive")
+    return {"median_ns": statistics.median(times), "p10_ns": deciles[0], "p90_ns": deciles[-1]}
+
+
+def measure(
+    function: Callable[..., Tuple[float, float, int]], data: Sequence[float], samples: int, warmup: int, **options
+) -> Tuple[Tuple[float, float, int], List[int]]:
+    """Resultado da última execução e os tempos (ns) das amostras."""
+    result = None
+    for _ in range(warmup):
+        result = function(data, **options)
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        result = function(data, **options)
+        times.append(time.perf_counter_ns() - start)
+    return result, times
+
+
+def run(
+    engines: Sequence[str],
+    distributions: Sequence[str],
+    sizes: Sequence[int],
+    samples: int,
+    warmup: int,
+    seed: int,
+    workers: Optional[int] = None,
+    log: Callable[[str], None] = print,
+) -> List[dict]:
+    # Com um só processo o motor parallel cai no serial; com 1 CPU os 2
+    # processos dividem o mesmo núcleo, mas o pool continua sendo medido
+    parallel_workers = max(2, workers or os.cpu_count() or 1)
+    rows = []
+    for distribution in distributions:
+        for n in sizes:
+            data = generate(distribution, n, seed)
+            as_list = None
+            expected = (min(data), max(data)) if np is None else (data.min().item(), data.max().item())
+
+            for name in engines:
+                function, needs_list = ENGINES[name]
+                if needs_list:
+                    if as_list is None:
+                        as_list = data.tolist() if np is not None else list(data)
+                    engine_data = as_list
+                else:
+                    engine_data = data
+                # threshold=0: o pool de processos é medido em todos os tamanhos
+                options = {"workers": parallel_workers, "threshold": 0} if name == "parallel" else {}
+
+                (minimum, maximum, comparisons), times = measure(function, engine_data, samples, warmup, **options)
+                if (minimum, maximum) != expected:
+                    raise AssertionError(f"{name} errou em {distribution}/{n}: {(minimum, maximum)} != {expected}")
+
+                timing = timing_summary(times)
+                median_ns = timing["median_ns"]
+                optimal = optimal_comparisons(n)
+                row = {
+                    "engine": name,
+                    "distribution": distribution,
+                    "n": n,
+                    "workers": options.get("workers", 1),
+                    **timing,
+                    "throughput_per_s": n / (median_ns / 1e9) if median_ns else math.inf,
+                    "comparisons": comparisons,
+                    "optimal_comparisons": optimal,
+                    "comparisons_ratio": comparisons / optimal if optimal else 1.0,
+                }
+                rows.append(row)
+                log(
+                    f"{name:>10} {distribution:>8} {n:>11}  mediana {median_ns / 1e6:10.3f} ms"
+                    f"  {row['throughput_per_s'] / 1e6:9.2f} M/s  comparações {comparisons:>11}"
+                    f" ({row['comparisons_ratio']:.3f} x ceil(3n/2)-2)"
+                )
+    return rows
+
+
+def save_csv(rows: Sequence[dict], path: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def save_json(rows: Sequence[dict], config: dict, path: str) -> None:
+    """
+    Resultados e configuração da varredura, com o que muda os números entre
+    máquinas: CPUs disponíveis para o motor parallel, NumPy (motor
+    vectorized) e os tamanhos de bloco dos motores.
+    """
+    config = dict(config, chunk_size=CHUNK_SIZE, parallel_threshold=PARALLEL_THRESHOLD, parallel_forced=True)
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+        "cpus": os.cpu_count(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": config,
+        "results": list(rows),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Benchmark dos motores do MaxMin")
+    p.add_argument("--engines", "-e", nargs="+", choices=list(ENGINES), default=list(ENGINES), help="motores medidos")
+    p.add_argument(
+        "--distributions", "-d", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS), help="entradas"
+    )
+    p.add_argument("--min", type=int, default=1000, help="menor tamanho")
+    p.add_argument("--max", type=int, default=1000000, help="maior tamanho")
+    p.add_argument("--factor", type=float, default=10.0, help="razão da varredura geométrica")
+    p.add_argument("--samples", "-n", type=int, default=5, help="amostras por medição")
+    p.add_argument("--warmup", type=int, default=1, help="execuções descartadas antes das amostras")
+    p.add_argument("--seed", type=int, default=0, help="seed do gerador de entradas")
+    p.add_argument(
+        "--workers", "-w", type=int, default=None, help="processos do motor parallel (padrão: CPUs, no mínimo 2)"
+    )
+    p.add_argument("--csv", metavar="ARQUIVO", help="exporta os resultados em CSV")
+    p.add_argument("--json", metavar="ARQUIVO", help="exporta os resultados em JSON")
+    return p.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.min <= 0 or args.factor <= 1 or args.samples <= 0 or args.warmup < 0:
+        print("--min e --samples devem ser positivos, --warmup não negativo e --factor maior que 1")
+        return 1
+    if args.max < args.min:
+        print("--max não pode ser menor que --min")
+        return 1
+    if args.workers is not None and args.workers < 2:
+        print("--workers deve ser pelo menos 2 (com 1 processo o motor parallel é o serial)")
+        return 1
+
+    sizes = sweep_sizes(args.min, args.max, args.factor)
+    rows = run(args.engines, args.distributions, sizes, args.samples, args.warmup, args.seed, args.workers)
+
+    config = {k: v for k, v in vars(args).items() if k not in ("csv", "json")}
+    if args.csv:
+        save_csv(rows, args.csv)
+        print(f"CSV salvo em: {args.csv}")
+    if args.json:
+        save_json(rows, config, args.json)
+        print(f"JSON salvo em: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
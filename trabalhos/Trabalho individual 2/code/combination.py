@@ -0,0 +1,58 @@
+"""
+combination.py
+
+Passo de combinação da divisão e conquista do MaxMin, compartilhado pelo
+motor recursivo (`main.py`) e pelos motores que reduzem blocos por conta
+própria e só juntam os resultados parciais (`vectorized.py`,
+`parallel.py`, `ranges.py`).
+"""
+
+from typing import Sequence, Tuple
+
+
+def combine(
+    left_result: Tuple[float, float, int], right_result: Tuple[float, float, int]
+) -> Tuple[float, float, int]:
+    """
+    Passo de combinação da divisão e conquista: junta os resultados
+    (min, max, comparações) de dois segmentos com 2 comparações.
+    """
+    min1, max1, c1 = left_result
+    min2, max2, c2 = right_result
+
+    comparisons = c1 + c2
+
+    # Combinar: 1 comparação para os máximos e 1 para os mínimos
+    # comparar máximos
+    comparisons += 1
+    if max1 >= max2:
+        overall_max = max1
+    else:
+        overall_max = max2
+
+    # comparar mínimos
+    comparisons += 1
+    if min1 <= min2:
+        overall_min = min1
+    else:
+        overall_min = min2
+
+    return overall_min, overall_max, comparisons
+
+
+def combine_all(parts: Sequence[Tuple[float, float, int]]) -> Tuple[float, float, int]:
+    """
+    Combina os resultados parciais de segmentos consecutivos (por exemplo,
+    blocos reduzidos por outro motor) dividindo a lista ao meio e aplicando
+    `combine` em cada junção, como na recursão de `maxmin_divide_conquer`.
+    """
+    if not parts:
+        raise ValueError("A sequência não pode ser vazia")
+
+    def merge(left: int, right: int) -> Tuple[float, float, int]:
+        if left == right:
+            return parts[left]
+        mid = (left + right) // 2
+        return combine(merge(left, mid), merge(mid + 1, right))
+
+    return merge(0, len(parts) - 1)
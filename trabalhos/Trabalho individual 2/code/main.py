@@ -1,7 +1,10 @@
 import argparse
 import random
 import sys
-from typing import List, Tuple
+from itertools import zip_longest
+from typing import Iterable, List, Sequence, Tuple
+
+from combination import combine
 
 
 def maxmin_divide_conquer(arr: List[float], left: int, right: int) -> Tuple[float, float, int]:
@@ -31,27 +34,10 @@ def maxmin_divide_conquer(arr: List[float], left: int, right: int) -> Tuple[floa
     # Caso geral: dividir em duas metades
     mid = (left + right) // 2
 
-    min1, max1, c1 = maxmin_divide_conquer(arr, left, mid)
-    min2, max2, c2 = maxmin_divide_conquer(arr, mid + 1, right)
-
-    comparisons = c1 + c2
-
-    # Combinar: 1 comparação para os máximos e 1 para os mínimos
-    # comparar máximos
-    comparisons += 1
-    if max1 >= max2:
-        overall_max = max1
-    else:
-        overall_max = max2
-
-    # comparar mínimos
-    comparisons += 1
-    if min1 <= min2:
-        overall_min = min1
-    else:
-        overall_min = min2
+    left_result = maxmin_divide_conquer(arr, left, mid)
+    right_result = maxmin_divide_conquer(arr, mid + 1, right)
 
-    return overall_min, overall_max, comparisons
+    return combine(left_result, right_result)
 
 
 def maxmin(arr: List[float]) -> Tuple[float, float, int]:
@@ -65,17 +51,228 @@ def maxmin(arr: List[float]) -> Tuple[float, float, int]:
     return maxmin_divide_conquer(arr, 0, n - 1)
 
 
+def maxmin_iterative(values: Iterable[float]) -> Tuple[float, float, int]:
+    """
+    Versão iterativa por pares: retorna (min, max, comparações) como `maxmin`,
+    mas em uma única passada, sem recursão e com memória constante, então
+    aceita qualquer iterável (geradores, arquivos, sequências sem fim
+    conhecido).
+
+    Os dois primeiros elementos custam 1 comparação; depois, cada par
+    custa 3 (uma entre os dois e uma contra o mínimo e outra contra o
+    máximo), e um elemento sobrando no fim custa 2. Total: ceil(3n/2) - 2
+    comparações, o ótimo para o problema.
+    """
+    it = iter(values)
+    missing = object()
+
+    first = next(it, missing)
+    if first is missing:
+        raise ValueError("A sequência não pode ser vazia")
+    second = next(it, missing)
+    if second is missing:
+        return first, first, 0
+
+    comparisons = 1
+    if first <= second:
+        overall_min, overall_max = first, second
+    else:
+        overall_min, overall_max = second, first
+
+    for a, b in zip_longest(it, it, fillvalue=missing):
+        if b is missing:
+            # elemento sobrando: compara com o mínimo e com o máximo
+            comparisons += 2
+            if a < overall_min:
+                overall_min = a
+            if a > overall_max:
+                overall_max = a
+            break
+
+        # 1 comparação dentro do par, 1 com o mínimo e 1 com o máximo
+        comparisons += 3
+        if a > b:
+            a, b = b, a
+        if a < overall_min:
+            overall_min = a
+        if b > overall_max:
+            overall_max = b
+
+    return overall_min, overall_max, comparisons
+
+
+ENGINES = ("recursive", "iterative", "vectorized", "parallel")
+
+
+def run_engine(engine: str, arr: Sequence[float], **options) -> Tuple[float, float, int]:
+    """
+    Executa o motor escolhido na linha de comando; `options` (workers,
+    slice_size) só valem para o motor paralelo.
+    """
+    if engine == "parallel":
+        from parallel import maxmin_parallel
+
+        return maxmin_parallel(arr, **options)
+    if engine == "vectorized":
+        from vectorized import maxmin_vectorized
+
+        return maxmin_vectorized(arr)
+    if engine == "iterative":
+        return maxmin_iterative(arr)
+    return maxmin(arr)
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="MaxMin Select (divisão e conquista)")
     p.add_argument("values", nargs="*", help="lista de números (ex: 3 1 4 2)")
     p.add_argument("--random", "-r", type=int, help="gera n números aleatórios")
     p.add_argument("--seed", type=int, default=None, help="seed para gerador aleatório")
+    p.add_argument(
+        "--file",
+        "-f",
+        metavar="ARQUIVO",
+        help="lê números em texto de um arquivo, em blocos ('-' para stdin)",
+    )
+    p.add_argument(
+        "--binary",
+        "-b",
+        metavar="ARQUIVO",
+        help="mapeia em memória um arquivo binário bruto (ver --dtype)",
+    )
+    p.add_argument("--dtype", choices=("float64", "int64"), default="float64", help="tipo dos valores de --binary")
+    p.add_argument(
+        "--engine",
+        "-e",
+        choices=ENGINES,
+        default=None,
+        help="motor usado: recursive (divisão e conquista), iterative (pares, uma passada) "
+        "vectorized (blocos NumPy/array('d')) ou parallel (vários processos); padrão: recursive "
+        "para valores em memória, iterative para --file e vectorized para --binary",
+    )
+    p.add_argument("--workers", "-w", type=int, default=None, help="processos do motor parallel (padrão: CPUs)")
+    p.add_argument(
+        "--slice-size",
+        type=int,
+        default=None,
+        help="elementos por fatia no motor parallel (padrão: divide em 4 fatias por processo)",
+    )
+    p.add_argument(
+        "--print-sequence",
+        "-p",
+        action="store_true",
+        help="imprime a sequência inteira antes do resultado (lento para entradas grandes)",
+    )
+    p.add_argument(
+        "--quantile",
+        "-q",
+        type=float,
+        nargs="+",
+        metavar="Q",
+        help="também calcula os quantis Q (entre 0 e 1, ex: 0.5 0.99) por seleção, sem ordenar",
+    )
+    p.add_argument("--top", "-k", type=int, metavar="K", help="também lista os K maiores valores")
     return p.parse_args()
 
 
+def engine_options(args: argparse.Namespace) -> dict:
+    if args.engine != "parallel":
+        return {}
+    return {"workers": args.workers, "slice_size": args.slice_size}
+
+
+def wants_statistics(args: argparse.Namespace) -> bool:
+    return bool(args.quantile or args.top)
+
+
+def print_statistics(args: argparse.Namespace, values: Sequence[float]) -> None:
+    """Quantis (--quantile) e top-k (--top), com as comparações de cada um."""
+    from selection import quantiles, top_k
+
+    if args.quantile:
+        results, comps = quantiles(values, args.quantile)
+        for q, value in zip(args.quantile, results):
+            print(f"Quantil {q:g}: {value}")
+        print(f"Comparações (quantis): {comps}")
+    if args.top:
+        largest, comps = top_k(values, args.top)
+        print(f"Top {args.top}: {largest}")
+        print(f"Comparações (top-{args.top}): {comps}")
+
+
+def run_stream(args: argparse.Namespace) -> None:
+    """
+    Processa --file/--binary sem montar a lista em memória: o modo texto é
+    consumido em blocos e o binário é reduzido direto sobre o mmap. A lista
+    só é montada quando pedida (--print-sequence, motor recursivo ou
+    estatísticas, que precisam de uma segunda passada).
+    """
+    from streaming import iter_text_chunks, iter_text_values, open_binary, open_text
+
+    if args.binary:
+        with open_binary(args.binary, args.dtype) as values:
+            if args.print_sequence:
+                print("Sequência:", values.tolist())
+            print_result(*run_engine(args.engine or "vectorized", values, **engine_options(args)))
+            if wants_statistics(args):
+                # tolist() (ndarray e memoryview) entrega escalares Python
+                print_statistics(args, values.tolist())
+        return
+
+    engine = args.engine or "iterative"
+    with open_text(args.file) as stream:
+        if args.print_sequence or engine == "recursive" or wants_statistics(args):
+            arr = list(iter_text_values(stream))
+            if args.print_sequence:
+                print("Sequência:", arr)
+            print_result(*run_engine(engine, arr, **engine_options(args)))
+            if wants_statistics(args):
+                print_statistics(args, arr)
+            return
+        if engine == "parallel":
+            # O motor paralelo divide um buffer só entre os processos: os
+            # blocos lidos são juntados num array('d') (8 bytes por valor)
+            from array import array
+
+            from parallel import maxmin_parallel
+
+            values = array("d")
+            for chunk in iter_text_chunks(stream):
+                values.extend(chunk)
+            if not values:
+                raise ValueError("A sequência não pode ser vazia")
+            print_result(*maxmin_parallel(values, **engine_options(args)))
+        elif engine == "vectorized":
+            from vectorized import maxmin_chunks
+
+            print_result(*maxmin_chunks(iter_text_chunks(stream)))
+        else:
+            print_result(*maxmin_iterative(iter_text_values(stream)))
+
+
+def print_result(minimum: float, maximum: float, comps: int) -> None:
+    print(f"Menor: {minimum}")
+    print(f"Maior: {maximum}")
+    print(f"Comparações realizadas: {comps}")
+
+
 def main() -> int:
     args = parse_args()
 
+    if args.quantile and not all(0 <= q <= 1 for q in args.quantile):
+        print("--quantile deve receber valores entre 0 e 1")
+        return 1
+    if args.top is not None and args.top <= 0:
+        print("--top deve ser um inteiro positivo")
+        return 1
+
+    if args.file or args.binary:
+        try:
+            run_stream(args)
+        except (OSError, ValueError) as e:
+            print(e)
+            return 1
+        return 0
+
     if args.random is not None:
         if args.random <= 0:
             print("--random deve ser um inteiro positivo")
@@ -91,19 +288,24 @@ def main() -> int:
             return 1
     else:
         # leitura interativa se nenhum argumento for passado
-        print("Forneça números como argumentos ou use --random N. Exemplo: python3 main.py 3 1 4 2")
+        print(
+            "Forneça números como argumentos, use --random N, --file ARQUIVO ou --binary ARQUIVO. "
+            "Exemplo: python3 main.py 3 1 4 2"
+        )
         return 0
 
-    print("Sequência:", arr)
-    minimum, maximum, comps = maxmin(arr)
-    print(f"Menor: {minimum}")
-    print(f"Maior: {maximum}")
-    print(f"Comparações realizadas: {comps}")
+    if args.print_sequence:
+        print("Sequência:", arr)
+    minimum, maximum, comps = run_engine(args.engine or "recursive", arr, **engine_options(args))
+    print_result(minimum, maximum, comps)
 
     # Verificação simples (checar com min()/max() do Python)
     assert minimum == min(arr), "Min incorrect"
     assert maximum == max(arr), "Max incorrect"
 
+    if wants_statistics(args):
+        print_statistics(args, arr)
+
     return 0
 
 
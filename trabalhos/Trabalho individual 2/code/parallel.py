@@ -0,0 +1,146 @@
+"""
+parallel.py
+
+MaxMin em vários núcleos. Os dados vão uma única vez para um bloco de
+`multiprocessing.shared_memory` (ou, se já vierem de um np.memmap, cada
+processo mapeia o mesmo arquivo); cada trabalhador de um pool de processos
+reduz a sua fatia com o motor vetorizado e devolve só o triplo
+(min, max, comparações). Os triplos são juntados com `combination.combine_all`.
+
+As fatias são segmentos da própria recursão de `maxmin_divide_conquer`
+(`vectorized.chunk_bounds`), então a contagem de comparações é a mesma do
+motor recursivo. Entradas pequenas (menos de PARALLEL_THRESHOLD elementos)
+ou com um único trabalhador caem no motor vetorizado serial, onde criar
+processos custaria mais que a varredura.
+"""
+
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from combination import combine_all
+from vectorized import as_vector, chunk_bounds, maxmin_vectorized
+
+# Abaixo disso (em elementos) o modo paralelo usa o motor serial
+PARALLEL_THRESHOLD = 1 << 22
+
+# Fatias por trabalhador quando slice_size não é informado (equilibra a carga)
+SLICES_PER_WORKER = 4
+
+# Onde o trabalhador encontra os dados: ("shm", nome, dtype, n) ou
+# ("file", caminho, dtype, offset, n)
+Source = Tuple
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Quem cria e remove o bloco é o processo principal: no trabalhador o
+    # bloco não pode ser registrado no rastreador de recursos, senão ele é
+    # removido (ou o registro é desfeito) quando o trabalhador termina
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 não tem track
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _reduce_slice(source: Source, start: int, stop: int) -> Tuple[float, float, int]:
+    """Executa no processo trabalhador: reduz source[start:stop]."""
+    if source[0] == "file":
+        _, path, dtype, offset, n = source
+        values = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(n,))
+        return maxmin_vectorized(values[start:stop])
+
+    _, name, dtype, n = source
+    shm = _attach(name)
+    try:
+        if np is not None:
+            values = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+            return maxmin_vectorized(values[start:stop])
+        view = shm.buf.cast(dtype)
+        try:
+            return maxmin_vectorized(view[start:stop])
+        finally:
+            view.release()
+    finally:
+        # Solta a view do NumPy antes de fechar o bloco
+        values = None
+        shm.close()
+
+
+def _to_buffer(data: Sequence[float]):
+    # Dados num formato com buffer contíguo: ndarray ou array('q'/'d')
+    if np is not None:
+        return np.ascontiguousarray(as_vector(data))
+    if isinstance(data, (array, memoryview)):
+        return data
+    try:
+        return array("q", data)
+    except (TypeError, OverflowError):
+        return array("d", data)
+
+
+def _share(buffer) -> Tuple[shared_memory.SharedMemory, Source]:
+    # Copia os dados uma vez para um bloco de memória compartilhada
+    if np is not None:
+        shm = shared_memory.SharedMemory(create=True, size=max(buffer.nbytes, 1))
+        np.ndarray(buffer.shape, dtype=buffer.dtype, buffer=shm.buf)[:] = buffer
+        return shm, ("shm", shm.name, buffer.dtype.str, len(buffer))
+
+    raw = memoryview(buffer).cast("B")
+    shm = shared_memory.SharedMemory(create=True, size=max(len(raw), 1))
+    shm.buf[:len(raw)] = raw
+    return shm, ("shm", shm.name, memoryview(buffer).format, len(buffer))
+
+
+def maxmin_parallel(
+    data: Sequence[float],
+    workers: Optional[int] = None,
+    slice_size: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> Tuple[float, float, int]:
+    """
+    Mesmo resultado (min, max, comparações) de `maxmin`, com as fatias
+    reduzidas em paralelo por `workers` processos (padrão: número de CPUs).
+    `slice_size` é o tamanho máximo de cada fatia em elementos.
+    """
+    n = len(data)
+    if n == 0:
+        raise ValueError("A sequência não pode ser vazia")
+    workers = workers or os.cpu_count() or 1
+    if n < threshold or workers <= 1:
+        return maxmin_vectorized(data)
+
+    slice_size = slice_size or -(-n // (workers * SLICES_PER_WORKER))
+    bounds = chunk_bounds(n, slice_size)
+
+    shm = None
+    if np is not None and isinstance(data, np.memmap) and isinstance(data.base, mmap.mmap) and data.ndim == 1:
+        # np.memmap do arquivo inteiro (não uma fatia dele, cujo offset não
+        # acompanha o recorte): os trabalhadores mapeiam o mesmo arquivo
+        source = ("file", data.filename, data.dtype.str, data.offset, n)
+    else:
+        shm, source = _share(_to_buffer(data))
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+            futures = [pool.submit(_reduce_slice, source, start, stop) for start, stop in bounds]
+            parts = [f.result() for f in futures]
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    return combine_all(parts)
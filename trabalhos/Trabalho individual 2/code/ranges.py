@@ -0,0 +1,220 @@
+"""
+ranges.py
+
+Índices para consultas repetidas de mínimo/máximo em subintervalos, em vez
+de chamar `maxmin` de novo a cada consulta:
+
+- SparseTable: pré-processamento O(n log n), consulta O(1) para dados
+  estáticos. Cada nível j guarda o (min, max) dos blocos de 2^j elementos;
+  um intervalo qualquer é coberto por dois blocos (que podem se sobrepor) e
+  juntado com o mesmo `combine` da divisão e conquista.
+- SegmentTree: árvore de segmentos iterativa, com atualização de um ponto e
+  consulta de intervalo em O(log n).
+- SlidingWindow / sliding_window_maxmin: min/max de uma janela deslizante
+  sobre uma série temporal com deques monotônicos, O(1) amortizado por
+  ponto e memória O(janela).
+
+Como em `maxmin_divide_conquer`, os intervalos são [left, right] com os dois
+extremos inclusos. As consultas de intervalo retornam (min, max, comparações).
+"""
+
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from combination import combine
+
+
+def _check_range(n: int, left: int, right: int) -> None:
+    if not 0 <= left <= right < n:
+        raise IndexError(f"Intervalo inválido [{left}, {right}] para {n} elementos")
+
+
+class SparseTable:
+    """
+    Tabela esparsa de mínimos e máximos para consultas O(1) sobre dados que
+    não mudam. Com NumPy, cada nível é montado de forma vetorizada e
+    `query_many` responde lotes de consultas de uma vez.
+    """
+
+    def __init__(self, values: Sequence[float]):
+        self.n = len(values)
+        if self.n == 0:
+            raise ValueError("A sequência não pode ser vazia")
+
+        if np is not None:
+            base = np.asarray(values)
+            self.mins = [base]
+            self.maxs = [base]
+        else:
+            self.mins = [list(values)]
+            self.maxs = [self.mins[0]]
+
+        # Nível j: blocos [i, i + 2^j) montados com dois blocos do nível j - 1
+        half = 1
+        while 2 * half <= self.n:
+            prev_min, prev_max = self.mins[-1], self.maxs[-1]
+            size = len(prev_min) - half
+            if np is not None:
+                self.mins.append(np.minimum(prev_min[:size], prev_min[half:]))
+                self.maxs.append(np.maximum(prev_max[:size], prev_max[half:]))
+            else:
+                self.mins.append(list(map(min, prev_min[:size], prev_min[half:])))
+                self.maxs.append(list(map(max, prev_max[:size], prev_max[half:])))
+            half *= 2
+
+    def __len__(self) -> int:
+        return self.n
+
+    def query(self, left: int, right: int) -> Tuple[float, float, int]:
+        """(min, max, comparações) de values[left..right]; sempre 2 comparações (ou 0)."""
+        _check_range(self.n, left, right)
+        j = (right - left + 1).bit_length() - 1
+        other = right - (1 << j) + 1
+        mins, maxs = self.mins[j], self.maxs[j]
+        first = (mins[left], maxs[left], 0)
+        if other == left:
+            result = first
+        else:
+            result = combine(first, (mins[other], maxs[other], 0))
+        if np is not None:
+            return result[0].item(), result[1].item(), result[2]
+        return result
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> Tuple[Sequence[float], Sequence[float]]:
+        """
+        Mínimos e máximos de vários intervalos [lefts[i], rights[i]] de uma
+        vez (vetorizado com NumPy; sem ele, uma consulta por vez).
+        """
+        if np is None:
+            results = [self.query(left, right) for left, right in zip(lefts, rights)]
+            return [r[0] for r in results], [r[1] for r in results]
+
+        lefts = np.asarray(lefts, dtype=np.int64)
+        rights = np.asarray(rights, dtype=np.int64)
+        if lefts.shape != rights.shape:
+            raise ValueError("lefts e rights devem ter o mesmo tamanho")
+        if len(lefts) and (lefts.min() < 0 or rights.max() >= self.n or (lefts > rights).any()):
+            raise IndexError("Intervalo inválido em query_many")
+
+        levels = np.zeros(len(lefts), dtype=np.int64)
+        lengths = rights - lefts + 1
+        # floor(log2(tamanho)) sem passar por float
+        for j in range(1, len(self.mins)):
+            levels[lengths >= (1 << j)] = j
+        others = rights - (1 << levels) + 1
+
+        mins = np.empty(len(lefts), dtype=self.mins[0].dtype)
+        maxs = np.empty(len(lefts), dtype=self.maxs[0].dtype)
+        for j in np.unique(levels):
+            mask = levels == j
+            mins[mask] = np.minimum(self.mins[j][lefts[mask]], self.mins[j][others[mask]])
+            maxs[mask] = np.maximum(self.maxs[j][lefts[mask]], self.maxs[j][others[mask]])
+        return mins, maxs
+
+
+class SegmentTree:
+    """
+    Árvore de segmentos (iterativa, 2n nós) com o (min, max) de cada nó.
+    `update` troca um valor e refaz o caminho até a raiz; `query` junta os
+    O(log n) nós que cobrem o intervalo com `combine`.
+    """
+
+    def __init__(self, values: Sequence[float]):
+        self.n = len(values)
+        if self.n == 0:
+            raise ValueError("A sequência não pode ser vazia")
+        n = self.n
+        self.mins: List[float] = [0] * n + list(values)
+        self.maxs: List[float] = self.mins[:]
+        for i in range(n - 1, 0, -1):
+            self._pull(i)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _pull(self, i: int) -> None:
+        a, b = 2 * i, 2 * i + 1
+        self.mins[i] = self.mins[a] if self.mins[a] <= self.mins[b] else self.mins[b]
+        self.maxs[i] = self.maxs[a] if self.maxs[a] >= self.maxs[b] else self.maxs[b]
+
+    def update(self, index: int, value: float) -> None:
+        """Troca values[index] por value em O(log n)."""
+        if not 0 <= index < self.n:
+            raise IndexError(f"Índice inválido {index} para {self.n} elementos")
+        i = index + self.n
+        self.mins[i] = self.maxs[i] = value
+        i //= 2
+        while i:
+            self._pull(i)
+            i //= 2
+
+    def query(self, left: int, right: int) -> Tuple[float, float, int]:
+        """(min, max, comparações) de values[left..right] em O(log n)."""
+        _check_range(self.n, left, right)
+        result: Optional[Tuple[float, float, int]] = None
+        lo, hi = left + self.n, right + self.n + 1
+        while lo < hi:
+            if lo & 1:
+                node = (self.mins[lo], self.maxs[lo], 0)
+                result = node if result is None else combine(result, node)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                node = (self.mins[hi], self.maxs[hi], 0)
+                result = node if result is None else combine(result, node)
+            lo //= 2
+            hi //= 2
+        return result
+
+
+class SlidingWindow:
+    """
+    Min/max dos últimos `window` valores de uma série que chega um ponto
+    por vez. Os deques guardam (posição, valor) em ordem monotônica: quem
+    nunca mais pode ser o mínimo (ou o máximo) da janela é descartado.
+    """
+
+    def __init__(self, window: int):
+        if window <= 0:
+            raise ValueError("window deve ser positivo")
+        self.window = window
+        self.count = 0
+        self._mins: deque = deque()
+        self._maxs: deque = deque()
+
+    def push(self, value: float) -> Tuple[float, float]:
+        """Adiciona um ponto e retorna o (min, max) da janela que termina nele."""
+        i = self.count
+        self.count += 1
+
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((i, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((i, value))
+
+        # Remove o que saiu pela esquerda da janela
+        start = i - self.window + 1
+        if self._mins[0][0] < start:
+            self._mins.popleft()
+        if self._maxs[0][0] < start:
+            self._maxs.popleft()
+        return self._mins[0][1], self._maxs[0][1]
+
+
+def sliding_window_maxmin(values: Iterable[float], window: int) -> Iterator[Tuple[float, float]]:
+    """
+    Gera o (min, max) de cada janela completa de `window` valores
+    consecutivos (len(values) - window + 1 janelas), em uma passada.
+    """
+    sliding = SlidingWindow(window)
+    for i, value in enumerate(values):
+        result = sliding.push(value)
+        if i >= window - 1:
+            yield result
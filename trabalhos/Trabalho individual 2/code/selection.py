@@ -0,0 +1,278 @@
+"""
+selection.py
+
+Estatísticas de ordem além do mínimo e do máximo, no mesmo espírito de
+divisão e conquista do MaxMin e sem ordenar a sequência inteira:
+
+- introselect: k-ésimo menor elemento. Usa pivô mediana-de-três e, depois
+  de toda partição que não reduz o problema a no máximo 3/4 do tamanho, faz
+  a próxima com a mediana das medianas (grupos de 5). Assim cada duas
+  partições encolhem o problema por um fator constante, o que garante O(n)
+  no pior caso sem pagar a mediana das medianas nas entradas comuns.
+- multiselect / quantiles: vários postos de uma vez, numa única recursão
+  de particionamento: cada partição manda para cada lado só os postos que
+  caem nele, e um posto que cai no bloco do pivô já está resolvido.
+- top_k: os k maiores com um heap mínimo de tamanho k, em uma passada
+  sobre qualquer iterável (O(n log k)).
+
+Como `maxmin`, todas retornam também o número de comparações entre
+elementos. A entrada não é modificada (as seleções trabalham numa cópia).
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+# Segmentos até esse tamanho são resolvidos por ordenação por inserção
+SMALL = 16
+
+
+def _insertion_sort(a: List[float], lo: int, hi: int) -> int:
+    """Ordena a[lo:hi] no lugar; retorna as comparações."""
+    comparisons = 0
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i - 1
+        while j >= lo:
+            comparisons += 1
+            if a[j] <= x:
+                break
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+    return comparisons
+
+
+def _median_of_three(a: List[float], i: int, j: int, k: int) -> Tuple[float, int]:
+    x, y, z = a[i], a[j], a[k]
+    if x <= y:
+        if y <= z:
+            return y, 2
+        if x <= z:
+            return z, 3
+        return x, 3
+    if x <= z:
+        return x, 2
+    if y <= z:
+        return z, 3
+    return y, 3
+
+
+def _median_of_medians(a: List[float], lo: int, hi: int) -> Tuple[float, int]:
+    """
+    Pivô garantido: medianas dos grupos de 5 de a[lo:hi] e, recursivamente,
+    a mediana delas. Ao menos ~30% dos elementos ficam de cada lado.
+    """
+    comparisons = 0
+    medians = []
+    for start in range(lo, hi, 5):
+        stop = min(start + 5, hi)
+        comparisons += _insertion_sort(a, start, stop)
+        medians.append(a[(start + stop - 1) // 2])
+    pivot, c = _select(medians, 0, len(medians), len(medians) // 2, True)
+    return pivot, comparisons + c
+
+
+def _choose_pivot(a: List[float], lo: int, hi: int, guaranteed: bool) -> Tuple[float, int]:
+    if guaranteed:
+        return _median_of_medians(a, lo, hi)
+    return _median_of_three(a, lo, (lo + hi) // 2, hi - 1)
+
+
+def _partition(a: List[float], lo: int, hi: int, pivot: float) -> Tuple[int, int, int]:
+    """
+    Partição em três (menores | iguais | maiores) de a[lo:hi] no lugar.
+    Retorna (lt, gt, comparações): os iguais ao pivô ficam em a[lt:gt].
+    """
+    comparisons = 0
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = a[i]
+        comparisons += 1
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+            continue
+        comparisons += 1
+        if x > pivot:
+            gt -= 1
+            a[i], a[gt] = a[gt], x
+        else:
+            i += 1
+    return lt, gt, comparisons
+
+
+def _shrank(old_size: int, new_size: int) -> bool:
+    # A partição foi boa o bastante para continuar com mediana-de-três?
+    return 4 * new_size <= 3 * old_size
+
+
+def _select(a: List[float], lo: int, hi: int, k: int, guaranteed: bool = False) -> Tuple[float, int]:
+    """
+    k-ésimo menor de a[lo:hi] (k absoluto em a), reorganizando a.
+    `guaranteed` pede a mediana das medianas para o próximo pivô.
+    """
+    comparisons = 0
+    while hi - lo > SMALL:
+        size = hi - lo
+        pivot, c = _choose_pivot(a, lo, hi, guaranteed)
+        lt, gt, c2 = _partition(a, lo, hi, pivot)
+        comparisons += c + c2
+
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return pivot, comparisons
+        guaranteed = not _shrank(size, hi - lo)
+
+    comparisons += _insertion_sort(a, lo, hi)
+    return a[k], comparisons
+
+
+def _multiselect(a: List[float], lo: int, hi: int, ranks: List[int], guaranteed: bool) -> int:
+    """
+    Deixa em a[r] o r-ésimo menor para cada r de `ranks` (ordenados, todos
+    em [lo, hi)); retorna as comparações.
+    """
+    if not ranks:
+        return 0
+    if hi - lo <= SMALL:
+        return _insertion_sort(a, lo, hi)
+    if len(ranks) == 1:
+        return _select(a, lo, hi, ranks[0], guaranteed)[1]
+
+    size = hi - lo
+    pivot, c = _choose_pivot(a, lo, hi, guaranteed)
+    lt, gt, c2 = _partition(a, lo, hi, pivot)
+    comparisons = c + c2
+
+    left = [r for r in ranks if r < lt]
+    right = [r for r in ranks if r >= gt]
+    comparisons += _multiselect(a, lo, lt, left, not _shrank(size, lt - lo))
+    comparisons += _multiselect(a, gt, hi, right, not _shrank(size, hi - gt))
+    return comparisons
+
+
+def _as_list(arr: Sequence[float]) -> List[float]:
+    values = list(arr)
+    if not values:
+        raise ValueError("A sequência não pode ser vazia")
+    return values
+
+
+def introselect(arr: Sequence[float], k: int) -> Tuple[float, int]:
+    """
+    k-ésimo menor elemento (k a partir de 0) e as comparações feitas.
+    O(n) no pior caso.
+    """
+    a = _as_list(arr)
+    if not 0 <= k < len(a):
+        raise ValueError(f"k deve estar entre 0 e {len(a) - 1}")
+    return _select(a, 0, len(a), k)
+
+
+def multiselect(arr: Sequence[float], ranks: Sequence[int]) -> Tuple[List[float], int]:
+    """
+    Elementos de posto `ranks` (a partir de 0, na ordem pedida) e as
+    comparações, com uma única recursão de particionamento.
+    """
+    a = _as_list(arr)
+    n = len(a)
+    for r in ranks:
+        if not 0 <= r < n:
+            raise ValueError(f"Posto deve estar entre 0 e {n - 1}: {r}")
+    comparisons = _multiselect(a, 0, n, sorted(set(ranks)), False)
+    return [a[r] for r in ranks], comparisons
+
+
+def quantiles(arr: Sequence[float], qs: Sequence[float]) -> Tuple[List[float], int]:
+    """
+    Quantis `qs` (entre 0 e 1) com interpolação linear entre os postos
+    vizinhos (como o padrão de numpy.quantile) e as comparações.
+    """
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantil deve estar entre 0 e 1: {q}")
+    a = _as_list(arr)
+    n = len(a)
+
+    positions = [q * (n - 1) for q in qs]
+    ranks = sorted({int(p) for p in positions} | {min(int(p) + 1, n - 1) for p in positions if p != int(p)})
+    comparisons = _multiselect(a, 0, n, ranks, False)
+
+    result = []
+    for p in positions:
+        below = int(p)
+        if p == below:
+            result.append(a[below])
+        else:
+            result.append(a[below] + (a[below + 1] - a[below]) * (p - below))
+    return result, comparisons
+
+
+def _sift_up(heap: List[float], i: int) -> int:
+    comparisons = 0
+    while i > 0:
+        parent = (i - 1) // 2
+        comparisons += 1
+        if not heap[i] < heap[parent]:
+            break
+        heap[i], heap[parent] = heap[parent], heap[i]
+        i = parent
+    return comparisons
+
+
+def _sift_down(heap: List[float], i: int) -> int:
+    comparisons = 0
+    n = len(heap)
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n:
+            comparisons += 1
+            if heap[child + 1] < heap[child]:
+                child += 1
+        comparisons += 1
+        if not heap[child] < heap[i]:
+            break
+        heap[i], heap[child] = heap[child], heap[i]
+        i = child
+    return comparisons
+
+
+def top_k(values: Iterable[float], k: int) -> Tuple[List[float], int]:
+    """
+    Os k maiores elementos em ordem decrescente e as comparações, com um
+    heap mínimo dos k maiores vistos até agora (uma passada, memória O(k)).
+    """
+    if k <= 0:
+        raise ValueError("k deve ser positivo")
+
+    heap: List[float] = []
+    comparisons = 0
+    for x in values:
+        if len(heap) < k:
+            heap.append(x)
+            comparisons += _sift_up(heap, len(heap) - 1)
+            continue
+        # só entra quem for maior que o menor dos k maiores
+        comparisons += 1
+        if x > heap[0]:
+            heap[0] = x
+            comparisons += _sift_down(heap, 0)
+
+    if not heap:
+        raise ValueError("A sequência não pode ser vazia")
+
+    # Esvazia o heap (menor primeiro) e inverte para a ordem decrescente
+    ordered = []
+    while heap:
+        ordered.append(heap[0])
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            comparisons += _sift_down(heap, 0)
+    ordered.reverse()
+    return ordered, comparisons
@@ -0,0 +1,113 @@
+"""
+streaming.py
+
+Entrada do MaxMin para arquivos grandes demais para caber em argv (ou em
+uma lista Python):
+
+- texto (arquivo ou stdin): números separados por espaço/quebra de linha,
+  lidos em blocos de tamanho fixo. Um número cortado no fim de um bloco é
+  completado com o início do seguinte.
+- binário bruto (float64 ou int64 nativos): o arquivo é mapeado em memória
+  (mmap) e exposto como ndarray (ou memoryview, sem NumPy), sem cópia; o
+  motor vetorizado reduz direto sobre as páginas mapeadas.
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from contextlib import contextmanager
+from typing import IO, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+# Caracteres lidos por bloco no modo texto
+TEXT_CHUNK_SIZE = 1 << 20
+
+# dtype da linha de comando -> (dtype NumPy, código do array/memoryview)
+BINARY_DTYPES = {"float64": ("<f8", "d"), "int64": ("<i8", "q")}
+
+
+def _parse(tokens: Sequence[str]) -> array:
+    try:
+        return array("d", map(float, tokens))
+    except ValueError:
+        bad = next(t for t in tokens if not _is_number(t))
+        raise ValueError(f"Valor inválido na entrada: {bad[:20]!r}") from None
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def iter_text_chunks(stream: IO[str], chunk_size: int = TEXT_CHUNK_SIZE) -> Iterator[array]:
+    """
+    Lê `stream` em blocos de `chunk_size` caracteres e gera, para cada
+    bloco, um array('d') com os números completos que ele contém.
+    """
+    carry = ""
+    while True:
+        text = stream.read(chunk_size)
+        if not text:
+            break
+        tokens = (carry + text).split()
+        carry = ""
+        # Bloco terminou no meio de um número: guarda o pedaço para o próximo
+        if tokens and not text[-1].isspace():
+            carry = tokens.pop()
+        if tokens:
+            yield _parse(tokens)
+    if carry:
+        yield _parse([carry])
+
+
+def iter_text_values(stream: IO[str], chunk_size: int = TEXT_CHUNK_SIZE) -> Iterator[float]:
+    """Os mesmos números de `iter_text_chunks`, um a um."""
+    for chunk in iter_text_chunks(stream, chunk_size):
+        yield from chunk
+
+
+@contextmanager
+def open_text(path: str) -> Iterator[IO[str]]:
+    """Abre o arquivo texto; "-" é a entrada padrão."""
+    if path == "-":
+        yield sys.stdin
+        return
+    with open(path, encoding="ascii") as f:
+        yield f
+
+
+@contextmanager
+def open_binary(path: str, dtype: str = "float64") -> Iterator[Sequence[float]]:
+    """
+    Mapeia um arquivo de float64/int64 (little-endian) em memória e entrega
+    um ndarray somente leitura (np.memmap) ou, sem NumPy, um memoryview
+    sobre o mapeamento.
+    """
+    np_dtype, code = BINARY_DTYPES[dtype]
+    size = os.path.getsize(path)
+    if size == 0:
+        raise ValueError(f"Arquivo vazio: {path}")
+    if size % 8:
+        raise ValueError(f"Tamanho de {path} não é múltiplo de 8 bytes ({dtype})")
+
+    if np is not None:
+        # O np.memmap fecha o mapeamento sozinho quando deixa de ser usado
+        yield np.memmap(path, dtype=np_dtype, mode="r")
+        return
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mapped:
+        view = memoryview(mapped).cast(code)
+        try:
+            yield view
+        finally:
+            view.release()
@@ -0,0 +1,133 @@
+"""
+vectorized.py
+
+Motor vetorizado do MaxMin para sequências numéricas grandes.
+
+Em vez de uma chamada Python por par de elementos, a sequência é dividida
+em blocos de no máximo `chunk_size` elementos; cada bloco é reduzido de uma
+vez (NumPy, ou min()/max() nativos sobre um memoryview quando o NumPy não
+está instalado) e os resultados dos blocos são juntados com o mesmo passo
+de combinação da divisão e conquista (`combination.combine_all`).
+
+Os blocos são os segmentos em que a própria recursão de
+`maxmin_divide_conquer` cai quando fica com até `chunk_size` elementos.
+Cada bloco de tamanho m conta C(m), o número exato de comparações que a
+recursão faria nele, e cada junção soma 2; assim a contagem reportada é
+a mesma de `maxmin` para qualquer tamanho de bloco.
+
+Aceita listas, `array('d')`/`array('q')` e arrays NumPy; buffers são
+usados sem cópia.
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from combination import combine_all
+
+# Elementos por bloco (512 KiB de float64: cabe no cache L2)
+CHUNK_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=None)
+def divide_conquer_comparisons(n: int) -> int:
+    """
+    Comparações feitas por `maxmin_divide_conquer` em n elementos:
+    C(1) = 0, C(2) = 1 e C(n) = C(ceil(n/2)) + C(floor(n/2)) + 2.
+    """
+    if n <= 1:
+        return 0
+    if n == 2:
+        return 1
+    half = (n + 1) // 2
+    return divide_conquer_comparisons(half) + divide_conquer_comparisons(n - half) + 2
+
+
+def as_vector(data: Sequence[float]) -> Sequence[float]:
+    """
+    View sem cópia sobre buffers (array, bytes de float64, ndarray); listas
+    viram ndarray quando o NumPy está disponível.
+    """
+    if np is not None:
+        return np.asarray(data)
+    if isinstance(data, array):
+        return memoryview(data)
+    return data
+
+
+def chunk_bounds(n: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Segmentos [início, fim) da recursão de `maxmin_divide_conquer` (meio em
+    (left + right) // 2) que têm até `chunk_size` elementos, em ordem. Pares
+    nunca são partidos: na recursão eles são caso base (1 comparação).
+    """
+    chunk_size = max(chunk_size, 2)
+    bounds = []
+    stack = [(0, n - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left + 1 <= chunk_size:
+            bounds.append((left, right + 1))
+            continue
+        mid = (left + right) // 2
+        # Direita primeiro na pilha para sair na ordem da sequência
+        stack.append((mid + 1, right))
+        stack.append((left, mid))
+    return bounds
+
+
+def reduce_chunk(chunk: Sequence[float]) -> Tuple[float, float, int]:
+    """
+    (min, max, comparações) de um bloco. No NumPy as reduções min/max já
+    são vetorizadas (SIMD) e, medidas, ganham de um passo explícito de
+    min/max por pares; o resultado vem como escalar Python.
+    """
+    comparisons = divide_conquer_comparisons(len(chunk))
+    if np is not None and isinstance(chunk, np.ndarray):
+        return chunk.min().item(), chunk.max().item(), comparisons
+    return min(chunk), max(chunk), comparisons
+
+
+def maxmin_vectorized(data: Sequence[float], chunk_size: int = CHUNK_SIZE) -> Tuple[float, float, int]:
+    """
+    Mesmo resultado (min, max, comparações) de `maxmin`, reduzindo blocos
+    de `chunk_size` elementos de forma vetorizada.
+    """
+    n = len(data)
+    if n == 0:
+        raise ValueError("A sequência não pode ser vazia")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size deve ser positivo")
+
+    vector = as_vector(data)
+    parts = [reduce_chunk(vector[start:stop]) for start, stop in chunk_bounds(n, chunk_size)]
+    return combine_all(parts)
+
+
+def maxmin_chunks(chunks: Iterable[Sequence[float]]) -> Tuple[float, float, int]:
+    """
+    MaxMin de uma sequência que chega em pedaços (ex.: leitura em blocos de
+    um arquivo): só o min/max de cada pedaço fica em memória. Os pedaços
+    têm o tamanho que a leitura der, não o dos segmentos da recursão, então
+    a contagem é calculada para a sequência inteira, C(n), e é a mesma de
+    `maxmin` nos mesmos n valores.
+    """
+    minimum = maximum = None
+    n = 0
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        low, high, _ = reduce_chunk(as_vector(chunk))
+        if minimum is None or low < minimum:
+            minimum = low
+        if maximum is None or high > maximum:
+            maximum = high
+        n += len(chunk)
+    if n == 0:
+        raise ValueError("A sequência não pode ser vazia")
+    return minimum, maximum, divide_conquer_comparisons(n)
@@ -0,0 +1,132 @@
+"""
+busca_iterativa.py
+---------------------------------
+Backtracking do Caminho Hamiltoniano sem recursão, para grafos grandes e
+esparsos (milhares de vértices) que estourariam o limite de recursão do
+Python com `encontrar_caminho_hamiltoniano`.
+
+- A pilha explícita guarda, por nível, o vértice do caminho e o iterador
+  dos seus vizinhos ainda não tentados: retomar um nível é só continuar o
+  `for` de onde ele parou.
+- `visitado` é um bytearray; como cada retrocesso desmarca o vértice que
+  sai do caminho, trocar de vértice inicial não precisa limpar nada.
+- Memória fixa: caminho, pilha e visitado têm n posições.
+- Os vizinhos são tentados em ordem fixa de grau crescente (Warnsdorff
+  estático, sem custo por nó) e só os inícios possíveis são tentados
+  (ver `busca_podada.inicios_possiveis`).
+
+`explorar` é o laço da busca, a partir de um prefixo qualquer e com
+orçamento de nós e pedido de parada opcionais; a busca paralela
+(`busca_paralela.py`) o usa para explorar cada subárvore.
+"""
+
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from busca_podada import inicios_possiveis, normalizar_adjacencia
+
+# Nós expandidos entre duas consultas a `parar`
+INTERVALO_PARADA = 4096
+
+
+def explorar(
+    ordem: Sequence[Sequence[int]],
+    prefixo: Sequence[int],
+    visitado: Optional[bytearray] = None,
+    orcamento: Optional[int] = None,
+    parar: Optional[Callable[[], bool]] = None,
+) -> Tuple[List[int] | None, List[List[int]] | None]:
+    """
+    Backtracking iterativo nos caminhos que começam com `prefixo`, tentando
+    os vizinhos de v na ordem de `ordem[v]`. Retorna:
+
+    - (caminho, None): achou um caminho Hamiltoniano (o primeiro na ordem
+      da busca);
+    - (None, None): a subárvore não tem caminho, ou `parar()` (consultada a
+      cada INTERVALO_PARADA nós) pediu para desistir;
+    - (None, pendentes): o orçamento de nós acabou; `pendentes` são os
+      prefixos que cobrem o que falta explorar, na ordem da busca.
+
+    `visitado` (n bytes zerados) pode ser reaproveitado entre chamadas: ele
+    volta zerado quando a subárvore é esgotada.
+    """
+    n = len(ordem)
+    if visitado is None:
+        visitado = bytearray(n)
+    caminho = [0] * n
+    for i, v in enumerate(prefixo):
+        caminho[i] = v
+        visitado[v] = 1
+    base = len(prefixo) - 1
+    if base == n - 1:
+        return caminho, None
+
+    pilha: List[Iterator[int]] = [iter(())] * n
+    pilha[base] = iter(ordem[caminho[base]])
+    nivel = base
+    nos = 0
+
+    while nivel >= base:
+        # próximo vizinho livre do vértice deste nível
+        for prox in pilha[nivel]:
+            if not visitado[prox]:
+                break
+        else:
+            # acabaram os vizinhos: retrocede
+            visitado[caminho[nivel]] = 0
+            nivel -= 1
+            continue
+
+        nivel += 1
+        caminho[nivel] = prox
+        visitado[prox] = 1
+        if nivel == n - 1:
+            return caminho, None
+        pilha[nivel] = iter(ordem[prox])
+
+        nos += 1
+        if parar is not None and nos % INTERVALO_PARADA == 0 and parar():
+            return None, None
+        if orcamento is not None and nos >= orcamento:
+            return None, _pendentes(caminho, pilha, visitado, base, nivel)
+
+    for v in prefixo[:-1]:
+        visitado[v] = 0
+    return None, None
+
+
+def _pendentes(caminho: List[int], pilha: List[Iterator[int]], visitado: bytearray, base: int, nivel: int):
+    # O que falta explorar, na ordem da busca: a subárvore do nó atual e,
+    # do nível mais fundo para o mais raso, os vizinhos ainda não tentados
+    pendentes = [caminho[:nivel + 1]]
+    for d in range(nivel - 1, base - 1, -1):
+        visitado[caminho[d + 1]] = 0
+        for w in pilha[d]:
+            if not visitado[w]:
+                pendentes.append(caminho[:d + 1] + [w])
+    return pendentes
+
+
+def ordem_por_grau(succ: List[List[int]]) -> List[List[int]]:
+    """Sucessores de cada vértice em ordem de grau crescente (Warnsdorff estático)."""
+    grau = [len(s) for s in succ]
+    return [sorted(s, key=grau.__getitem__) for s in succ]
+
+
+def caminho_hamiltoniano_iterativo(adj: List[List[int]], n: int) -> List[int] | None:
+    """
+    Tenta encontrar um caminho Hamiltoniano com backtracking iterativo.
+    Retorna a lista de vértices do caminho ou None se não existir.
+    """
+    if n == 1:
+        return [0]
+
+    succ, pred, _ = normalizar_adjacencia(adj, n)
+    ordem = ordem_por_grau(succ)
+    visitado = bytearray(n)
+
+    for inicio in inicios_possiveis(succ, pred, succ == pred):
+        caminho, _ = explorar(ordem, [inicio], visitado)
+        if caminho is not None:
+            return caminho
+
+    return None
@@ -0,0 +1,155 @@
+"""
+busca_paralela.py
+---------------------------------
+Caminho Hamiltoniano em vários processos. As tentativas a partir de cada
+vértice inicial, e as subárvores abaixo dos primeiros níveis da busca, são
+independentes entre si: cada uma vira uma unidade de trabalho (um prefixo
+de caminho) para um pool de processos.
+
+- Fronteira inicial: a partir dos inícios possíveis, os prefixos são
+  expandidos em largura até haver UNIDADES_POR_TRABALHADOR unidades por
+  trabalhador.
+- Divisão de subárvores: cada trabalhador explora o seu prefixo com
+  `busca_iterativa.explorar` e um orçamento de ORCAMENTO_NOS nós. Se o
+  orçamento acaba, a subárvore volta dividida nos prefixos que faltam
+  explorar e eles entram na fila; assim uma subárvore grande é repartida
+  entre os trabalhadores que ficarem livres, em vez de prender um só.
+- Cancelamento: quando um caminho é achado, um sinal em memória
+  compartilhada faz os trabalhadores desistirem na próxima consulta (a cada
+  INTERVALO_PARADA nós) e as unidades que ainda não começaram são
+  descartadas.
+- Modo determinístico: vizinhos em ordem crescente e unidades atendidas em
+  ordem de prefixo. Um caminho achado só cancela as unidades de prefixo
+  maior; as de prefixo menor continuam até o fim, e o resultado é sempre o
+  caminho lexicograficamente menor, em qualquer execução.
+"""
+
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Sequence
+
+from busca_iterativa import explorar, ordem_por_grau
+from busca_podada import inicios_possiveis, normalizar_adjacencia
+
+# Unidades da fronteira inicial por trabalhador (equilibra a carga)
+UNIDADES_POR_TRABALHADOR = 8
+
+# Nós que um trabalhador expande antes de devolver a subárvore dividida
+ORCAMENTO_NOS = 1 << 18
+
+# Estado de cada processo trabalhador (preenchido por _iniciar)
+_ordem: Sequence[Sequence[int]] = ()
+_achou = None
+_melhor = None
+_deterministico = False
+
+
+def _iniciar(ordem, achou, melhor, deterministico: bool) -> None:
+    global _ordem, _achou, _melhor, _deterministico
+    _ordem, _achou, _melhor, _deterministico = ordem, achou, melhor, deterministico
+
+
+def _cancelado(prefixo: List[int]) -> bool:
+    if not _achou.value:
+        return False
+    if not _deterministico:
+        return True
+    # Só desiste se o caminho já achado vem antes de toda esta subárvore
+    with _melhor.get_lock():
+        return _melhor[:len(prefixo)] < prefixo
+
+
+def _explorar_unidade(prefixo: List[int], orcamento: int):
+    """Executa no processo trabalhador: explora a subárvore de `prefixo`."""
+    return explorar(_ordem, prefixo, None, orcamento, lambda: _cancelado(prefixo))
+
+
+def fronteira(ordem: Sequence[Sequence[int]], inicios: List[int], alvo: int) -> List[List[int]]:
+    """
+    Expande os prefixos nível a nível, a partir de `inicios`, até haver pelo
+    menos `alvo` deles (ou até eles serem caminhos completos). Os prefixos
+    ficam na ordem em que a busca em profundidade os visitaria.
+    """
+    n = len(ordem)
+    prefixos = [[v] for v in inicios]
+    while prefixos and len(prefixos) < alvo and len(prefixos[0]) < n:
+        proximos = []
+        for p in prefixos:
+            usados = set(p)
+            proximos.extend(p + [w] for w in ordem[p[-1]] if w not in usados)
+        prefixos = proximos
+    return prefixos
+
+
+def caminho_hamiltoniano_paralelo(
+    adj: List[List[int]],
+    n: int,
+    trabalhadores: int | None = None,
+    deterministico: bool = False,
+    orcamento: int = ORCAMENTO_NOS,
+) -> List[int] | None:
+    """
+    Tenta encontrar um caminho Hamiltoniano com `trabalhadores` processos
+    (padrão: número de CPUs). Com `deterministico`, devolve o caminho
+    lexicograficamente menor. Retorna None se não existir caminho.
+    """
+    if n == 1:
+        return [0]
+
+    succ, pred, _ = normalizar_adjacencia(adj, n)
+    inicios = inicios_possiveis(succ, pred, succ == pred, deterministico)
+    ordem = succ if deterministico else ordem_por_grau(succ)
+
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    pendentes = fronteira(ordem, inicios, trabalhadores * UNIDADES_POR_TRABALHADOR)
+
+    if trabalhadores <= 1:
+        # Sem paralelismo: as unidades em ordem, cada uma até o fim
+        visitado = bytearray(n)
+        for prefixo in pendentes:
+            caminho, _ = explorar(ordem, prefixo, visitado)
+            if caminho is not None:
+                return caminho
+        return None
+
+    achou = multiprocessing.Value("b", 0)
+    melhor = multiprocessing.Array("l", n)
+    melhor_caminho = None
+    heapq.heapify(pendentes)
+
+    pool = ProcessPoolExecutor(
+        max_workers=trabalhadores, initializer=_iniciar, initargs=(ordem, achou, melhor, deterministico)
+    )
+    try:
+        em_andamento = set()
+        while pendentes or em_andamento:
+            # Mantém cada trabalhador com uma unidade rodando e outra na fila
+            while pendentes and len(em_andamento) < 2 * trabalhadores:
+                prefixo = heapq.heappop(pendentes)
+                em_andamento.add(pool.submit(_explorar_unidade, prefixo, orcamento))
+
+            feitos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+            for futuro in feitos:
+                em_andamento.remove(futuro)
+                caminho, resto = futuro.result()
+                if caminho is not None and (melhor_caminho is None or caminho < melhor_caminho):
+                    melhor_caminho = caminho
+                    with melhor.get_lock():
+                        melhor[:] = caminho
+                        achou.value = 1
+                elif resto:
+                    for prefixo in resto:
+                        heapq.heappush(pendentes, prefixo)
+
+            if melhor_caminho is not None:
+                if not deterministico:
+                    break
+                # Só as subárvores antes do caminho achado ainda importam
+                pendentes = [p for p in pendentes if p < melhor_caminho]
+                heapq.heapify(pendentes)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    return melhor_caminho
@@ -0,0 +1,201 @@
+"""
+busca_podada.py
+---------------------------------
+Backtracking com podas para o Caminho Hamiltoniano. Continua exponencial
+no pior caso, mas descarta cedo os ramos que não podem dar certo:
+
+- Ordem de Warnsdorff: os vizinhos são tentados do que tem MENOS saídas
+  livres (sucessores ainda não visitados) para o que tem mais.
+- Vértice forçado: se um vizinho w do vértice atual perdeu o último
+  predecessor livre, só dá para entrar em w agora; ele vira o único
+  candidato (dois vértices assim ao mesmo tempo -> ramo morto).
+- Becos sem saída: um vértice livre sem sucessores livres só pode ser o
+  último do caminho; mais de um -> ramo morto. Em grafos não direcionados,
+  um vértice livre com no máximo um vizinho livre é ponta do restante do
+  caminho; mais de duas pontas -> ramo morto.
+- Conectividade: os vértices livres precisam continuar conectados ao
+  vértice atual (como grafo não direcionado). A busca em largura só é
+  refeita quando o vértice que acabou de sair do conjunto livre tinha dois
+  ou mais vizinhos livres, pois só assim ele poderia desconectá-lo.
+- Vértices iniciais: só os que podem começar um caminho. Um vértice sem
+  predecessores tem que ser o início; em grafo não direcionado, um vértice
+  de grau 1 é uma das pontas e o caminho pode ser lido a partir dele.
+
+Os contadores de saídas/entradas livres são atualizados ao visitar e
+restaurados ao desfazer, então trocar de vértice inicial não exige
+reiniciar nada em O(n).
+
+Opcionalmente, uma `TabelaTransposicao` guarda os estados (vértice atual,
+visitados) já provados sem saída, para não explorar de novo a mesma
+subárvore quando outro prefixo chega ao mesmo estado.
+"""
+
+from typing import List
+
+from tabela_transposicao import TabelaTransposicao
+
+
+def normalizar_adjacencia(adj: List[List[int]], n: int):
+    """
+    (sucessores, predecessores, vizinhos não direcionados) de cada vértice,
+    sem arestas repetidas nem laços, em ordem crescente.
+    """
+    succ = [sorted({v for v in adj[u] if v != u}) for u in range(n)]
+    pred = [[] for _ in range(n)]
+    for u in range(n):
+        for v in succ[u]:
+            pred[v].append(u)
+    viz = [sorted(set(succ[u]) | set(pred[u])) for u in range(n)]
+    return succ, pred, viz
+
+
+def inicios_possiveis(
+    succ: List[List[int]], pred: List[List[int]], simetrico: bool, lexicografico: bool = False
+) -> List[int]:
+    """
+    Vértices pelos quais vale a pena começar a busca, na ordem em que serão
+    tentados (lista vazia = não existe caminho). Com `lexicografico`, os
+    inícios vêm em ordem crescente e nenhum início do caminho
+    lexicograficamente menor é descartado.
+    """
+    n = len(succ)
+    sem_entrada = [v for v in range(n) if not pred[v]]
+    if sem_entrada:
+        return sem_entrada if len(sem_entrada) == 1 else []
+    if sum(1 for v in range(n) if not succ[v]) > 1:
+        return []
+
+    if simetrico:
+        folhas = [v for v in range(n) if len(succ[v]) == 1]
+        if len(folhas) > 2:
+            return []
+        if folhas and not lexicografico:
+            return folhas[:1]
+        if len(folhas) == 2:
+            return folhas  # as duas pontas (qualquer uma pode vir primeiro)
+    if lexicografico:
+        return list(range(n))
+    # Warnsdorff também no início: menos opções primeiro
+    return sorted(range(n), key=lambda v: (len(succ[v]), v))
+
+
+def caminho_hamiltoniano_podado(
+    adj: List[List[int]], n: int, tabela: TabelaTransposicao | None = None
+) -> List[int] | None:
+    """
+    Tenta encontrar um caminho Hamiltoniano com backtracking podado.
+    Retorna a lista de vértices do caminho ou None se não existir.
+    `tabela` (opcional) memoriza os estados sem saída entre os ramos.
+    """
+    if n == 1:
+        return [0]
+
+    succ, pred, viz = normalizar_adjacencia(adj, n)
+    simetrico = succ == pred
+
+    visitado = bytearray(n)
+    saidas = [len(s) for s in succ]      # sucessores ainda não visitados
+    entradas = [len(p) for p in pred]    # predecessores ainda não visitados
+    # contadores sobre os vértices livres (não visitados)
+    sem_saida = sum(1 for v in range(n) if saidas[v] == 0)
+    pontas = sum(1 for v in range(n) if saidas[v] <= 1) if simetrico else 0
+
+    marca = [0] * n
+    rodada = 0
+    caminho: List[int] = []
+    mascara = 0  # visitados como bitmask, chave da tabela de transposição
+
+    def visitar(v: int) -> None:
+        nonlocal sem_saida, pontas, mascara
+        visitado[v] = 1
+        mascara |= 1 << v
+        caminho.append(v)
+        if saidas[v] == 0:
+            sem_saida -= 1
+        if simetrico and saidas[v] <= 1:
+            pontas -= 1
+        for u in pred[v]:
+            saidas[u] -= 1
+            if not visitado[u]:
+                if saidas[u] == 0:
+                    sem_saida += 1
+                if simetrico and saidas[u] == 1:
+                    pontas += 1
+        for w in succ[v]:
+            entradas[w] -= 1
+
+    def desfazer(v: int) -> None:
+        nonlocal sem_saida, pontas, mascara
+        for w in succ[v]:
+            entradas[w] += 1
+        for u in pred[v]:
+            if not visitado[u]:
+                if saidas[u] == 0:
+                    sem_saida -= 1
+                if simetrico and saidas[u] == 1:
+                    pontas -= 1
+            saidas[u] += 1
+        if saidas[v] == 0:
+            sem_saida += 1
+        if simetrico and saidas[v] <= 1:
+            pontas += 1
+        caminho.pop()
+        visitado[v] = 0
+        mascara ^= 1 << v
+
+    def conectado(v_atual: int, livres: int) -> bool:
+        """Os `livres` vértices não visitados são alcançáveis a partir de v_atual?"""
+        nonlocal rodada
+        rodada += 1
+        marca[v_atual] = rodada
+        pilha = [v_atual]
+        alcancados = 0
+        while pilha:
+            x = pilha.pop()
+            for y in viz[x]:
+                if not visitado[y] and marca[y] != rodada:
+                    marca[y] = rodada
+                    alcancados += 1
+                    pilha.append(y)
+        return alcancados == livres
+
+    def backtrack(v_atual: int, profundidade: int, verificar_conexao: bool) -> bool:
+        if profundidade == n:
+            return True
+
+        if sem_saida > 1 or pontas > 2:
+            return False
+        if tabela is not None and tabela.contem(v_atual, mascara):
+            return False
+        if verificar_conexao and not conectado(v_atual, n - profundidade):
+            return False
+
+        livres = [w for w in succ[v_atual] if not visitado[w]]
+        forcados = [w for w in livres if entradas[w] == 0]
+        if len(forcados) > 1:
+            return False
+        if forcados:
+            candidatos = forcados
+        else:
+            candidatos = sorted(livres, key=lambda w: (saidas[w], w))
+
+        # Sair de v_atual só pode desconectar o resto se ele tinha 2+ vizinhos livres
+        divide = sum(1 for w in viz[v_atual] if not visitado[w]) >= 2
+
+        for prox in candidatos:
+            visitar(prox)
+            if backtrack(prox, profundidade + 1, divide):
+                return True
+            desfazer(prox)
+
+        if tabela is not None:
+            tabela.registrar(v_atual, mascara)
+        return False
+
+    for inicio in inicios_possiveis(succ, pred, simetrico):
+        visitar(inicio)
+        if backtrack(inicio, 1, True):
+            return caminho[:]
+        desfazer(inicio)
+
+    return None
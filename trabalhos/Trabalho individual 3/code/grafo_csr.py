@@ -0,0 +1,250 @@
+"""
+grafo_csr.py
+---------------------------------
+Leitura do grafo (mesmo formato de entrada do main.py) para uma
+representação compacta em CSR (compressed sparse row), usada tanto pelo
+main.py quanto pelo view.py.
+
+- As arestas são convertidas de uma vez só (com NumPy, `np.array` sobre os
+  tokens do texto todo; sem NumPy, `array` + `map(int, ...)`), em vez de
+  um `int()` e dois `append` por aresta num laço Python.
+- Laços (u -> u) e arestas repetidas são descartados; em grafo não
+  direcionado cada aresta entra nos dois sentidos.
+- Os sucessores de todos os vértices ficam num único buffer `destinos`,
+  em ordem crescente, e os de v são `destinos[inicio[v]:inicio[v + 1]]`.
+  São dois vetores de inteiros em vez de n listas de objetos `int`.
+- Com `cache`, os vetores são gravados num `.npz` sem compressão junto com
+  um hash da entrada. Na próxima leitura da mesma entrada, eles são
+  mapeados do arquivo para a memória (`np.memmap`), sem converter nada.
+
+`GrafoCSR` se comporta como a lista de adjacência que os motores esperam
+(`adj[v]` devolve a lista de sucessores de v), então pode ser passado
+direto para `resolver` e `pre_processar`. As listas de todos os vértices
+são montadas uma vez só, no primeiro acesso, e reaproveitadas: os motores
+consultam `adj[v]` dentro dos laços da busca.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+
+class GrafoCSR:
+    """
+    Grafo em CSR: `tipo` ('D' ou 'U'), `n` vértices, `inicio` (n + 1
+    deslocamentos) e `destinos` (sucessores de cada vértice, em sequência).
+    """
+
+    def __init__(self, tipo: str, n: int, inicio, destinos):
+        self.tipo = tipo
+        self.n = n
+        self.inicio = inicio
+        self.destinos = destinos
+        self._listas: List[List[int]] | None = None
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, v: int) -> List[int]:
+        # As listas são compartilhadas entre as chamadas: não as altere
+        if self._listas is None:
+            self._listas = self.listas()
+        return self._listas[v]
+
+    def listas(self) -> List[List[int]]:
+        """Lista de adjacência (list[list[int]]) montada a partir do CSR."""
+        destinos = self.destinos.tolist()
+        inicio = self.inicio.tolist()
+        return [destinos[inicio[v]:inicio[v + 1]] for v in range(self.n)]
+
+    def grau(self, v: int) -> int:
+        return int(self.inicio[v + 1] - self.inicio[v])
+
+    def arestas(self) -> Iterator[Tuple[int, int]]:
+        """Arestas sem repetição (u, v); em grafo não direcionado, só com u < v."""
+        for u in range(self.n):
+            for v in self[u]:
+                if self.tipo == "D" or u < v:
+                    yield u, v
+
+
+def _validar_cabecalho(tokens: List[bytes]) -> Tuple[str, int, int]:
+    if not tokens:
+        raise ValueError("Entrada vazia. Verifique o arquivo / stdin.")
+
+    tipo = tokens[0].decode().upper()
+    if tipo not in ("D", "U"):
+        raise ValueError("Tipo de grafo inválido. Use 'D' (direcionado) ou 'U' (não direcionado).")
+    if len(tokens) < 3:
+        raise ValueError("Entrada incompleta. Esperado: tipo, n, m.")
+
+    try:
+        n = int(tokens[1])
+        m = int(tokens[2])
+    except ValueError:
+        raise ValueError(f"n e m precisam ser inteiros: {tokens[1].decode()!r} {tokens[2].decode()!r}") from None
+    if n <= 0:
+        raise ValueError("Número de vértices precisa ser > 0.")
+    if m < 0:
+        raise ValueError("Número de arestas não pode ser negativo.")
+    return tipo, n, m
+
+
+def _converter_arestas(texto: bytes, m: int):
+    """Pares (u, v) do texto como um vetor de 2m inteiros."""
+    tokens = texto.split()
+    try:
+        if np is not None:
+            valores = np.array(tokens, dtype=np.int64) if tokens else np.empty(0, np.int64)
+        else:
+            valores = array("q", map(int, tokens))
+    except (ValueError, OverflowError):
+        invalido = next(t for t in tokens if not _inteiro(t))
+        raise ValueError(f"Vértice inválido nas arestas: {invalido.decode()[:20]!r}") from None
+    if len(valores) != 2 * m:
+        raise ValueError(
+            f"Quantidade de valores não bate com m={m}. "
+            f"Era esperado {3 + 2*m} valores e chegaram {3 + len(valores)}."
+        )
+    return valores
+
+
+def _inteiro(token: bytes) -> bool:
+    try:
+        return -(1 << 63) <= int(token) < 1 << 63
+    except ValueError:
+        return False
+
+
+def _montar_numpy(tipo: str, n: int, valores) -> GrafoCSR:
+    origem, destino = valores[0::2], valores[1::2]
+    if len(valores) and (valores.min() < 0 or valores.max() >= n):
+        fora = np.flatnonzero((origem < 0) | (origem >= n) | (destino < 0) | (destino >= n))[0]
+        raise ValueError(f"Aresta fora do intervalo de vértices: {origem[fora]} {destino[fora]}")
+
+    sem_laco = origem != destino
+    origem, destino = origem[sem_laco], destino[sem_laco]
+    if tipo == "U":
+        origem, destino = np.concatenate((origem, destino)), np.concatenate((destino, origem))
+
+    # u * n + v ordena por origem e depois por destino; depois de ordenar, as
+    # repetidas ficam vizinhas (mais rápido que np.unique, que usa hash)
+    chaves = origem * n + destino
+    chaves.sort()
+    if len(chaves):
+        chaves = chaves[np.concatenate(([True], chaves[1:] != chaves[:-1]))]
+    inicio = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(chaves // n, minlength=n), out=inicio[1:])
+    return GrafoCSR(tipo, n, inicio, (chaves % n).astype(np.int32))
+
+
+def _montar_puro(tipo: str, n: int, valores) -> GrafoCSR:
+    pares = set()
+    for i in range(0, len(valores), 2):
+        u, v = valores[i], valores[i + 1]
+        if u < 0 or u >= n or v < 0 or v >= n:
+            raise ValueError(f"Aresta fora do intervalo de vértices: {u} {v}")
+        if u != v:
+            pares.add((u, v))
+            if tipo == "U":
+                pares.add((v, u))
+
+    inicio = array("q", [0] * (n + 1))
+    destinos = array("i")
+    for u, v in sorted(pares):
+        inicio[u + 1] += 1
+        destinos.append(v)
+    for v in range(n):
+        inicio[v + 1] += inicio[v]
+    return GrafoCSR(tipo, n, inicio, destinos)
+
+
+def _gravar_cache(caminho: str, grafo: GrafoCSR, resumo: bytes) -> None:
+    # Grava num temporário e renomeia: uma leitura concorrente nunca vê meio arquivo
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        np.savez(
+            f,
+            resumo=np.frombuffer(resumo, dtype=np.uint8),
+            cabecalho=np.array([grafo.n, ord(grafo.tipo)], dtype=np.int64),
+            inicio=grafo.inicio,
+            destinos=grafo.destinos,
+        )
+    os.replace(temporario, caminho)
+
+
+def _mapear_npz(caminho: str) -> dict:
+    """
+    Mapeia para a memória os vetores de um `.npz` sem compressão (o
+    `np.load` ignora `mmap_mode` em `.npz` e copiaria tudo).
+    """
+    vetores = {}
+    with zipfile.ZipFile(caminho) as z, open(caminho, "rb") as f:
+        for info in z.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("cache comprimido")
+            # cabeçalho local do zip: 30 bytes + nome + campo extra
+            f.seek(info.header_offset + 26)
+            tamanho_nome, tamanho_extra = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + tamanho_nome + tamanho_extra)
+            versao = np.lib.format.read_magic(f)
+            if versao == (1, 0):
+                forma, fortran, tipo = np.lib.format.read_array_header_1_0(f)
+            else:
+                forma, fortran, tipo = np.lib.format.read_array_header_2_0(f)
+            nome = info.filename.removesuffix(".npy")
+            if 0 in forma:
+                vetores[nome] = np.empty(forma, dtype=tipo)
+            else:
+                ordem = "F" if fortran else "C"
+                vetores[nome] = np.memmap(f, dtype=tipo, mode="r", offset=f.tell(), shape=forma, order=ordem)
+    return vetores
+
+
+def _ler_cache(caminho: str, resumo: bytes) -> GrafoCSR | None:
+    """Grafo do cache, se ele existir e for da mesma entrada; senão None."""
+    try:
+        vetores = _mapear_npz(caminho)
+        if vetores["resumo"].tobytes() != resumo:
+            return None
+        n, tipo = (int(x) for x in vetores["cabecalho"])
+        return GrafoCSR(chr(tipo), n, vetores["inicio"], vetores["destinos"])
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None  # cache ausente ou inválido: converte de novo
+
+
+def carregar_grafo(entrada=None, cache: str | None = None) -> GrafoCSR:
+    """
+    Lê o grafo de `entrada` (bytes ou arquivo binário; padrão: stdin) e
+    retorna um GrafoCSR. Com `cache` (caminho de um `.npz`, exige NumPy),
+    reaproveita o grafo já convertido da mesma entrada ou grava o novo.
+    """
+    if entrada is None:
+        entrada = sys.stdin.buffer
+    dados = entrada if isinstance(entrada, bytes) else entrada.read()
+
+    usar_cache = cache is not None and np is not None
+    if usar_cache:
+        resumo = hashlib.blake2b(dados, digest_size=16).digest()
+        grafo = _ler_cache(cache, resumo)
+        if grafo is not None:
+            return grafo
+
+    # só os três primeiros tokens são separados; o resto vai inteiro para a conversão
+    tokens = dados.split(maxsplit=3)
+    tipo, n, m = _validar_cabecalho(tokens[:3])
+    valores = _converter_arestas(tokens[3] if len(tokens) > 3 else b"", m)
+    grafo = _montar_numpy(tipo, n, valores) if np is not None else _montar_puro(tipo, n, valores)
+
+    if usar_cache:
+        _gravar_cache(cache, grafo, resumo)
+    return grafo
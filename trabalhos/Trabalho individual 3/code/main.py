@@ -25,69 +25,56 @@ Saída:
     v0 -> v1 -> v2 -> ... -> v(n-1)
 - Caso contrário:
     NAO EXISTE CAMINHO HAMILTONIANO
+
+Uso:
+    python main.py < input.txt
+    python main.py --motor pd < input.txt
+    python main.py --motor paralelo --trabalhadores 8 --deterministico < input.txt
+    python main.py --motor podado --memo-mb 256 < input.txt
+    python main.py --sem-pre-processamento < input.txt
+    python main.py --cache grafo.npz < input.txt
+
+Motores (--motor):
+    auto          -> programação dinâmica (Held-Karp, O(2^n · n)) até
+                     LIMITE_PD vértices, backtracking podado até
+                     LIMITE_PODADO e backtracking iterativo acima disso (padrão)
+    backtracking  -> busca em profundidade com retrocesso
+    podado        -> backtracking com ordem de Warnsdorff e podas
+    iterativo     -> backtracking sem recursão (pilha explícita), para grafos grandes
+    paralelo      -> backtracking iterativo repartido entre processos
+                     (--deterministico devolve o caminho lexicograficamente menor)
+    pd            -> programação dinâmica sobre subconjuntos
+
+O grafo é lido por grafo_csr.py (lista de adjacência compacta em CSR, sem
+laços nem arestas repetidas); com --cache ARQUIVO.npz, a mesma entrada
+lida de novo é mapeada do cache em vez de convertida.
+
+Antes da busca, um pré-processamento em O(n + m) (pre_processamento.py)
+rejeita grafos claramente inviáveis e remove arestas que não podem estar
+em nenhum caminho; a regra aplicada é informada na saída de erro.
 """
 
+import argparse
+import sys
 from typing import List
 
+from grafo_csr import carregar_grafo
 
-def ler_grafo():
-    """
-    Lê o grafo da entrada padrão e retorna:
-    - adj: lista de adjacência (list[list[int]])
-    - n: número de vértices
-    """
-    import sys
-
-    data = sys.stdin.read().strip().split()
-    if not data:
-        raise ValueError("Entrada vazia. Verifique o arquivo / stdin.")
-
-    # 1) tipo do grafo
-    tipo = data[0].upper()
-    if tipo not in ("D", "U"):
-        raise ValueError("Tipo de grafo inválido. Use 'D' (direcionado) ou 'U' (não direcionado).")
-
-    # 2) n m
-    # data[1] = n, data[2] = m
-    if len(data) < 3:
-        raise ValueError("Entrada incompleta. Esperado: tipo, n, m.")
-
-    n = int(data[1])
-    m = int(data[2])
-
-    # validações básicas
-    if n <= 0:
-        raise ValueError("Número de vértices precisa ser > 0.")
-    if m < 0:
-        raise ValueError("Número de arestas não pode ser negativo.")
-
-    # 3) arestas
-    # Próximos pares (u, v)
-    if len(data) != 3 + 2 * m:
-        raise ValueError(
-            f"Quantidade de valores não bate com m={m}. "
-            f"Era esperado {3 + 2*m} valores e chegaram {len(data)}."
-        )
-
-    # monta lista de adjacência
-    adj = [[] for _ in range(n)]
-
-    idx = 3
-    for _ in range(m):
-        u = int(data[idx])
-        v = int(data[idx + 1])
-        idx += 2
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
 
-        if u < 0 or u >= n or v < 0 or v >= n:
-            raise ValueError(f"Aresta fora do intervalo de vértices: {u} {v}")
+MOTORES = ("auto", "backtracking", "podado", "iterativo", "paralelo", "pd")
 
-        # adiciona aresta
-        adj[u].append(v)
-        if tipo == "U" and u != v:
-            # se não-direcionado, também adiciona o contrário
-            adj[v].append(u)
+# Até quantos vértices o modo auto usa a programação dinâmica (O(2^n · n)
+# de tempo e 2^n bitsets de memória). Sem NumPy a DP é bem mais lenta
+LIMITE_PD = 24
+LIMITE_PD_SEM_NUMPY = 18
 
-    return adj, n
+# A busca podada é recursiva (um nível por vértice do caminho); acima disso
+# o modo auto usa a busca iterativa, que não depende do limite de recursão
+LIMITE_PODADO = 900
 
 
 def encontrar_caminho_hamiltoniano(adj: List[List[int]], n: int) -> List[int] | None:
@@ -141,20 +128,127 @@ def encontrar_caminho_hamiltoniano(adj: List[List[int]], n: int) -> List[int] |
     return None  # não achou nenhum caminho Hamiltoniano
 
 
-def main():
-    # 1. ler grafo
-    adj, n = ler_grafo()
+def escolher_motor(n: int) -> str:
+    """Motor usado pelo modo auto para um grafo de n vértices."""
+    limite = LIMITE_PD if np is not None else LIMITE_PD_SEM_NUMPY
+    if n <= limite:
+        return "pd"
+    return "podado" if n <= LIMITE_PODADO else "iterativo"
+
+
+def resolver(
+    adj: List[List[int]],
+    n: int,
+    motor: str = "auto",
+    trabalhadores: int | None = None,
+    deterministico: bool = False,
+    tabela=None,
+) -> List[int] | None:
+    """
+    Encontra um caminho Hamiltoniano com o motor pedido (ver MOTORES).
+    `trabalhadores` e `deterministico` valem para o motor paralelo; `tabela`
+    (uma TabelaTransposicao) para o motor podado.
+    """
+    if motor == "auto":
+        motor = escolher_motor(n)
+
+    if motor == "backtracking":
+        return encontrar_caminho_hamiltoniano(adj, n)
+    if motor == "podado":
+        from busca_podada import caminho_hamiltoniano_podado
+        return caminho_hamiltoniano_podado(adj, n, tabela)
+    if motor == "iterativo":
+        from busca_iterativa import caminho_hamiltoniano_iterativo
+        return caminho_hamiltoniano_iterativo(adj, n)
+    if motor == "paralelo":
+        from busca_paralela import caminho_hamiltoniano_paralelo
+        return caminho_hamiltoniano_paralelo(adj, n, trabalhadores, deterministico)
+    if motor == "pd":
+        from programacao_dinamica import caminho_hamiltoniano_pd
+        return caminho_hamiltoniano_pd(adj, n)
+    raise ValueError(f"Motor desconhecido: {motor}")
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Caminho Hamiltoniano (grafo lido da entrada padrão)")
+    p.add_argument("--motor", "-m", choices=MOTORES, default="auto", help="algoritmo de busca (padrão: auto)")
+    p.add_argument("--trabalhadores", "-t", type=int, default=None, help="processos do motor paralelo (padrão: CPUs)")
+    p.add_argument(
+        "--deterministico",
+        action="store_true",
+        help="motor paralelo: devolve sempre o caminho lexicograficamente menor",
+    )
+    p.add_argument(
+        "--memo-mb",
+        type=float,
+        default=0,
+        metavar="MB",
+        help="motor podado (ou auto, quando ele escolhe o podado): tabela de estados sem saída com até MB MiB (0 desliga)",
+    )
+    p.add_argument(
+        "--sem-pre-processamento",
+        action="store_true",
+        help="vai direto para a busca, sem as rejeições e reduções em O(n + m)",
+    )
+    p.add_argument(
+        "--cache",
+        metavar="ARQUIVO",
+        default=None,
+        help="grava o grafo convertido neste .npz e o reaproveita quando a mesma entrada for lida de novo",
+    )
+    args = p.parse_args()
+    if args.memo_mb < 0:
+        p.error("--memo-mb não pode ser negativo")
+    if args.memo_mb > 0 and args.motor not in ("auto", "podado"):
+        p.error(f"--memo-mb só vale para o motor podado (motor escolhido: {args.motor})")
+    return args
+
 
-    # 2. tentar encontrar caminho hamiltoniano
-    caminho = encontrar_caminho_hamiltoniano(adj, n)
+def main():
+    args = parse_args()
 
-    # 3. imprimir resultado
+    # 1. ler grafo
+    try:
+        adj = carregar_grafo(cache=args.cache)
+    except ValueError as e:
+        sys.exit(f"ENTRADA INVALIDA: {e}")
+    n = adj.n
+
+    # 2. pré-processamento: rejeição imediata ou grafo reduzido para a busca
+    if not args.sem_pre_processamento:
+        from pre_processamento import pre_processar
+        diagnostico = pre_processar(adj, n)
+        if diagnostico.regra is not None:
+            print("NAO EXISTE CAMINHO HAMILTONIANO")
+            print(f"PRE-PROCESSAMENTO: {diagnostico.regra}", file=sys.stderr)
+            return
+        for reducao in diagnostico.reducoes:
+            print(f"PRE-PROCESSAMENTO: {reducao}", file=sys.stderr)
+        adj = diagnostico.adj
+
+    # 3. tentar encontrar caminho hamiltoniano (a tabela só é montada se o
+    # motor podado for de fato usado)
+    motor = escolher_motor(n) if args.motor == "auto" else args.motor
+    tabela = None
+    if args.memo_mb > 0:
+        if motor == "podado":
+            from tabela_transposicao import TabelaTransposicao
+            tabela = TabelaTransposicao(int(args.memo_mb * (1 << 20)))
+        else:
+            print(f"AVISO: --memo-mb ignorado, o modo auto escolheu o motor {motor}", file=sys.stderr)
+    caminho = resolver(adj, n, motor, args.trabalhadores, args.deterministico, tabela)
+
+    # 4. imprimir resultado
     if caminho is not None:
         print("CAMINHO HAMILTONIANO ENCONTRADO:")
         print(" -> ".join(map(str, caminho)))
     else:
         print("NAO EXISTE CAMINHO HAMILTONIANO")
 
+    # estatísticas vão para stderr para não mudar o formato da saída
+    if tabela is not None:
+        print(tabela.resumo(), file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,322 @@
+"""
+pre_processamento.py
+---------------------------------
+Etapa em O(n + m) executada antes da busca exponencial. Ela responde
+"não existe" direto nos grafos claramente inviáveis e, nos outros, remove
+arestas que não podem estar em nenhum caminho Hamiltoniano, encolhendo a
+busca.
+
+Rejeições (sem busca nenhuma):
+- vértice isolado (com n > 1);
+- grafo desconexo (visto como não direcionado);
+- mais de dois vértices de grau <= 1 no grafo não direcionado subjacente:
+  cada um deles tem que ser uma ponta do caminho;
+- grafo direcionado cuja condensação em componentes fortemente conexas
+  (CFCs) não é uma cadeia: o caminho atravessa as CFCs em ordem
+  topológica, entrando em cada uma só uma vez, então cada CFC precisa de
+  uma aresta para a seguinte;
+- grafo bipartido com lados de tamanhos diferindo em mais de 1: o caminho
+  alterna entre os lados;
+- conflito entre arestas forçadas (ver abaixo).
+
+Reduções:
+- CFCs colapsadas em cadeia: arestas que pulam CFCs nunca são usadas e
+  são removidas.
+- Arestas forçadas (grafo direcionado): um vértice fora da primeira CFC
+  não pode ser o início, então se ele tem um único predecessor u, a aresta
+  u -> w está no caminho e as outras saídas de u são removidas (e o mesmo,
+  espelhado, para um vértice fora da última CFC com um único sucessor).
+- Arestas forçadas (grafo não direcionado com duas folhas): as folhas são
+  as pontas, todo outro vértice usa exatamente duas arestas; um vértice de
+  grau 2 força as duas, e um vértice com duas arestas forçadas perde as
+  demais.
+
+As remoções podem criar novos vértices com uma única opção; eles entram
+numa fila, e cada aresta é removida no máximo uma vez.
+"""
+
+from collections import deque
+from typing import List, NamedTuple, Set
+
+
+class Diagnostico(NamedTuple):
+    """
+    Resultado do pré-processamento:
+    - regra: motivo da rejeição (None se o grafo não foi rejeitado);
+    - adj: lista de adjacência reduzida (use-a na busca);
+    - reducoes: descrição das reduções aplicadas;
+    - arestas_removidas: quantas arestas dirigidas saíram da adjacência.
+    """
+
+    regra: str | None
+    adj: List[List[int]]
+    reducoes: List[str]
+    arestas_removidas: int
+
+
+def _rejeitar(regra: str, adj: List[List[int]]) -> Diagnostico:
+    return Diagnostico(regra, adj, [], 0)
+
+
+def _componentes_fortes(succ: List[Set[int]], n: int) -> List[int]:
+    """
+    Tarjan iterativo. Retorna o índice da CFC de cada vértice, com as CFCs
+    numeradas em ordem topológica (arestas entre CFCs vão de i para j > i).
+    """
+    indice = [-1] * n
+    menor = [0] * n
+    na_pilha = bytearray(n)
+    pilha: List[int] = []
+    comp = [-1] * n
+    contador = 0
+    componentes = 0
+
+    for raiz in range(n):
+        if indice[raiz] != -1:
+            continue
+        indice[raiz] = menor[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha[raiz] = 1
+        chamadas = [(raiz, iter(succ[raiz]))]
+        while chamadas:
+            v, vizinhos = chamadas[-1]
+            for w in vizinhos:
+                if indice[w] == -1:
+                    indice[w] = menor[w] = contador
+                    contador += 1
+                    pilha.append(w)
+                    na_pilha[w] = 1
+                    chamadas.append((w, iter(succ[w])))
+                    break
+                if na_pilha[w] and indice[w] < menor[v]:
+                    menor[v] = indice[w]
+            else:
+                chamadas.pop()
+                if chamadas:
+                    pai = chamadas[-1][0]
+                    if menor[v] < menor[pai]:
+                        menor[pai] = menor[v]
+                if menor[v] == indice[v]:
+                    while True:
+                        w = pilha.pop()
+                        na_pilha[w] = 0
+                        comp[w] = componentes
+                        if w == v:
+                            break
+                    componentes += 1
+
+    # Tarjan fecha as CFCs em ordem topológica reversa
+    return [componentes - 1 - c for c in comp]
+
+
+def _lados_bipartidos(viz: List[Set[int]], n: int) -> tuple | None:
+    """Tamanhos dos dois lados, se o grafo (conexo) for bipartido; senão None."""
+    cor = [-1] * n
+    cor[0] = 0
+    fila = deque([0])
+    while fila:
+        v = fila.popleft()
+        for w in viz[v]:
+            if cor[w] == -1:
+                cor[w] = 1 - cor[v]
+                fila.append(w)
+            elif cor[w] == cor[v]:
+                return None
+    uns = sum(cor)
+    return n - uns, uns
+
+
+def _forcar_direcionado(succ: List[Set[int]], pred: List[Set[int]], comp: List[int], ultima: int):
+    """
+    Propaga as arestas forçadas de um grafo direcionado. Retorna
+    (regra de rejeição ou None, arestas removidas).
+    """
+    n = len(succ)
+    pode_inicio = [comp[v] == 0 for v in range(n)]
+    pode_fim = [comp[v] == ultima for v in range(n)]
+    saida_forcada = [-1] * n
+    entrada_forcada = [-1] * n
+    removidas = 0
+
+    entradas = deque(w for w in range(n) if not pode_inicio[w] and len(pred[w]) == 1)
+    saidas = deque(w for w in range(n) if not pode_fim[w] and len(succ[w]) == 1)
+
+    while entradas or saidas:
+        while entradas:
+            w = entradas.popleft()
+            if len(pred[w]) != 1:
+                continue
+            (u,) = pred[w]
+            if saida_forcada[u] == w:
+                continue  # já propagada
+            if saida_forcada[u] != -1:
+                return f"vertice {u} teria duas arestas de saida forcadas", removidas
+            saida_forcada[u] = w
+            for x in list(succ[u]):
+                if x == w:
+                    continue
+                succ[u].discard(x)
+                pred[x].discard(u)
+                removidas += 1
+                if not pode_inicio[x]:
+                    if not pred[x]:
+                        return f"vertice {x} ficou sem predecessor possivel", removidas
+                    if len(pred[x]) == 1:
+                        entradas.append(x)
+            if not pode_fim[u]:
+                saidas.append(u)
+
+        while saidas:
+            w = saidas.popleft()
+            if len(succ[w]) != 1:
+                continue
+            (x,) = succ[w]
+            if entrada_forcada[x] == w:
+                continue
+            if entrada_forcada[x] != -1:
+                return f"vertice {x} teria duas arestas de entrada forcadas", removidas
+            entrada_forcada[x] = w
+            for y in list(pred[x]):
+                if y == w:
+                    continue
+                pred[x].discard(y)
+                succ[y].discard(x)
+                removidas += 1
+                if not pode_fim[y]:
+                    if not succ[y]:
+                        return f"vertice {y} ficou sem sucessor possivel", removidas
+                    if len(succ[y]) == 1:
+                        saidas.append(y)
+            if not pode_inicio[x]:
+                entradas.append(x)
+
+    return None, removidas
+
+
+def _forcar_nao_direcionado(viz: List[Set[int]], pontas: List[int]):
+    """
+    Com as duas pontas conhecidas (as folhas), propaga as arestas forçadas
+    de um grafo não direcionado. Retorna (regra ou None, arestas removidas).
+    """
+    n = len(viz)
+    limite = [2] * n
+    for p in pontas:
+        limite[p] = 1
+    forcadas: List[Set[int]] = [set() for _ in range(n)]
+    removidas = 0
+    fila = deque(v for v in range(n) if len(viz[v]) == limite[v])
+
+    while fila:
+        v = fila.popleft()
+        for u in list(viz[v]):
+            if u in forcadas[v]:
+                continue
+            forcadas[v].add(u)
+            forcadas[u].add(v)
+            for z in (v, u):
+                if len(forcadas[z]) > limite[z]:
+                    return f"vertice {z} teria mais arestas forcadas do que cabem no caminho", removidas
+                if len(forcadas[z]) == limite[z] and len(viz[z]) > limite[z]:
+                    # z já tem todas as arestas do caminho: as outras saem
+                    for y in list(viz[z] - forcadas[z]):
+                        viz[z].discard(y)
+                        viz[y].discard(z)
+                        removidas += 2
+                        if len(viz[y]) < limite[y]:
+                            return f"vertice {y} ficou sem arestas suficientes", removidas
+                        if len(viz[y]) == limite[y]:
+                            fila.append(y)
+
+    return None, removidas
+
+
+def pre_processar(adj: List[List[int]], n: int) -> Diagnostico:
+    """
+    Aplica as regras de rejeição e as reduções em O(n + m). Se `regra` vier
+    preenchida, não existe caminho Hamiltoniano; senão a busca deve usar a
+    adjacência reduzida `adj`, que tem os mesmos caminhos Hamiltonianos.
+    """
+    if n == 1:
+        return Diagnostico(None, adj, [], 0)
+
+    succ = [{v for v in adj[u] if v != u} for u in range(n)]
+    pred: List[Set[int]] = [set() for _ in range(n)]
+    for u in range(n):
+        for v in succ[u]:
+            pred[v].add(u)
+    viz = [succ[v] | pred[v] for v in range(n)]
+    simetrico = succ == pred
+
+    isolado = next((v for v in range(n) if not viz[v]), None)
+    if isolado is not None:
+        return _rejeitar(f"vertice isolado ({isolado})", adj)
+
+    # Conectividade do grafo não direcionado subjacente
+    visto = bytearray(n)
+    visto[0] = 1
+    pilha = [0]
+    alcancados = 1
+    while pilha:
+        v = pilha.pop()
+        for w in viz[v]:
+            if not visto[w]:
+                visto[w] = 1
+                alcancados += 1
+                pilha.append(w)
+    if alcancados < n:
+        return _rejeitar(f"grafo desconexo ({n - alcancados} vertices fora da componente do vertice 0)", adj)
+
+    folhas = [v for v in range(n) if len(viz[v]) <= 1]
+    if len(folhas) > 2:
+        return _rejeitar(f"mais de dois vertices de grau <= 1 ({len(folhas)})", adj)
+
+    lados = _lados_bipartidos(viz, n)
+    if lados is not None and abs(lados[0] - lados[1]) > 1:
+        return _rejeitar(f"grafo bipartido desbalanceado (lados com {lados[0]} e {lados[1]} vertices)", adj)
+
+    reducoes: List[str] = []
+    removidas = 0
+
+    if not simetrico:
+        comp = _componentes_fortes(succ, n)
+        quantidade = max(comp) + 1
+        tem_proxima = bytearray(quantidade)
+        pulos = []
+        for u in range(n):
+            for v in succ[u]:
+                if comp[v] == comp[u] + 1:
+                    tem_proxima[comp[u]] = 1
+                elif comp[v] > comp[u] + 1:
+                    pulos.append((u, v))
+        if not all(tem_proxima[:quantidade - 1]):
+            return _rejeitar(f"condensacao das {quantidade} componentes fortemente conexas nao e uma cadeia", adj)
+
+        for u, v in pulos:
+            succ[u].discard(v)
+            pred[v].discard(u)
+        if pulos:
+            removidas += len(pulos)
+            reducoes.append(f"{len(pulos)} arestas entre componentes fortemente conexas nao consecutivas")
+
+        regra, forcadas = _forcar_direcionado(succ, pred, comp, quantidade - 1)
+        removidas += forcadas
+        if regra is not None:
+            return _rejeitar(regra, adj)
+        if forcadas:
+            reducoes.append(f"{forcadas} arestas descartadas por arestas forcadas")
+        nova = succ
+
+    else:
+        nova = viz
+        if len(folhas) == 2 and n > 2:
+            regra, forcadas = _forcar_nao_direcionado(viz, folhas)
+            removidas += forcadas
+            if regra is not None:
+                return _rejeitar(regra, adj)
+            if forcadas:
+                reducoes.append(f"{forcadas // 2} arestas descartadas por arestas forcadas")
+
+    if not removidas:
+        return Diagnostico(None, adj, [], 0)
+    return Diagnostico(None, [sorted(s) for s in nova], reducoes, removidas)
@@ -0,0 +1,119 @@
+"""
+programacao_dinamica.py
+---------------------------------
+Caminho Hamiltoniano por programação dinâmica sobre subconjuntos
+(Held-Karp), em O(2^n · n) no pior caso: o tempo depende só de n, e não
+da sorte da busca como no backtracking.
+
+alcance[mask] é um bitset com os vértices v de `mask` tais que existe um
+caminho que visita exatamente os vértices de `mask` e começa em v:
+
+    alcance[{v}] = {v}
+    v ∈ alcance[mask]  <=>  alcance[mask - {v}] ∩ sucessores[v] ≠ ∅
+
+Com NumPy, os subconjuntos são processados em camadas de mesmo tamanho
+(|mask| = k só depende de |mask| = k - 1) e cada camada é resolvida com
+operações vetorizadas, um vértice por vez. Sem NumPy, os subconjuntos são
+percorridos em ordem crescente (mask - {v} < mask), com inteiros Python
+como bitsets.
+
+O caminho é reconstruído do início para o fim a partir de alcance[todos],
+sempre pelo menor vértice possível: o resultado é o caminho Hamiltoniano
+lexicograficamente menor.
+
+Memória: 2^n entradas de 32 bits (128 MiB para n = 25).
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+# Maior n aceito (os bitsets de alcance são uint32)
+N_MAXIMO = 32
+
+
+def sucessores(adj: List[List[int]], n: int) -> List[int]:
+    """succ[u] = bitset dos vértices v com aresta u -> v (sem laços)."""
+    succ = [0] * n
+    for u in range(n):
+        for v in adj[u]:
+            if u != v:
+                succ[u] |= 1 << v
+    return succ
+
+
+def _alcance_numpy(succ: List[int], n: int):
+    total = 1 << n
+    alcance = np.zeros(total, dtype=np.uint32)
+    for v in range(n):
+        alcance[1 << v] = 1 << v
+
+    # popcount de todos os subconjuntos: a metade de cima repete a de baixo + 1
+    tamanho = np.zeros(total, dtype=np.uint8)
+    for i in range(n):
+        tamanho[1 << i:1 << (i + 1)] = tamanho[:1 << i] + 1
+
+    for k in range(2, n + 1):
+        masks = np.flatnonzero(tamanho == k).astype(np.uint32)
+        camada = np.zeros(len(masks), dtype=np.uint32)
+        for v in range(n):
+            # Se v não está em mask, masks & ~bit é a própria mask, cuja
+            # entrada ainda é 0 (a camada só é gravada no fim)
+            anterior = alcance[masks & np.uint32(~(1 << v) & 0xFFFFFFFF)]
+            chega = (anterior & np.uint32(succ[v])) != 0
+            camada |= chega.astype(np.uint32) << np.uint32(v)
+        if not camada.any():
+            # nenhum caminho cobre k vértices, então nenhum cobre n
+            return None
+        alcance[masks] = camada
+    return alcance
+
+
+def _alcance_puro(succ: List[int], n: int):
+    alcance = [0] * (1 << n)
+    for v in range(n):
+        alcance[1 << v] = 1 << v
+
+    for mask in range(3, 1 << n):
+        if not mask & (mask - 1):
+            continue  # um vértice só: já preenchido
+        r = 0
+        resto = mask
+        while resto:
+            bit = resto & -resto
+            resto ^= bit
+            if alcance[mask ^ bit] & succ[bit.bit_length() - 1]:
+                r |= bit
+        alcance[mask] = r
+    return alcance
+
+
+def caminho_hamiltoniano_pd(adj: List[List[int]], n: int) -> List[int] | None:
+    """
+    Caminho Hamiltoniano (o lexicograficamente menor) por Held-Karp, ou
+    None se não existir.
+    """
+    if n > N_MAXIMO:
+        raise ValueError(f"Programação dinâmica suporta até {N_MAXIMO} vértices (n={n}).")
+
+    succ = sucessores(adj, n)
+    alcance = _alcance_numpy(succ, n) if np is not None else _alcance_puro(succ, n)
+    todos = (1 << n) - 1
+    if alcance is None or not alcance[todos]:
+        return None
+
+    # Reconstrução: começa no menor início possível e segue sempre para o
+    # menor sucessor que ainda consegue cobrir o subconjunto que sobrou
+    inicios = int(alcance[todos])
+    v = (inicios & -inicios).bit_length() - 1
+    caminho = [v]
+    mask = todos
+    while mask != 1 << v:
+        mask ^= 1 << v
+        candidatos = int(alcance[mask]) & succ[v]
+        v = (candidatos & -candidatos).bit_length() - 1
+        caminho.append(v)
+    return caminho
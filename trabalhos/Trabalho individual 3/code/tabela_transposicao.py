@@ -0,0 +1,80 @@
+"""
+tabela_transposicao.py
+---------------------------------
+Tabela de transposição para o backtracking do Caminho Hamiltoniano.
+
+Se a busca já provou que a partir do estado (vértice atual, conjunto de
+visitados) não dá para completar o caminho, chegar ao mesmo estado por
+outro prefixo (outra ordem dos mesmos vértices) também não dá. A tabela
+guarda esses estados mortos e a busca corta o ramo ao reencontrá-los, em
+vez de repetir a mesma subárvore exaustiva.
+
+A tabela tem um limite de memória: passando dele, os estados usados há
+mais tempo são descartados (LRU). Descartar só custa reexplorar, nunca
+muda a resposta.
+"""
+
+import sys
+from collections import OrderedDict
+
+# Custo aproximado de cada entrada além da chave (nó do OrderedDict + slot do dict)
+CUSTO_ENTRADA = 100
+
+
+class TabelaTransposicao:
+    """
+    Conjunto limitado de estados (vértice, bitmask de visitados) sem
+    continuação possível, com remoção LRU e estatísticas de uso.
+    """
+
+    def __init__(self, limite_bytes: int):
+        if limite_bytes <= 0:
+            raise ValueError("O limite de memória da tabela precisa ser > 0.")
+        self.limite_bytes = limite_bytes
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.insercoes = 0
+        self.remocoes = 0
+        self._estados: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._estados)
+
+    @staticmethod
+    def _chave(v: int, visitados: int) -> int:
+        # v é sempre um dos visitados, então o par vira um inteiro só
+        return visitados << 32 | v
+
+    def contem(self, v: int, visitados: int) -> bool:
+        """O estado já foi provado sem saída?"""
+        chave = self._chave(v, visitados)
+        if chave in self._estados:
+            self._estados.move_to_end(chave)
+            self.acertos += 1
+            return True
+        self.faltas += 1
+        return False
+
+    def registrar(self, v: int, visitados: int) -> None:
+        """Guarda um estado sem saída, descartando os mais antigos se preciso."""
+        chave = self._chave(v, visitados)
+        if chave in self._estados:
+            return
+        tamanho = sys.getsizeof(chave) + CUSTO_ENTRADA
+        self._estados[chave] = tamanho
+        self.bytes += tamanho
+        self.insercoes += 1
+        while self.bytes > self.limite_bytes and self._estados:
+            _, liberado = self._estados.popitem(last=False)
+            self.bytes -= liberado
+            self.remocoes += 1
+
+    def resumo(self) -> str:
+        consultas = self.acertos + self.faltas
+        taxa = 100 * self.acertos / consultas if consultas else 0.0
+        return (
+            f"TABELA DE TRANSPOSICAO: {self.acertos} acertos, {self.faltas} faltas ({taxa:.1f}% de acerto), "
+            f"{self.insercoes} insercoes, {self.remocoes} remocoes, {len(self)} estados "
+            f"(~{self.bytes / (1 << 20):.1f} de {self.limite_bytes / (1 << 20):.1f} MiB)"
+        )
@@ -1,66 +1,10 @@
 import os
+import sys
 from typing import List, Tuple
 import networkx as nx
 import matplotlib.pyplot as plt
-from main import encontrar_caminho_hamiltoniano
-
-
-def ler_grafo_visualizacao():
-    """
-    Lê o grafo do stdin, bem parecido com ler_grafo() do main.py,
-    mas aqui eu também retorno:
-    - tipo ('D' ou 'U')
-    - lista de arestas brutas (u,v) pra jogar no NetworkX depois
-    """
-
-    import sys
-    data = sys.stdin.read().strip().split()
-    if not data:
-        raise ValueError("Entrada vazia. Informe o grafo via stdin.")
-
-    tipo = data[0].upper()
-    if tipo not in ("D", "U"):
-        raise ValueError("Tipo inválido. Use 'D' (direcionado) ou 'U' (não direcionado).")
-
-    if len(data) < 3:
-        raise ValueError("Entrada incompleta. Esperado: tipo, n, m.")
-
-    n = int(data[1])
-    m = int(data[2])
-
-    if n <= 0:
-        raise ValueError("Número de vértices precisa ser > 0.")
-    if m < 0:
-        raise ValueError("Número de arestas não pode ser negativo.")
-
-    if len(data) != 3 + 2 * m:
-        raise ValueError(
-            f"Quantidade de valores não bate com m={m}. "
-            f"Esperado {3 + 2*m} tokens e recebi {len(data)}."
-        )
-
-    # monta adjacência pro algoritmo
-    adj = [[] for _ in range(n)]
-    arestas: List[Tuple[int, int]] = []
-
-    idx = 3
-    for _ in range(m):
-        u = int(data[idx])
-        v = int(data[idx + 1])
-        idx += 2
-
-        if u < 0 or u >= n or v < 0 or v >= n:
-            raise ValueError(f"Aresta fora do intervalo de vértices: {u} {v}")
-
-        # guarda aresta crua
-        arestas.append((u, v))
-
-        # preenche lista de adjacência (igual ao main.py)
-        adj[u].append(v)
-        if tipo == "U" and u != v:
-            adj[v].append(u)
-
-    return tipo, n, adj, arestas
+from grafo_csr import carregar_grafo
+from main import resolver
 
 
 def construir_grafo_networkx(tipo: str, n: int, arestas: List[Tuple[int, int]]):
@@ -153,11 +97,14 @@ def desenhar_grafo(G: nx.Graph, caminho: List[int] | None, output_path: str = "a
 
 
 def main():
-    # 1. Ler grafo da stdin
-    tipo, n, adj, arestas = ler_grafo_visualizacao()
+    # 1. Ler grafo da stdin (mesmo leitor do main.py)
+    try:
+        grafo = carregar_grafo()
+    except ValueError as e:
+        sys.exit(f"ENTRADA INVALIDA: {e}")
 
-    # 2. Achar caminho Hamiltoniano usando a função do main.py
-    caminho = encontrar_caminho_hamiltoniano(adj, n)
+    # 2. Achar caminho Hamiltoniano usando o main.py (motor escolhido pelo modo auto)
+    caminho = resolver(grafo, grafo.n)
 
     if caminho is not None:
         print("CAMINHO HAMILTONIANO ENCONTRADO:")
@@ -166,7 +113,7 @@ def main():
         print("NAO EXISTE CAMINHO HAMILTONIANO")
 
     # 3. Montar grafo NetworkX + desenhar e salvar PNG
-    G = construir_grafo_networkx(tipo, n, arestas)
+    G = construir_grafo_networkx(grafo.tipo, grafo.n, list(grafo.arestas()))
     desenhar_grafo(G, caminho, output_path="assets/grafo.png")
 
 